@@ -15,6 +15,31 @@ from natug.utils import hex_to_rgb
 logger = logging.getLogger(__name__)
 
 
+def _identifier(reference) -> int | str:
+    """
+    Parse a reference to a saved item.
+
+    Points, nicks, linkages, strands, and helices are referenced by their integer ids,
+    but saves from older versions reference them by uuid, and other items are always
+    referenced by uuid.
+
+    Args:
+        reference: The reference, as it was read from the save file.
+
+    Returns:
+        The id, or the uuid if the reference is not an id.
+    """
+    try:
+        return int(reference)
+    except ValueError:
+        return str(reference)
+
+
+def _row_identifier(row: pd.Series) -> int | str:
+    """Obtain the identifier of the item that a row of a save file describes."""
+    return _identifier(row["id"] if "id" in row.index else row["uuid"])
+
+
 class FileHandler:
     def __init__(self, runner: "Runner"):
         self.runner = runner
@@ -135,7 +160,10 @@ class FileHandler:
             clear_nucleic_acid_profiles: Whether to clear the nucleic acid profiles from
                  the respective panel.
         """
-        items_by_uuid = {}
+        # Items are keyed by their id in the file (or by uuid, see _identifier). The
+        # loaded items are given new ids, so that they never clash with the ids of
+        # items that already exist
+        items_by_id = {}
         nucleic_acid_profiles: Dict[str, structures.NucleicAcidProfile] = {}
         domains: Domains
         double_helices: structures.helices.DoubleHelices
@@ -164,7 +192,7 @@ class FileHandler:
                     nucleic_acid_profiles[nucleic_acid_profile.name] = (
                         nucleic_acid_profile
                     )
-                    items_by_uuid[row["uuid"]] = nucleic_acid_profile
+                    items_by_id[row["uuid"]] = nucleic_acid_profile
 
             nucleic_acid_profile = nucleic_acid_profiles["Restored"]
 
@@ -173,7 +201,7 @@ class FileHandler:
                     pd.read_csv(file), nucleic_acid_profile
                 )
                 for domain in domains.domains():
-                    items_by_uuid[domain.uuid] = domain
+                    items_by_id[domain.uuid] = domain
 
             def row_to_point_styles(row: pd.Series) -> PointStyles:
                 """
@@ -204,7 +232,6 @@ class FileHandler:
                 for index, row in df.iterrows():
                     base = row["nucleoside:base"]
                     nucleoside = structures.points.nucleoside.Nucleoside(
-                        uuid=row["uuid"],
                         x_coord=row["data:x_coord"],
                         z_coord=row["data:z_coord"],
                         angle=row["data:angle"],
@@ -213,7 +240,7 @@ class FileHandler:
                         base=base if isinstance(base, str) else None,
                         styles=row_to_point_styles(row),
                     )
-                    items_by_uuid[row["uuid"]] = nucleoside
+                    items_by_id[_row_identifier(row)] = nucleoside
 
             # Load all individual NEMids
             with package.open("points/NEMids.csv") as file:
@@ -232,7 +259,6 @@ class FileHandler:
 
                     # Create the NEMid object from the dataframe row
                     NEMid_ = structures.points.nemid.NEMid(
-                        uuid=row["uuid"],
                         x_coord=row["data:x_coord"],
                         z_coord=row["data:z_coord"],
                         direction=row["data:direction"],
@@ -244,12 +270,12 @@ class FileHandler:
                         styles=row_to_point_styles(row),
                     )
                     NEMids[index] = NEMid_
-                    items_by_uuid[NEMid_.uuid] = NEMid_
+                    items_by_id[_row_identifier(row)] = NEMid_
 
-                # Now change the juncmate uuids to actual NEMid objects
+                # Now change the juncmate ids to actual NEMid objects
                 for NEMid_ in NEMids:
                     if NEMid_.juncmate is not None:
-                        NEMid_.juncmate = items_by_uuid[NEMid_.juncmate]
+                        NEMid_.juncmate = items_by_id[_identifier(NEMid_.juncmate)]
 
             # Load nick objects
             with package.open("points/nicks.csv") as file:
@@ -257,10 +283,11 @@ class FileHandler:
                 nicks = []
                 for index, row in df.iterrows():
                     nick = structures.points.nick.Nick(
-                        uuid=row["uuid"],
-                        original_item=items_by_uuid[row["data:original_item"]],
+                        original_item=items_by_id[
+                            _identifier(row["data:original_item"])
+                        ],
                     )
-                    items_by_uuid[row["uuid"]] = nick
+                    items_by_id[_row_identifier(row)] = nick
                     nicks.append(nick)
 
             # Load the Linkage objects
@@ -287,7 +314,6 @@ class FileHandler:
                     linkage = structures.strands.linkage.Linkage(
                         coord_one=coord_one,
                         coord_two=coord_two,
-                        uuid=row["uuid"],
                         items=items,
                         inflection=row["data:inflection"],
                         styles=styles,
@@ -295,7 +321,7 @@ class FileHandler:
                     linkage.styles.linkage = linkage
                     linkage.styles.reset()
 
-                    items_by_uuid[row["uuid"]] = linkage
+                    items_by_id[_row_identifier(row)] = linkage
 
             # Load each individual Strands
             with package.open("strands/strands.csv") as file:
@@ -303,7 +329,8 @@ class FileHandler:
 
                 for index, row in df.iterrows():
                     items = [
-                        items_by_uuid[uuid] for uuid in row["data:items"].split("; ")
+                        items_by_id[_identifier(reference)]
+                        for reference in row["data:items"].split("; ")
                     ]
 
                     styles = structures.strands.strand.StrandStyles()
@@ -314,14 +341,13 @@ class FileHandler:
                     styles.highlighted = row["style:highlighted"]
 
                     strand = structures.strands.strand.Strand(
-                        uuid=row["uuid"],
                         items=items,
                         name=row["name"],
                         styles=styles,
                         closed=row["data:closed"],
                     )
                     strand.styles.strand = strand
-                    items_by_uuid[row["uuid"]] = strand
+                    items_by_id[_row_identifier(row)] = strand
 
             # Load the Strands container
             with package.open("strands/strands.json") as file:
@@ -330,7 +356,10 @@ class FileHandler:
                     name=loaded["name"],
                     uuid=loaded["uuid"],
                     nucleic_acid_profile=nucleic_acid_profile,
-                    strands=[items_by_uuid[uuid] for uuid in loaded["data:strands"]],
+                    strands=[
+                        items_by_id[_identifier(reference)]
+                        for reference in loaded["data:strands"]
+                    ],
                 )
                 strands.nicks = nicks
 
@@ -345,7 +374,6 @@ class FileHandler:
                 df = pd.read_csv(file)
                 for index, row in df.iterrows():
                     helix = structures.helices.Helix(
-                        uuid=row["uuid"],
                         double_helix=row["data:double_helix"],  # Placeholder UUID
                         direction=UP if row["data:direction"] == "UP" else DOWN,
                     )
@@ -361,7 +389,7 @@ class FileHandler:
                     helix.data.points = np.array(
                         tuple(
                             map(
-                                lambda point: items_by_uuid[point],
+                                lambda point: items_by_id[_identifier(point)],
                                 row["data:points"].split(";"),
                             )
                         ),
@@ -379,7 +407,8 @@ class FileHandler:
                             point.helical_index = i
                     assert isinstance(helix.data.x_coords[0], float)
                     assert len(helix.data.x_coords) > 0
-                    items_by_uuid[row["uuid"]] = helix
+                    helix.data.compact()
+                    items_by_id[_row_identifier(row)] = helix
 
             # Load the double helix objects
             with package.open("helices/double_helices.csv") as file:
@@ -388,8 +417,8 @@ class FileHandler:
                     double_helix = structures.helices.double_helix.DoubleHelix(
                         uuid=row["uuid"],
                         domain=domains.domains()[row["data:domain"]],
-                        up_helix=items_by_uuid[row["data:up_helix"]],
-                        down_helix=items_by_uuid[row["data:down_helix"]],
+                        up_helix=items_by_id[_identifier(row["data:up_helix"])],
+                        down_helix=items_by_id[_identifier(row["data:down_helix"])],
                         # Resizing the helices makes them the correct GenerationCount
                         # size. However, it also wipes all the current data in the
                         # helices. Since they should be the right size, we can skip
@@ -402,7 +431,7 @@ class FileHandler:
                     # )
                     double_helix.up_helix.double_helix = double_helix
                     double_helix.down_helix.double_helix = double_helix
-                    items_by_uuid[row["uuid"]] = double_helix
+                    items_by_id[row["uuid"]] = double_helix
 
             # Load the overall DoubleHelices container for all the DoubleHelixes that
             # contain Helix objects
@@ -410,14 +439,18 @@ class FileHandler:
                 loaded = json.load(file)
                 listed_double_helices = []
                 for uuid in loaded["items"]:
-                    listed_double_helices.append(items_by_uuid[uuid])
+                    listed_double_helices.append(items_by_id[uuid])
 
                 double_helices = structures.helices.DoubleHelices(
                     uuid=loaded["uuid"],
                     nucleic_acid_profile=nucleic_acid_profile,
                     double_helices=listed_double_helices,
                 )
-                items_by_uuid[loaded["uuid"]] = double_helices
+                double_helices.build_pairs()
+                double_helices.index_lattice()
+                double_helices.index_junctions()
+                strands.double_helices = double_helices
+                items_by_id[loaded["uuid"]] = double_helices
 
             # Update the currently displayed nucleic acid profile and the possible
             # nucleic acid profiles to those found in the file
@@ -3,6 +3,7 @@ from contextlib import suppress
 
 from natug.runner.managers.manager import Manager
 from natug.structures.helices import DoubleHelices
+from natug.structures.helices.double_helices import geometry_key
 
 logger = logging.getLogger(__name__)
 
@@ -14,13 +15,22 @@ class DoubleHelicesManager(Manager):
     Attributes:
         current: The current double helices.
         runner: NATuG's current runner.
+        prepared: Double helices that were computed ahead of time (for example, while
+            previewing domain changes), and the geometry key of the domains and
+            nucleic acid profile that they were computed from. None if there are
+            none.
 
     Methods:
         restore: Load in a default DoubleHelices instance based on the domains or their
             restored file.
         recompute: Recompute and update the manager's current double helices.
+        prepare: Offer double helices that were computed ahead of time.
+        swap: Replace the current double helices with ones that were computed
+            elsewhere.
     """
 
+    prepared = None
+
     def restore(self):
         """
         Setup the double helices manager from a blank program state.
@@ -47,16 +57,26 @@ class DoubleHelicesManager(Manager):
         in-place.
 
         Notes:
-            This is a very expensive operation.
+            This is a very expensive operation, unless double helices for the current
+            domains were prepared ahead of time, in which case they are used instead.
         """
-        # Remove the current action repetition settings.
-        with suppress(AttributeError):
-            self.runner.window.toolbar.repeat.setChecked(False)
-            self.runner.window.toolbar.repeat.clicked.emit()
+        domains = self.runner.managers.domains.current
+        nucleic_acid_profile = self.runner.managers.nucleic_acid_profile.current
+
+        # Use the prepared double helices if they were computed from domains that
+        # are the same shape as the current ones.
+        prepared, self.prepared = self.prepared, None
+        if prepared is not None and prepared[0] == geometry_key(
+            domains, nucleic_acid_profile
+        ):
+            logger.info("Using prepared double helices.")
+            return self.swap(prepared[1])
+
+        self._clear_repeat()
         # Regenerate the double helices based off of the current domains.
         self.current = DoubleHelices.from_domains(
-            domains=self.runner.managers.domains.current,
-            nucleic_acid_profile=self.runner.managers.nucleic_acid_profile.current,
+            domains=domains,
+            nucleic_acid_profile=nucleic_acid_profile,
         )
         # Compute the points based off of the newly computed double helices.
         # (.from_domains()
@@ -64,3 +84,50 @@ class DoubleHelicesManager(Manager):
         # Log that the double helices have been computed.
         logger.info("Recomputed double helices.")
         return self.current
+
+    def swap(self, double_helices: DoubleHelices) -> DoubleHelices:
+        """
+        Replace the current double helices with ones that were computed elsewhere.
+
+        The double helices must have been computed from domains with the same
+        geometry key as the current domains, such as a snapshot of them. They still
+        belong to the domains and nucleic acid profile that they were computed from,
+        so they (and any points generated from them) are moved over to the current
+        ones first.
+
+        Args:
+            double_helices: The computed double helices.
+
+        Returns:
+            The new current double helices.
+        """
+        self._clear_repeat()
+        double_helices.domains = self.runner.managers.domains.current
+        double_helices.nucleic_acid_profile = (
+            self.runner.managers.nucleic_acid_profile.current
+        )
+        self.current = double_helices
+        logger.info("Swapped in new double helices.")
+        return self.current
+
+    def _clear_repeat(self) -> None:
+        """Remove the current action repetition settings."""
+        with suppress(AttributeError):
+            self.runner.window.toolbar.repeat.setChecked(False)
+            self.runner.window.toolbar.repeat.clicked.emit()
+
+    def prepare(self, key: tuple, double_helices: DoubleHelices) -> None:
+        """
+        Offer double helices that were computed ahead of time.
+
+        The next recompute() uses them instead of computing new double helices, if
+        the current domains and nucleic acid profile still have the same geometry
+        key. Only the most recently prepared double helices are kept.
+
+        Args:
+            key: The geometry key of the domains and nucleic acid profile that the
+                double helices were computed from.
+            double_helices: The computed double helices.
+        """
+        self.prepared = (key, double_helices)
+        logger.debug("Prepared double helices for the next recompute.")
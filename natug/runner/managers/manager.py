@@ -1,3 +1,6 @@
+from natug.structures.events import REPLACED
+
+
 class Manager:
     """
     A template manager.
@@ -37,6 +40,10 @@ class Manager:
         Args:
             value: The new managee instance. Must be of the same type of the manage
                 that was set at init.
+
+        Notes:
+            If the managee has an event bus then the new managee takes over the
+            listeners of the old one, and a REPLACED event is emitted.
         """
         if self._manager_type is None and value is not None:
             self._manager_type = type(value)
@@ -45,4 +52,12 @@ class Manager:
                 f"Cannot set {self.__class__}.current to type other than "
                 f"{self._manager_type}. Got {type(value)}."
             )
-        self._current = value
+        previous, self._current = self._current, value
+        if (
+            previous is not None
+            and previous is not value
+            and hasattr(previous, "events")
+            and hasattr(value, "events")
+        ):
+            value.events.adopt(previous.events)
+            value.events.emit(REPLACED, value)
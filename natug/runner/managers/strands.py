@@ -1,6 +1,7 @@
 import logging
 
 from natug.runner.managers.manager import Manager
+from natug.structures.helices import DoubleHelices
 from natug.structures.strands.strands import Strands
 
 logger = logging.getLogger(__name__)
@@ -16,6 +17,7 @@ class StrandsManager(Manager):
 
     Methods:
         recompute: Recompute the strands from the current doule helices.
+        swap: Replace the current strands with ones that were computed elsewhere.
     """
 
     def recompute(self) -> Strands:
@@ -37,3 +39,31 @@ class StrandsManager(Manager):
         # Log that the strands have been recomputed and return the new strands.
         logger.info("Recomputed strands.")
         return self.current
+
+    def swap(self, double_helices: DoubleHelices, strands: Strands) -> Strands:
+        """
+        Replace the current double helices and strands with ones that were computed
+        elsewhere.
+
+        This is used to adopt the results of a background recompute. Everything is
+        replaced at once on the calling thread, so the program never sees new double
+        helices with old strands.
+
+        Args:
+            double_helices: The computed double helices. They must have been computed
+                from domains with the same geometry key as the current domains.
+            strands: The strands generated from the double helices.
+
+        Returns:
+            The new current strands.
+        """
+        # Clear all currently selected points since all the points are about to change.
+        self.runner.managers.misc.currently_selected.clear()
+        self.runner.managers.double_helices.swap(double_helices)
+        # The strands may have been computed with a copy of the nucleic acid profile.
+        strands.nucleic_acid_profile = double_helices.nucleic_acid_profile
+        for strand in strands:
+            strand.nucleic_acid_profile = double_helices.nucleic_acid_profile
+        self.current = strands
+        logger.info("Swapped in new strands.")
+        return self.current
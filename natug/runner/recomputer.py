@@ -0,0 +1,234 @@
+import logging
+from dataclasses import replace
+from functools import partial
+from typing import TYPE_CHECKING
+
+from PyQt6.QtCore import QObject, QThread, pyqtSignal, pyqtSlot
+
+from natug.structures.domains import Domains
+from natug.structures.helices import DoubleHelices
+from natug.structures.helices.double_helices import geometry_key
+from natug.structures.profiles import NucleicAcidProfile
+from natug.utils import Timer
+
+if TYPE_CHECKING:
+    from natug import runner
+
+logger = logging.getLogger(__name__)
+
+# The stages of a recompute, in the order that they run
+STAGES = ("compute", "points", "junctability", "style")
+
+
+class RecomputeWorker(QThread):
+    """
+    A thread that builds new double helices and strands from a snapshot of domains.
+
+    The domains and nucleic acid profile that the worker is given must not be
+    modified while it runs, so they should be snapshots of the current ones.
+
+    Attributes:
+        domains: The domains to compute from.
+        nucleic_acid_profile: The nucleic acid profile to compute with.
+        double_helices: Double helices that were already computed from domains with
+            the same geometry key, in which case the compute stage is skipped. None
+            if there are none.
+        build_strands: Whether to build strands, or only compute the double helices.
+
+    Signals:
+        progressed: Emitted with the name of each stage as it begins. The stages are
+            listed in STAGES.
+        computed: Emitted with the double helices and the strands (None if strands
+            were not built) once they are ready. Not emitted if the worker was
+            cancelled or failed.
+        failed: Emitted with the error message if computing raised an exception.
+
+    Methods:
+        cancel: Ask the worker to stop at the next opportunity.
+        cancelled: Whether the worker was cancelled.
+    """
+
+    progressed = pyqtSignal(str)
+    computed = pyqtSignal(object, object)
+    failed = pyqtSignal(str)
+
+    def __init__(
+        self,
+        domains: Domains,
+        nucleic_acid_profile: NucleicAcidProfile,
+        double_helices: DoubleHelices | None = None,
+        build_strands: bool = True,
+        parent: QObject | None = None,
+    ) -> None:
+        """
+        Initialize a worker. It does nothing until start() is called.
+
+        Args:
+            domains: The domains to compute from.
+            nucleic_acid_profile: The nucleic acid profile to compute with.
+            double_helices: Double helices that were already computed from domains
+                with the same geometry key. Defaults to None.
+            build_strands: Whether to build strands. Defaults to True.
+            parent: The parent QObject. Defaults to None.
+        """
+        super().__init__(parent)
+        self.domains = domains
+        self.nucleic_acid_profile = nucleic_acid_profile
+        self.double_helices = double_helices
+        self.build_strands = build_strands
+        self._cancelled = False
+
+    def cancel(self) -> None:
+        """Ask the worker to stop at the next opportunity."""
+        self._cancelled = True
+
+    def cancelled(self) -> bool:
+        """Whether the worker was cancelled."""
+        return self._cancelled
+
+    def run(self) -> None:
+        """Compute the double helices and strands. Run on the worker's thread."""
+        try:
+            with Timer("Background recompute", logger=logger):
+                double_helices = self.double_helices
+                self.progressed.emit("compute")
+                if double_helices is None:
+                    double_helices = DoubleHelices.from_domains(
+                        self.domains, self.nucleic_acid_profile
+                    )
+                    if not double_helices.compute(self.cancelled):
+                        return
+
+                strands = None
+                if self.build_strands:
+                    strands = double_helices.strands(
+                        self.cancelled, self.progressed.emit
+                    )
+                    if strands is None:
+                        return
+
+                if not self.cancelled():
+                    self.computed.emit(double_helices, strands)
+        except Exception as error:
+            logger.exception("Background recompute failed.")
+            self.failed.emit(str(error))
+
+
+class Recomputer(QObject):
+    """
+    Recomputes the double helices and strands in the background.
+
+    Each recompute works from a snapshot of the current domains and nucleic acid
+    profile, so the main thread is free to carry on while it runs. Starting a new
+    recompute cancels the running one. When a recompute finishes, its double helices
+    and strands are swapped into the managers together, as long as the domains have
+    not changed shape since the recompute started.
+
+    Attributes:
+        runner: NATuG's runner.
+
+    Signals:
+        progressed: Emitted with the name of each stage as it begins, its number
+            (starting from 1), and the number of stages.
+        recomputed: Emitted once new double helices and strands have been swapped
+            into the managers.
+        failed: Emitted with the error message if the running recompute failed.
+
+    Methods:
+        start: Start recomputing, cancelling the running recompute.
+        cancel: Cancel the running recompute.
+        running: Whether a recompute is running.
+    """
+
+    progressed = pyqtSignal(str, int, int)
+    recomputed = pyqtSignal()
+    failed = pyqtSignal(str)
+
+    def __init__(self, runner: "runner.Runner", parent: QObject | None = None):
+        """
+        Initialize the recomputer.
+
+        Args:
+            runner: NATuG's runner.
+            parent: The parent QObject. Defaults to None.
+        """
+        super().__init__(parent)
+        self.runner = runner
+        self._worker: RecomputeWorker | None = None
+
+    def start(self) -> None:
+        """
+        Start recomputing the double helices and strands from the current domains.
+
+        Double helices that were prepared for the current domains (for example,
+        while previewing them) are used instead of computing new ones.
+        """
+        self.cancel()
+
+        # Snapshot the current state, since it may be edited while the worker runs
+        nucleic_acid_profile = replace(
+            self.runner.managers.nucleic_acid_profile.current
+        )
+        domains = self.runner.managers.domains.current.snapshot(nucleic_acid_profile)
+        key = geometry_key(domains, nucleic_acid_profile)
+
+        prepared = self.runner.managers.double_helices.prepared
+        if prepared is not None and prepared[0] == key:
+            self.runner.managers.double_helices.prepared = None
+            prepared = prepared[1]
+        else:
+            prepared = None
+
+        self._worker = worker = RecomputeWorker(
+            domains, nucleic_acid_profile, prepared, parent=self
+        )
+        worker.progressed.connect(self._on_progressed)
+        worker.computed.connect(partial(self._on_computed, worker, key))
+        worker.failed.connect(partial(self._on_failed, worker))
+        worker.finished.connect(partial(self._on_finished, worker))
+        worker.finished.connect(worker.deleteLater)
+        worker.start()
+        logger.debug("Started a background recompute.")
+
+    def cancel(self) -> None:
+        """Cancel the running recompute. Nothing happens if none is running."""
+        if self._worker is not None:
+            self._worker.cancel()
+            self._worker = None
+            logger.debug("Cancelled a background recompute.")
+
+    def running(self) -> bool:
+        """Whether a recompute is running."""
+        return self._worker is not None
+
+    @pyqtSlot(str)
+    def _on_progressed(self, stage: str) -> None:
+        if self.sender() is self._worker:
+            self.progressed.emit(stage, STAGES.index(stage) + 1, len(STAGES))
+
+    def _on_finished(self, worker) -> None:
+        """Forget a worker that stopped without computing anything."""
+        if worker is self._worker:
+            self._worker = None
+
+    def _on_failed(self, worker, message: str) -> None:
+        """Forget a worker that failed, and pass on its error."""
+        if worker is not self._worker:
+            return
+        self._worker = None
+        self.failed.emit(message)
+
+    def _on_computed(self, worker, key, double_helices, strands) -> None:
+        """Swap the results of a worker into the managers, unless they are stale."""
+        if worker is not self._worker:
+            return
+        self._worker = None
+        current_key = geometry_key(
+            self.runner.managers.domains.current,
+            self.runner.managers.nucleic_acid_profile.current,
+        )
+        if current_key != key:
+            logger.info("Discarded a stale background recompute.")
+            return
+        self.runner.managers.strands.swap(double_helices, strands)
+        self.recomputed.emit()
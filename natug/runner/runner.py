@@ -9,7 +9,7 @@ import pyqtgraph as pg
 from PyQt6.QtGui import QAction, QKeySequence
 from PyQt6.QtWidgets import QFileDialog
 
-from natug import settings, ui
+from natug import settings, ui, utils
 
 logger = logging.getLogger(__name__)
 
@@ -65,9 +65,20 @@ class Runner:
         filehandler (logging.FileHandler): The file handler for the logger. This
             is used to save and load the program state at the request of the user.
         booted (bool): Whether the program has been booted.
+        snapshot_versions (tuple): The versions of the nucleic acid profile, domains
+            and strands when the last snapshot was taken or loaded.
+        history_base (Snapshot): The snapshot of the state that the current strands'
+            undo history begins at. Undoing past the start of the history loads the
+            snapshot before this one.
+        recomputer (Recomputer): Recomputes the double helices and strands in the
+            background when the domains or nucleic acid profile are edited.
 
     Methods:
         recompute: Recompute the top and side view, and then refresh the plots.
+        versions: Obtain the versions of the current structures.
+        snapshot: Take a snapshot, if anything changed since the last one.
+        undo: Undo the most recent strand edit, or load the previous snapshot.
+        redo: Redo the most recently undone strand edit, or load the next snapshot.
     """
 
     restored_filepath = f"saves/restored.{settings.extension}"
@@ -80,6 +91,9 @@ class Runner:
         self.managers = None
         self.filehandler = None
         self.booted = False
+        self.snapshot_versions = None
+        self.history_base = None
+        self.recomputer = None
 
         atexit.register(self.exit)
 
@@ -127,6 +141,12 @@ class Runner:
         self.managers = Managers(self)
         logger.debug("Managers created.")
 
+        # Create the background recomputer, which swaps into the managers
+        from natug.runner.recomputer import Recomputer
+
+        self.recomputer = Recomputer(self)
+        logger.debug("Recomputer created.")
+
         # Call the setup methods of the various managers. The order in which managers
         # are set up is very important, since some rely on others being already set
         # up (for example, we can't load the strands manager until the nucleic acid
@@ -231,6 +251,7 @@ class Runner:
             )[0]
         if filepath:
             self.filehandler.load(filepath, *args, **kwargs)
+            self.snapshot_versions = self.versions()
             return True
         else:
             return False
@@ -253,22 +274,116 @@ class Runner:
         logger.debug("Beginning event loop...")
         sys.exit(self.application.exec())
 
+    def versions(self) -> tuple:
+        """
+        Obtain the event bus versions of the program's current structures.
+
+        Returns:
+            The versions of the current nucleic acid profile, domains, and strands.
+            These only change when the structures do.
+        """
+        return tuple(
+            manager.current.events.version
+            for manager in (
+                self.managers.nucleic_acid_profile,
+                self.managers.domains,
+                self.managers.strands,
+            )
+        )
+
     def snapshot(self):
         """
         Take a snapshot of the current state of the program.
+
+        Nothing is done if none of the structures have changed since the last
+        snapshot. Strand edits are undone in memory by the strands' history, so when
+        only the strands changed a snapshot is only taken as a checkpoint, once every
+        settings.checkpoint_interval edits.
         """
         if self.booted:
-            self.managers.snapshots.current.take_snapshot()
+            versions = self.versions()
+            if versions == self.snapshot_versions:
+                logger.debug("Skipped snapshot, since nothing has changed.")
+                return
+
+            history = self.managers.strands.current.history
+            only_strands_changed = (
+                self.snapshot_versions is not None
+                and versions[:2] == self.snapshot_versions[:2]
+            )
+            if (
+                only_strands_changed
+                and history.can_undo()
+                and history.since_checkpoint < settings.checkpoint_interval
+            ):
+                logger.debug("Skipped snapshot, since the edit is in the history.")
+                return
+
+            snapshots = self.managers.snapshots.current
+            snapshots.take_snapshot()
+            self.snapshot_versions = versions
+            if not history.can_undo():
+                self.history_base = snapshots.current_snapshot
+            history.checkpoint()
+
+    def undo(self):
+        """
+        Undo the most recent strand edit.
+
+        If there are no strand edits to undo, the snapshot before the one that the
+        strands' history begins at is loaded instead.
+        """
+        strands = self.managers.strands.current
+        if strands.history.can_undo():
+            try:
+                strands.history.undo(strands)
+            except Exception:
+                logger.exception("Failed to undo the strand edit.")
+                utils.warning(
+                    self.window,
+                    "Could not undo",
+                    "The strand edit could not be undone, so the undo history was "
+                    "cleared. Earlier states can still be restored from snapshots.",
+                )
+        else:
+            snapshots = self.managers.snapshots.current
+            if self.history_base in snapshots.snapshots:
+                snapshots.current_snapshot = self.history_base
+            snapshots.switch_to_previous()
+            self.history_base = snapshots.current_snapshot
+
+    def redo(self):
+        """
+        Redo the most recently undone strand edit.
+
+        If there are no strand edits to redo, the next snapshot is loaded instead.
+        """
+        strands = self.managers.strands.current
+        if strands.history.can_redo():
+            try:
+                strands.history.redo(strands)
+            except Exception:
+                logger.exception("Failed to redo the strand edit.")
+                utils.warning(
+                    self.window,
+                    "Could not redo",
+                    "The strand edit could not be redone, so the undo history was "
+                    "cleared. Earlier states can still be restored from snapshots.",
+                )
+        else:
+            snapshots = self.managers.snapshots.current
+            snapshots.switch_to_next()
+            self.history_base = snapshots.current_snapshot
 
     def _setup_shortcuts(self):
         action = QAction(self.window)
         action.setShortcut(QKeySequence("Ctrl+Z"))
-        action.triggered.connect(self.managers.snapshots.current.switch_to_previous)
+        action.triggered.connect(self.undo)
         self.window.addAction(action)
 
         action = QAction(self.window)
         action.setShortcut(QKeySequence("Ctrl+Shift+Z"))
-        action.triggered.connect(self.managers.snapshots.current.switch_to_next)
+        action.triggered.connect(self.redo)
         self.window.addAction(action)
 
     def recompute(self):
@@ -6,6 +6,28 @@ debug = True
 extension = "natug"
 snapshot_path = "saves/snapshots"
 default_snapshot_max_capacity = 16
+# The number of edits that can be undone in memory, and the number of edits between
+# the snapshots that are written to disk as checkpoints
+history_capacity = 256
+checkpoint_interval = 8
+# The milliseconds to wait after the last domain edit before the helix data of a
+# previewed shape is computed in the background
+preview_delay = 300
+# The number of computed helix geometries to keep in memory, and whether to also keep
+# every computed geometry on disk (as memory-mapped .npy files) to reuse across runs
+geometry_cache_capacity = 32
+geometry_cache_on_disk = False
+geometry_cache_path = "saves/geometry"
+# The directory to memory-map the coord and angle arrays of helices that are at least
+# memmap_threshold points long to, so that designs larger than RAM can be computed.
+# If None, all helix data is kept in RAM.
+helix_scratch_path = None
+memmap_threshold = 1_000_000
+# The dtype that computed helix coords and angles, and the side view's plot buffers, are
+# stored in. "float32" halves their memory. Helix data is always computed in float64.
+# Check that a compact dtype gives the same junctions with
+# python -m natug.tools.compact_validation
+geometry_dtype = "float64"
 
 # Threshold to determine whether a tube is closed.
 closed_threshold = 0.01
@@ -153,6 +153,14 @@ class Domain:
             were normally.
     """
 
+    # attributes that, when changed, change the geometry of the domain
+    _geometric_attributes = (
+        "nucleic_acid_profile",
+        "theta_m_multiple",
+        "left_helix_joint",
+        "right_helix_joint",
+    )
+
     def __init__(
         self,
         nucleic_acid_profile: NucleicAcidProfile,
@@ -193,9 +201,6 @@ class Domain:
             uuid (str): The unique identifier for the domain. This is automatically
                 generated. Defaults to None.
         """
-        # store the strands subunit
-        self.parent = parent
-
         # store the nucleic acid settings
         self.nucleic_acid_profile = nucleic_acid_profile
 
@@ -222,6 +227,23 @@ class Domain:
         # set the uuid
         self.uuid = uuid or str(uuid1())
 
+        # store the strands subunit last, so that setting up the domain does not
+        # notify the subunit of changes to a domain that is not complete yet
+        self.parent = parent
+
+    def __setattr__(self, key, value):
+        """
+        Set an attribute of the domain.
+
+        If the attribute affects the geometry of the domain then the strands subunit
+        is marked as changed, so that cached domain lists are rebuilt and listeners
+        of the Domains are notified.
+        """
+        object.__setattr__(self, key, value)
+        parent = getattr(self, "parent", None)
+        if key in self._geometric_attributes and parent is not None:
+            parent._changed(self)
+
     def __sub__(self, other):
         """
         Subtract two domains indices.
@@ -262,6 +284,7 @@ class Domain:
     def inverted(self):
         """A domain with inverted helix joint directions."""
         output = copy(self)
+        output.parent = None
         output.left_helix_joint = inverse(self.left_helix_joint)
         output.right_helix_joint = inverse(self.right_helix_joint)
         return output
@@ -1,6 +1,4 @@
 import logging
-import math
-from contextlib import suppress
 from copy import copy
 from typing import Iterable, List
 
@@ -12,6 +10,7 @@ from natug import settings
 from natug.constants.directions import DOWN, UP
 from natug.structures.domains import Domain
 from natug.structures.domains.subunit import Subunit
+from natug.structures.events import REPLACED, EventBus
 from natug.structures.profiles import NucleicAcidProfile
 from natug.utils import timer
 
@@ -36,16 +35,21 @@ class Domains:
         count: The total number of domains. Includes domains from all subunits.
         antiparallel: Whether the domains are forced to have alternating
             upness/downness.
+        events: The event bus that DOMAIN_CHANGED and REPLACED events are emitted on.
 
     Methods:
         strands: Returns a Strands object containing all the strands in the domains.
         top_view: Obtain a set of coords for the centers of all the double helices.
+        top_views: Obtain top view coords for many candidate theta_m multiples.
+        closure_gap: The gap between the first and last domain's top view coords.
+        closure_gaps: Obtain closure gaps for many candidate theta_m multiples.
         domains: Returns a list of all domains.
         destroy_symmetry: Destroy the symmetry of the domains.
         invert: Invert two domains deeper into the nanotube.
         subunits: Returns a list of subunits.
         closed: Whether the tube is closed or not.
         update: Update the domains object in place.
+        snapshot: Obtain a detached copy of the domains.
         to_df: Export the domains to a dataframe.
         from_df: Import the domains from a dataframe.
         write_worksheet: Write the domains to a tab in an Excel document.
@@ -73,6 +77,15 @@ class Domains:
         self.symmetry = symmetry
         self.antiparallel = antiparallel
 
+        # the expanded list of domains from all subunits is cached, and only rebuilt
+        # when the template subunit, symmetry, or antiparallel setting changes
+        self._domains: List[Domain] | None = None
+        self._domains_key: tuple | None = None
+        self._version = 0
+
+        # listeners are notified of changes to the domains through the event bus
+        self.events = EventBus()
+
         # self.subunit is the template subunit
         # meaning that all other subunits are based off of this one
         assert isinstance(domains, Iterable)
@@ -114,6 +127,44 @@ class Domains:
         self.antiparallel = domains.antiparallel
         self.subunit = domains.subunit
 
+        self.events.emit(REPLACED, self)
+
+    def snapshot(
+        self, nucleic_acid_profile: NucleicAcidProfile | None = None
+    ) -> "Domains":
+        """
+        Obtain a detached copy of the domains.
+
+        The copy has brand-new domain objects and shares no mutable state with the
+        original, so it can be read from another thread while the original is edited.
+
+        Args:
+            nucleic_acid_profile: The nucleic acid profile of the copy. Defaults to
+                the original's nucleic acid profile.
+
+        Returns:
+            The copy.
+        """
+        nucleic_acid_profile = nucleic_acid_profile or self.nucleic_acid_profile
+        return Domains(
+            nucleic_acid_profile,
+            [
+                Domain(
+                    nucleic_acid_profile,
+                    domain.theta_m_multiple,
+                    domain.left_helix_joint,
+                    domain.right_helix_joint,
+                    tuple(domain.up_helix_count),
+                    tuple(domain.down_helix_count),
+                    index=domain.index,
+                    uuid=domain.uuid,
+                )
+                for domain in self.subunit
+            ],
+            self.symmetry,
+            self.antiparallel,
+        )
+
     def to_df(self, include_uuid: bool = True) -> pd.DataFrame:
         """
         Export all the current domains as a pandas dataframe.
@@ -293,6 +344,45 @@ class Domains:
         sheet.write(1, 10, self.symmetry)
         sheet.write(1, 11, self.antiparallel)
 
+    def theta_s(self) -> np.ndarray:
+        """
+        Obtain the theta switch angles of all the domains.
+
+        Returns:
+            A (count,) array of the theta_s of each domain.
+        """
+        return np.array([domain.theta_s for domain in self.domains()], dtype=float)
+
+    def theta_i(self, theta_m_multiples: np.ndarray | None = None) -> np.ndarray:
+        """
+        Obtain the interior angles of all the domains.
+
+        Args:
+            theta_m_multiples: Candidate theta_m multiples to use in place of the
+                domains' own. This may be a (count,) array or a (N, count) batch of
+                candidates. A (subunit count,) or (N, subunit count) array is repeated
+                for each subunit. If None, the current theta_m multiples are used.
+
+        Returns:
+            A (count,) or (N, count) array of interior angles, matching the shape of
+                theta_m_multiples. The theta switch angles of the current domains are
+                used for every candidate.
+        """
+        if theta_m_multiples is None:
+            theta_m_multiples = [domain.theta_m_multiple for domain in self.domains()]
+        theta_m_multiples = np.asarray(theta_m_multiples)
+
+        if theta_m_multiples.shape[-1] != self.count:
+            if theta_m_multiples.shape[-1] * self.symmetry != self.count:
+                raise ValueError(
+                    "Expected one theta_m multiple per domain or per subunit domain",
+                    theta_m_multiples.shape,
+                )
+            reps = (1,) * (theta_m_multiples.ndim - 1) + (self.symmetry,)
+            theta_m_multiples = np.tile(theta_m_multiples, reps)
+
+        return theta_m_multiples * self.nucleic_acid_profile.theta_c + self.theta_s()
+
     @timer(logger=logger, task_name="Domains top view computation")
     def top_view(self) -> np.ndarray:
         """
@@ -305,31 +395,49 @@ class Domains:
                 coordinate is prepended to the array to represent the origin entry
                 direction.
         """
-        domains = self.domains()
-        coords = np.zeros((self.count + 2, 2))
-        diameter = self.nucleic_acid_profile.D
+        return top_views(self.theta_i()[np.newaxis], self.nucleic_acid_profile.D)[0]
 
-        coords[0] = (
-            -diameter * math.cos(math.radians(180 + domains[0].theta_i)),
-            -diameter * math.sin(math.radians(180 + domains[0].theta_i)),
-        )
-        # coords[1] = (0, 0) (this is the default)
-        coords[2] = (diameter, 0)
-        absolute_angle = 180 - domains[1].theta_i
-
-        for index in range(3, self.count + 2):
-            coords[index] = (
-                coords[index - 1][0]
-                + diameter * math.cos(math.radians(absolute_angle)),
-                coords[index - 1][1]
-                + diameter * math.sin(math.radians(absolute_angle)),
-            )
-            with suppress(IndexError):
-                absolute_angle += 180 - domains[index - 1].theta_i
+    def top_views(self, theta_m_multiples: np.ndarray) -> np.ndarray:
+        """
+        Compute the top view of many candidate theta_m multiple vectors at once.
 
-        return coords
+        Args:
+            theta_m_multiples: A (N, count) or (N, subunit count) array of candidate
+                theta_m multiples. See Domains.theta_i.
 
-    def closed(self):
+        Returns:
+            A (N, count + 2, 2) array of top view coordinates. Each row is laid out
+                like the output of Domains.top_view.
+        """
+        theta_i = self.theta_i(np.atleast_2d(theta_m_multiples))
+        return top_views(theta_i, self.nucleic_acid_profile.D)
+
+    def closure_gap(self) -> float:
+        """
+        Obtain the distance between the first and last domain's top view coords.
+
+        Returns:
+            The size of the gap left in the tube. This is zero for a closed tube.
+        """
+        theta_i = self.theta_i()[np.newaxis]
+        return float(closure_gaps(theta_i, self.nucleic_acid_profile.D)[0])
+
+    def closure_gaps(self, theta_m_multiples: np.ndarray) -> np.ndarray:
+        """
+        Compute the closure gap of many candidate theta_m multiple vectors at once.
+
+        Args:
+            theta_m_multiples: A (N, count) or (N, subunit count) array of candidate
+                theta_m multiples. See Domains.theta_i.
+
+        Returns:
+            A (N,) array of closure gaps. Compare them against
+                settings.closed_threshold to find the candidates that close.
+        """
+        theta_i = self.theta_i(np.atleast_2d(theta_m_multiples))
+        return closure_gaps(theta_i, self.nucleic_acid_profile.D)
+
+    def closed(self) -> bool:
         """
         Whether the Domains object is closed.
 
@@ -341,8 +449,7 @@ class Domains:
         errors. This just means that there is a small tolerance for a gap between the
         first and last domain's top view coord.
         """
-        coords = self.top_view()
-        return math.dist(coords[0], coords[-2]) < settings.closed_threshold
+        return self.closure_gap() < settings.closed_threshold
 
     @property
     def subunit(self) -> Subunit:
@@ -410,26 +517,59 @@ class Domains:
 
         return output
 
+    @property
+    def version(self) -> int:
+        """
+        The version of the expanded domain list.
+
+        This is incremented every time that the list returned by .domains() is
+        rebuilt, so it can be used to tell whether previously fetched domains are
+        stale.
+        """
+        self.domains()
+        return self._version
+
+    def _domains_cache_key(self) -> tuple:
+        """The state that the expanded domain list depends on."""
+        return (
+            self._subunit,
+            self._subunit.version,
+            self.symmetry,
+            self.antiparallel,
+        )
+
     def domains(self) -> List["Domain"]:
         """
         Obtain a list of all domains from all subunits.
 
         Returns:
             A list of all domains from all subunits.
+
+        Notes:
+            The list is cached, and the same list (with the same domain objects) is
+            returned until the template subunit, symmetry or antiparallel setting
+            changes. Do not mutate the returned list.
         """
+        key = self._domains_cache_key()
+        if self._domains is not None and self._domains_key == key:
+            return self._domains
+
         # If the structure is nonsymmetrical then self.subunit.domains := self.domains()
         if self.symmetry == 1:
-            return self.subunit.domains
-
-        # Get all the domains from all the subunits
-        output = []
-        for subunit in self.subunits():
-            output.extend(subunit.domains.copy())
-
-        # Set the proper indexes for all the domains
-        for index, domain in enumerate(output):
-            output[index].index = index
-
+            output = self.subunit.domains
+        else:
+            # Get all the domains from all the subunits
+            output = []
+            for subunit in self.subunits():
+                output.extend(subunit.domains.copy())
+
+            # Set the proper indexes for all the domains
+            for index, domain in enumerate(output):
+                output[index].index = index
+
+        self._domains = output
+        self._domains_key = key
+        self._version += 1
         return output
 
     def destroy_symmetry(self) -> None:
@@ -440,7 +580,7 @@ class Domains:
         if self.symmetry != 1:
             self.subunit = Subunit(
                 self.nucleic_acid_profile,
-                self.domains(),
+                list(self.domains()),
                 template=True,
                 parent=self,
             )
@@ -501,3 +641,70 @@ class Domains:
         Returns the template subunit, symmetry, and antiparallel status.
         """
         return f"Domains(subunit={self.subunit}, symmetry={self.symmetry}, antiparallel={self.antiparallel})"
+
+
+def _headings(theta_i: np.ndarray) -> np.ndarray:
+    """
+    Obtain the heading of each step of the top view walk, in radians.
+
+    The first step goes from the origin along the u axis, and every step after that
+    turns by the exterior angle (180 - theta_i) of the domain that it leaves.
+
+    Args:
+        theta_i: A (N, count) array of interior angles.
+
+    Returns:
+        A (N, count) array of headings.
+    """
+    headings = np.zeros(theta_i.shape)
+    np.cumsum(180 - theta_i[:, 1:], axis=1, out=headings[:, 1:])
+    return np.radians(headings)
+
+
+def top_views(theta_i: np.ndarray, diameter: float) -> np.ndarray:
+    """
+    Compute top view coordinates for a batch of domain interior angle vectors.
+
+    Args:
+        theta_i: A (N, count) array of interior angles, one row per candidate.
+        diameter: The diameter of the helices (the top view step length).
+
+    Returns:
+        A (N, count + 2, 2) array of (u, v) coordinates. See Domains.top_view.
+    """
+    theta_i = np.asarray(theta_i, dtype=float)
+    count = theta_i.shape[1]
+    headings = _headings(theta_i)
+
+    coords = np.zeros((theta_i.shape[0], count + 2, 2))
+    first = np.radians(theta_i[:, 0])
+    coords[:, 0, 0] = diameter * np.cos(first)
+    coords[:, 0, 1] = diameter * np.sin(first)
+    # coords[:, 1] = (0, 0) (this is the default)
+    np.cumsum(diameter * np.cos(headings), axis=1, out=coords[:, 2:, 0])
+    np.cumsum(diameter * np.sin(headings), axis=1, out=coords[:, 2:, 1])
+
+    return coords
+
+
+def closure_gaps(theta_i: np.ndarray, diameter: float) -> np.ndarray:
+    """
+    Compute the closure gap for a batch of domain interior angle vectors.
+
+    This is the distance between the first and last domain's top view coords, and
+    is computed without building the full top view.
+
+    Args:
+        theta_i: A (N, count) array of interior angles, one row per candidate.
+        diameter: The diameter of the helices (the top view step length).
+
+    Returns:
+        A (N,) array of closure gaps.
+    """
+    theta_i = np.asarray(theta_i, dtype=float)
+    headings = _headings(theta_i[:, :-1])
+    first = np.radians(theta_i[:, 0])
+
+    gap_u = np.cos(headings).sum(axis=1) - np.cos(first)
+    gap_v = np.sin(headings).sum(axis=1) - np.sin(first)
+    return diameter * np.hypot(gap_u, gap_v)
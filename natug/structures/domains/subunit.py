@@ -1,6 +1,7 @@
 from copy import copy
 from typing import Iterable, List
 
+from natug.structures.events import DOMAIN_CHANGED
 from natug.structures.profiles import NucleicAcidProfile
 from natug.utils import inverse
 
@@ -48,6 +49,7 @@ class Subunit:
             parent: The strands Domains object.
         """
         self.template = template  # must be the first property set
+        self.version = 0
         self.domains = domains
         self.parent = parent
         self.nucleic_acid_profile = nucleic_acid_profile
@@ -70,6 +72,7 @@ class Subunit:
         """
         self.domains.append(domain)
         domain.parent = self
+        self._changed()
 
     def remove(self, domain: "Domain") -> None:
         """
@@ -83,6 +86,50 @@ class Subunit:
         """
         self.domains.remove(domain)
         domain.parent = None
+        self._changed()
+
+    def _changed(self, domain: "Domain" = None) -> None:
+        """
+        Mark the subunit as changed.
+
+        This is called whenever the domains in the subunit change, so that the
+        strands Domains object knows to rebuild its cached list of domains, and so
+        that it can notify its listeners.
+
+        Args:
+            domain: The domain that changed, or None if the list of domains changed.
+        """
+        self.version += 1
+        # only the template subunit's changes are changes to the Domains
+        events = getattr(getattr(self, "parent", None), "events", None)
+        if self.template and events is not None:
+            events.emit(
+                DOMAIN_CHANGED,
+                self.parent,
+                domain=domain,
+                index=None if domain is None else domain.index,
+            )
+
+    @property
+    def domains(self) -> List["Domain"]:
+        """
+        Obtain the domains in the subunit.
+
+        Returns:
+            The domains in the subunit.
+        """
+        return self._domains
+
+    @domains.setter
+    def domains(self, new_domains: List["Domain"]) -> None:
+        """
+        Replace the domains in the subunit.
+
+        Args:
+            new_domains: The new domains for the subunit.
+        """
+        self._domains = new_domains
+        self._changed()
 
     def copy(self) -> "Subunit":
         """
@@ -168,6 +215,7 @@ class Subunit:
                     )
                 )
                 i += 1
+            self._changed()
 
     def __getitem__(self, item):
         """
@@ -0,0 +1,185 @@
+import logging
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from functools import wraps
+from typing import Callable, Dict, List, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Event kinds
+STRAND_ADDED = "strand added"
+STRAND_REMOVED = "strand removed"
+STRAND_MODIFIED = "strand modified"
+BASES_CHANGED = "bases changed"
+DOMAIN_CHANGED = "domain changed"
+PROFILE_CHANGED = "profile changed"
+REPLACED = "replaced"
+
+
+@dataclass(frozen=True, slots=True)
+class Event:
+    """
+    A change to a structure.
+
+    Attributes:
+        kind: What sort of change happened. One of the event kind constants of this
+            module.
+        source: The structure that changed.
+        version: The version of the source's event bus after the change.
+        data: Details about the change. For example, strand events carry the
+            "strand" that changed, and base events carry the "nucleosides" whose
+            bases changed.
+    """
+
+    kind: str
+    source: object
+    version: int
+    data: dict = field(default_factory=dict)
+
+
+class EventBus:
+    """
+    A versioned change notification bus for a structure.
+
+    Every emitted event increments the bus's version, so listeners (and anything
+    else that caches work derived from the structure) can skip work when the
+    version has not changed since they last looked.
+
+    Copies of a bus keep the version but not the listeners, since the listeners
+    subscribed to the original structure, not to the copy.
+
+    Attributes:
+        version: The number of events that have been emitted. Monotonic.
+
+    Methods:
+        subscribe: Call a function whenever an event is emitted.
+        unsubscribe: Stop calling a subscribed function.
+        emit: Emit an event.
+        batched: Defer dispatching events until a block of changes is complete.
+        adopt: Take over the listeners of another bus.
+    """
+
+    __slots__ = "version", "_listeners", "_depth", "_pending"
+
+    def __init__(self, version: int = 0):
+        self.version = version
+        self._listeners: Dict[Callable[[Event], None], Tuple[str, ...] | None] = {}
+        self._depth = 0
+        self._pending: List[Event] = []
+
+    def __copy__(self) -> "EventBus":
+        return EventBus(self.version)
+
+    def __deepcopy__(self, memodict={}) -> "EventBus":
+        return EventBus(self.version)
+
+    def subscribe(
+        self, listener: Callable[[Event], None], *kinds: str
+    ) -> Callable[[Event], None]:
+        """
+        Call a function whenever an event is emitted.
+
+        Args:
+            listener: The function to call with each event.
+            *kinds: The kinds of events to call the function for. If none are given
+                the function is called for all events.
+
+        Returns:
+            The listener, so that this can be used as a decorator.
+        """
+        self._listeners[listener] = kinds or None
+        return listener
+
+    def unsubscribe(self, listener: Callable[[Event], None]) -> None:
+        """
+        Stop calling a subscribed function.
+
+        Args:
+            listener: The function to stop calling. Nothing happens if it was not
+                subscribed.
+        """
+        self._listeners.pop(listener, None)
+
+    def emit(self, kind: str, source: object, **data) -> Event:
+        """
+        Emit an event.
+
+        Args:
+            kind: The kind of event.
+            source: The structure that changed.
+            **data: Details about the change.
+
+        Returns:
+            The emitted event.
+        """
+        self.version += 1
+        event = Event(kind, source, self.version, data)
+        if self._depth:
+            self._pending.append(event)
+        else:
+            self._dispatch(event)
+        return event
+
+    @contextmanager
+    def batched(self):
+        """
+        Defer dispatching events until a block of changes is complete.
+
+        Versions still increase as events are emitted, but listeners are only called
+        once the outermost batched block exits, so they never see a half-finished
+        change. If the block raises, the deferred events are dropped instead, since
+        they describe a change that was never completed.
+        """
+        self._depth += 1
+        try:
+            yield self
+        except BaseException:
+            self._depth -= 1
+            if not self._depth:
+                self._pending = []
+            raise
+        self._depth -= 1
+        if not self._depth:
+            pending, self._pending = self._pending, []
+            for event in pending:
+                self._dispatch(event)
+
+    def adopt(self, other: "EventBus") -> None:
+        """
+        Take over the listeners of another bus.
+
+        This is used when a structure is replaced by a new one, so that listeners of
+        the old structure keep receiving events. The version continues from whichever
+        bus is further along, so that it never decreases.
+
+        Args:
+            other: The bus to take the listeners of. It is left without listeners.
+        """
+        if other is self:
+            return
+        self._listeners = {**other._listeners, **self._listeners}
+        other._listeners = {}
+        self.version = max(self.version, other.version)
+
+    def _dispatch(self, event: Event) -> None:
+        for listener, kinds in tuple(self._listeners.items()):
+            if kinds is None or event.kind in kinds:
+                try:
+                    listener(event)
+                except Exception:
+                    logger.exception("Listener %s failed on %s.", listener, event)
+
+
+def batch_events(method):
+    """
+    Decorate a method so that the events it emits are dispatched when it returns.
+
+    The method's instance must have an events attribute that is an EventBus.
+    """
+
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self.events.batched():
+            return method(self, *args, **kwargs)
+
+    return wrapper
@@ -1,12 +1,14 @@
 import logging
-from typing import Iterable, Iterator
+from typing import Callable, Iterable, Iterator
 from uuid import uuid1
 
 import numpy as np
 from numpy import argmax
 
 from natug.constants.directions import DOWN
-from natug.structures.points.point import x_coord_from_angle
+from natug.structures.helices.geometry_cache import geometry_cache
+from natug.structures.helices.pairing_table import PairingTable
+from natug.structures.points.point import Point, x_coord_from_angle
 from natug.utils import Timer
 
 logger = logging.getLogger(__name__)
@@ -14,6 +16,10 @@ logger = logging.getLogger(__name__)
 
 vectorized_x_coords_from_angles = np.vectorize(x_coord_from_angle)
 
+# The attributes of a nucleic acid profile that the helix data depends on
+geometric_profile_fields = ("D", "H", "g", "T", "B", "Z_c", "Z_mate")
+
+
 def x_coords_from_angles(angles: np.ndarray, domain: "Domain") -> np.ndarray:
     """
     Compute the x coords from the angles.
@@ -27,6 +33,35 @@ def x_coords_from_angles(angles: np.ndarray, domain: "Domain") -> np.ndarray:
     return vectorized_x_coords_from_angles(angles, domain)
 
 
+def geometry_key(domains: "Domains", nucleic_acid_profile) -> tuple:
+    """
+    Obtain the state that the computed helix data of some domains depends on.
+
+    Two sets of domains with equal keys compute identical helix data, even if they
+    are different objects, so computed double helices can be reused for either.
+
+    Args:
+        domains: The domains that the helix data is computed from.
+        nucleic_acid_profile: The nucleic acid profile used for the computation.
+
+    Returns:
+        A hashable key.
+    """
+    return (
+        tuple(getattr(nucleic_acid_profile, name) for name in geometric_profile_fields),
+        tuple(
+            (
+                domain.theta_m_multiple,
+                domain.left_helix_joint,
+                domain.right_helix_joint,
+                tuple(domain.up_helix_count),
+                tuple(domain.down_helix_count),
+            )
+            for domain in domains.domains()
+        ),
+    )
+
+
 class DoubleHelices:
     """
     A container for multiple double helix objects.
@@ -40,16 +75,21 @@ class DoubleHelices:
         double_helices: A list of DoubleHelix objects.
         nucleic_acid_profile: The nucleic acid profile to use for computations.
         uuid (str): A unique identifier for the double helices. Automatically generated.
+        pairs: The PairingTable mapping every point to its matching point on the other
+            helix of its double helix. Built by .compute(), or None before then.
 
     Methods:
         domains: Obtain all the domains of all the double helices in their respective
             order.
         compute: Compute the point data for each helix. The data will be stored in the
             helices respective x coord, z coord, and angle arrays.
+        build_pairs: Build the pairing table of matching points for all the helices.
+        index_lattice: Build the lattice indices of every helix.
+        index_junctions: Rebuild the junction index of every double helix.
         to_json: Convert the double helices to a JSON serializable dictionary.
     """
 
-    __slots__ = "double_helices", "nucleic_acid_profile", "uuid", "_domains"
+    __slots__ = "double_helices", "nucleic_acid_profile", "uuid", "pairs", "_domains"
 
     def __init__(
         self,
@@ -71,6 +111,7 @@ class DoubleHelices:
         self.double_helices = double_helices
         self.nucleic_acid_profile = nucleic_acid_profile
         self.uuid = uuid or str(uuid1())
+        self.pairs: PairingTable | None = None
 
     def __len__(self) -> int:
         return len(self.double_helices)
@@ -105,14 +146,19 @@ class DoubleHelices:
         Set new domains for all the double helices.
 
         Automatically updates the domains of each of the child helices and double
-        helices.
+        helices, and of any points that were already generated from the helices.
 
         Args:
             new_domains: The new domains to use.
         """
         new_domains_listed = new_domains.domains()
         for i, double_helix in enumerate(self):
-            double_helix.domain = new_domains_listed[i]
+            double_helix.domain = domain = new_domains_listed[i]
+            for helix in double_helix.helices:
+                if helix.data.points is not None:
+                    for point in helix.data.points:
+                        if isinstance(point, Point):
+                            point.domain = domain
         self._domains = new_domains
 
     def to_json(self) -> dict:
@@ -135,7 +181,11 @@ class DoubleHelices:
             yield double_helix.up_helix
             yield double_helix.down_helix
 
-    def strands(self) -> "Strands":
+    def strands(
+        self,
+        cancelled: Callable[[], bool] | None = None,
+        progress: Callable[[str], None] | None = None,
+    ) -> "Strands | None":
         """
         Convert all the helices within the double helices within this container to
         strands, and package them within a Strands container.
@@ -143,15 +193,29 @@ class DoubleHelices:
         The .compute() method of this class must have been previously run for the
         data to be correct.
 
+        Args:
+            cancelled: A function that is checked before each double helix is
+                converted and before each double helix's junctability is assigned. If
+                it returns True the conversion stops early.
+            progress: A function that is called with the name of each stage of the
+                conversion ("points", "junctability", and then "style") as it begins.
+
         Returns:
-            A Strands container containing all the strands.
+            A Strands container containing all the strands, or None if the conversion
+            was cancelled.
         """
         from natug.structures.strands import Strands
 
+        cancelled = cancelled or (lambda: False)
+        progress = progress or (lambda stage: None)
+
         strands = Strands(nucleic_acid_profile=self.nucleic_acid_profile, strands=())
 
+        progress("points")
         double_helices = []
         for double_helix in self:
+            if cancelled():
+                return None
             up_helix = double_helix.up_helix.strand(
                 self.nucleic_acid_profile, strands=strands
             )
@@ -160,63 +224,143 @@ class DoubleHelices:
             )
             double_helices.append((up_helix, down_helix))
 
+        progress("junctability")
         with Timer("Junctability assignment", logger=logger):
             # Assign junctability to each NEMid that superposes a NEMid in a helix of the
             # subsequent double helix.
             for index, double_helix in enumerate(double_helices):
-                if index == len(double_helices) - 1:
-                    next_double_helix = double_helices[0]
-                else:
-                    next_double_helix = double_helices[index + 1]
-
-                # Iterate through all the points in the current double helix, and check
-                # if they superpose with any points in the next double helix. Note that
-                # each double helix contains two helices, so we must iterate through all
-                # the points in both helices.
+                if cancelled():
+                    return None
+                next_double_helix = double_helices[(index + 1) % len(double_helices)]
                 for helix1 in double_helix:
                     for helix2 in next_double_helix:
-                        for point1 in helix1.items[1::2]:
-                            for point2 in helix2.items[1::2]:
-                                # We know that all overlaps are going to be on the
-                                # integer line, so we only need to check points that
-                                # are on the integer line. True, the following
-                                # implementation may sometimes check points that happen
-                                # to have the same decimal value by chance, but we will
-                                # then run the full on overlaps() method afterwards
-                                # anyway. Comparing the decimal value once is much
-                                # faster than checking to see if the %1=0 two times (
-                                # ~2x as fast).
-                                if point1.x_coord % 1 == point2.x_coord % 1:
-                                    if point1.overlaps(
-                                        point2, width=self.domains.count
-                                    ):
-                                        point1.junctable = True
-                                        point1.juncmate = point2
-                                        point2.junctable = True
-                                        point2.juncmate = point1
-
-                                        # fmt: off
-                                        point1.helix.data.right_joint_points.append(point1)
-                                        point2.helix.data.left_joint_points.append(point2)
-                                        # fmt: on
+                        for point1, point2 in self._overlapping_NEMids(
+                            helix1.helix, helix2.helix
+                        ):
+                            point1.junctable = True
+                            point1.juncmate = point2
+                            point2.junctable = True
+                            point2.juncmate = point1
+                            point1.helix.data.right_joint_points.append(point1)
+                            point2.helix.data.left_joint_points.append(point2)
 
         strands = [helix for double_helix in double_helices for helix in double_helix]
         strands = Strands(
             strands=strands, nucleic_acid_profile=self.nucleic_acid_profile
         )
+        strands.double_helices = self
 
+        progress("style")
         strands.style()
         return strands
 
-    def compute(self) -> None:
+    def _overlapping_NEMids(
+        self, helix1: "Helix", helix2: "Helix"
+    ) -> Iterator[tuple["NEMid", "NEMid"]]:
+        """
+        Find the NEMids of two helices that overlap.
+
+        Overlapping NEMids lie on the same domain boundary at the same z coord. The
+        boundaries of the two edges of the design (x coords of 0 and of the domain
+        count) are the same boundary. The matching is an exact join of the helices'
+        lattice indices, which are built if they are missing.
+
+        Args:
+            helix1: The helix on the left of the boundary.
+            helix2: The helix on the right of the boundary.
+
+        Yields:
+            Each NEMid of the first helix that overlaps a NEMid of the second helix,
+            with the NEMid that it overlaps, in the order of the first helix.
+        """
+        width = self.domains.count
+
+        def keys(helix: "Helix") -> tuple[np.ndarray, np.ndarray]:
+            if helix.data.z_indices is None:
+                helix.data.index_lattice()
+            # NEMids are every other point, starting from the second
+            boundaries = helix.data.boundaries[1::2]
+            indices = np.flatnonzero(boundaries >= 0)
+            key = helix.data.z_indices[1::2][indices] * width
+            key += boundaries[indices] % width
+            return key, indices * 2 + 1
+
+        keys1, indices1 = keys(helix1)
+        keys2, indices2 = keys(helix2)
+        _, matches1, matches2 = np.intersect1d(
+            keys1, keys2, assume_unique=True, return_indices=True
+        )
+        order = np.argsort(matches1)
+        for match1, match2 in zip(matches1[order], matches2[order]):
+            yield (
+                helix1.data.points[indices1[match1]],
+                helix2.data.points[indices2[match2]],
+            )
+
+    def build_pairs(self) -> PairingTable:
+        """
+        Build the pairing table of matching points for all the helices.
+
+        This is automatically run at the end of .compute(), but must be run manually
+        for double helices whose data was loaded rather than computed.
+
+        Returns:
+            The new pairing table, which is also stored in .pairs.
+        """
+        self.pairs = PairingTable.from_helices(self.helices())
+        return self.pairs
+
+    def index_lattice(self) -> None:
+        """
+        Build the lattice indices of every helix, which junctability is found with.
+
+        This is automatically run at the end of .compute(), but must be run manually
+        for double helices whose data was loaded rather than computed.
+        """
+        for helix in self.helices():
+            helix.data.index_lattice()
+
+    def index_junctions(self) -> None:
+        """
+        Rebuild the junction index of every double helix.
+
+        This must be run manually for double helices whose data was loaded rather than
+        computed.
+        """
+        for double_helix in self:
+            double_helix.index_junctions()
+
+    def compute(
+        self, cancelled: Callable[[], bool] | None = None, cache: bool = True
+    ) -> bool:
         """
         Compute the point data for each helix.
 
         This computes the x coord, z coord, and angle arrays for each helix. The data
         is stored in the helices respective x coord, z coord, and angle arrays.
+
+        Args:
+            cancelled: A function that is checked before each domain is computed. If
+                it returns True the computation stops early, and the helix data is
+                left incomplete. Used when computing in the background.
+            cache: Whether to use the geometry cache. If True, data that was already
+                computed for the same nucleic acid profile and domains is reused, and
+                newly computed data is cached.
+
+        Returns:
+            Whether the computation finished.
         """
+        if cache and geometry_cache.load(self):
+            self._compact()
+            self.index_lattice()
+            self.build_pairs()
+            return True
+
         logger.debug("Computing helix data")
         for index, double_helix in enumerate(self):
+            if cancelled is not None and cancelled():
+                logger.debug("Cancelled computing helix data.")
+                return False
             logger.debug("Starting domain #%s", index + 1)
             # Create a reference to the previous double helix
             previous_double_helix = self[index - 1]
@@ -423,3 +567,17 @@ class DoubleHelices:
             double_helix.down_helix.data.x_coords = np.flip(
                 double_helix.down_helix.data.x_coords
             )
+
+        # The data is computed in float64, since each domain is aligned to the data
+        # of the previous one, and only then stored in the compact dtype
+        self._compact()
+        self.index_lattice()
+        self.build_pairs()
+        if cache:
+            geometry_cache.store(self)
+        return True
+
+    def _compact(self) -> None:
+        """Convert the data of all the helices to settings.geometry_dtype."""
+        for helix in self.helices():
+            helix.data.compact()
@@ -3,7 +3,7 @@ from uuid import uuid1
 
 import pandas as pd
 
-from natug.constants.directions import DOWN, UP
+from natug.constants.directions import DOWN, LEFT, RIGHT, UP
 from natug.structures.helices.helix import Helix
 from natug.structures.points import NEMid
 from natug.utils import inverse, remove_duplicates
@@ -42,6 +42,9 @@ class DoubleHelix:
             junctions to be considered stable.
         uuid: The UUID of the double helix. This is automatically generated when the
             double helix is created.
+        junctions: The NEMids of the double helix that are part of active junctions,
+            for the left and the right helical joints (indexed by LEFT and RIGHT).
+            NEMids index themselves here when their junction status changes.
 
     Methods:
         to_csv: Write the double helix to a CSV file.
@@ -51,9 +54,11 @@ class DoubleHelix:
             junctions to be considered stable.
         right_helix_joint_is_stable: Whether the right helical joint has enough active
             junctions to be considered stable.
+        index_junction: Update the junction index for a NEMid.
+        index_junctions: Rebuild the junction index from the points of the helices.
     """
 
-    __slots__ = "domain", "helices", "uuid"
+    __slots__ = "domain", "helices", "uuid", "junctions"
 
     def __init__(
         self,
@@ -79,6 +84,7 @@ class DoubleHelix:
         self.domain = domain
         self.helices = [None, None]
         self.uuid = uuid or str(uuid1())
+        self.junctions = ({}, {})
 
         if up_helix is not None:
             logger.debug("Using passed up helix.")
@@ -178,23 +184,50 @@ class DoubleHelix:
             + self.right_helix.data.right_joint_points
         )
 
-    def _joint_is_stable(self, threshold: int, points: list):
+    def index_junction(self, NEMid_: NEMid) -> None:
+        """
+        Update the junction index for a NEMid of the double helix.
+
+        Args:
+            NEMid_: The NEMid whose junction status changed.
+        """
+        joint = NEMid_.joint
+        if joint is None:
+            return
+        if NEMid_.junction:
+            self.junctions[joint][id(NEMid_)] = NEMid_
+        else:
+            self.junctions[joint].pop(id(NEMid_), None)
+
+    def index_junctions(self) -> None:
+        """
+        Rebuild the junction index from the points of the helices.
+
+        This is needed when the points' junction statuses were set before they were
+        placed in the helices, such as when loading from a file.
+        """
+        for junctions in self.junctions:
+            junctions.clear()
+        for helix in self.helices:
+            if helix.data.points is None:
+                continue
+            for point in helix.data.points:
+                if isinstance(point, NEMid) and point.junction:
+                    self.index_junction(point)
+
+    def _joint_is_stable(self, threshold: int, joint: int):
         """
         Determine whether a helical joint is stable.
 
         Args:
             threshold: The number of active junctions that must be present in order
                 for the joint to be considered stable.
-            points: The points of the helical joint.
+            joint: The helical joint. Either LEFT or RIGHT.
 
         Returns:
             Whether the helical joint is stable.
         """
-        active_junctions = 0
-        for point in points:
-            if isinstance(point, NEMid) and point.junction:
-                active_junctions += 1
-        return active_junctions >= threshold
+        return len(self.junctions[joint]) >= threshold
 
     def left_joint_is_stable(self, threshold: int = 2):
         """
@@ -207,7 +240,7 @@ class DoubleHelix:
         Returns:
             Whether the left helical joint is stable.
         """
-        return self._joint_is_stable(threshold, self.left_helix_joint_points())
+        return self._joint_is_stable(threshold, LEFT)
 
     def right_joint_is_stable(self, threshold: int = 2):
         """
@@ -220,7 +253,7 @@ class DoubleHelix:
         Returns:
             Whether the right helical joint is stable.
         """
-        return self._joint_is_stable(threshold, self.right_helix_joint_points())
+        return self._joint_is_stable(threshold, RIGHT)
 
 
 def to_df(double_helices) -> pd.DataFrame:
@@ -235,7 +268,7 @@ def to_df(double_helices) -> pd.DataFrame:
     for double_helix in double_helices:
         data["uuid"].append(double_helix.uuid)
         data["data:domain"].append(double_helix.domain.index)
-        data["data:up_helix"].append(double_helix.up_helix.uuid)
-        data["data:down_helix"].append(double_helix.down_helix.uuid)
+        data["data:up_helix"].append(double_helix.up_helix.id)
+        data["data:down_helix"].append(double_helix.down_helix.id)
 
     return pd.DataFrame(data)
@@ -0,0 +1,205 @@
+import hashlib
+import logging
+import os
+from collections import OrderedDict
+from threading import Lock, get_ident
+
+import numpy as np
+
+from natug import settings
+
+logger = logging.getLogger(__name__)
+
+
+class GeometryCache:
+    """
+    A content-addressed cache of computed helix data.
+
+    Computed x coord, z coord, and angle arrays are stored under a fingerprint of the
+    nucleic acid profile and domains that they were computed from, so computing the
+    same configuration again (after switching snapshots, profiles, or presets) is a
+    lookup. Recently used entries are kept in memory, and if a directory is given,
+    every entry is also written there as a .npy file that is memory-mapped when it
+    is loaded back.
+
+    The cache is shared by all threads, so all access to it is locked.
+
+    Attributes:
+        capacity: The number of entries to keep in memory.
+        path: The directory of the on-disk tier, or None if there is no on-disk tier.
+
+    Methods:
+        fingerprint: Obtain the key that double helices' data is cached under.
+        load: Fill double helices with cached data.
+        store: Cache double helices' computed data.
+        clear: Forget all cached data.
+    """
+
+    def __init__(self, capacity: int, path: str | None = None) -> None:
+        """
+        Initialize a GeometryCache.
+
+        Args:
+            capacity: The number of entries to keep in memory.
+            path: The directory of the on-disk tier. Created when it is first written
+                to. If None there is no on-disk tier.
+        """
+        self.capacity = capacity
+        self.path = path
+        self._entries: OrderedDict[str, np.ndarray] = OrderedDict()
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def fingerprint(double_helices: "DoubleHelices") -> str | None:
+        """
+        Obtain the key that double helices' data is cached under.
+
+        Args:
+            double_helices: The double helices.
+
+        Returns:
+            A hex digest of the geometry key, symmetry, and antiparallel setting of
+            the double helices' domains and nucleic acid profile (and of the geometry
+            dtype, since data is cached in it), or None if the double helices were
+            not created from domains.
+        """
+        from natug.structures.helices.double_helices import geometry_key
+
+        domains = getattr(double_helices, "_domains", None)
+        if domains is None:
+            return None
+        key = (
+            geometry_key(domains, double_helices.nucleic_acid_profile),
+            domains.symmetry,
+            domains.antiparallel,
+            settings.geometry_dtype,
+        )
+        return hashlib.sha1(repr(key).encode()).hexdigest()
+
+    def load(self, double_helices: "DoubleHelices") -> bool:
+        """
+        Fill double helices with cached data.
+
+        The helices must already be sized for their domains, which they are when the
+        double helices are created from domains.
+
+        Args:
+            double_helices: The double helices to fill.
+
+        Returns:
+            Whether the data was cached. The double helices are left untouched if not.
+        """
+        fingerprint = self.fingerprint(double_helices)
+        if fingerprint is None:
+            return False
+
+        with self._lock:
+            data = self._entries.get(fingerprint)
+            if data is not None:
+                self._entries.move_to_end(fingerprint)
+        if data is None:
+            data = self._read(fingerprint)
+            if data is None:
+                return False
+            self._remember(fingerprint, data)
+
+        helices = tuple(double_helices.helices())
+        if data.shape[1] != sum(len(helix.data) for helix in helices):
+            logger.warning("Cached helix data %s has the wrong size.", fingerprint)
+            return False
+
+        start = 0
+        for helix in helices:
+            stop = start + len(helix.data)
+            # Copy the data out, since the cached arrays are shared (and may be
+            # read-only memory maps)
+            helix.data.x_coords, helix.data.z_coords, helix.data.angles = np.array(
+                data[:, start:stop]
+            )
+            start = stop
+        logger.debug("Loaded cached helix data %s.", fingerprint)
+        return True
+
+    def store(self, double_helices: "DoubleHelices") -> None:
+        """
+        Cache double helices' computed data.
+
+        Args:
+            double_helices: The double helices, which must have been computed.
+        """
+        fingerprint = self.fingerprint(double_helices)
+        if fingerprint is None:
+            return
+        data = np.concatenate(
+            [
+                (helix.data.x_coords, helix.data.z_coords, helix.data.angles)
+                for helix in double_helices.helices()
+            ],
+            axis=1,
+        )
+        self._remember(fingerprint, data)
+        self._write(fingerprint, data)
+        logger.debug("Cached helix data %s.", fingerprint)
+
+    def clear(self, disk: bool = False) -> None:
+        """
+        Forget all cached data.
+
+        Args:
+            disk: Whether to also delete the on-disk tier's files.
+        """
+        with self._lock:
+            self._entries.clear()
+        if disk and self.path is not None and os.path.isdir(self.path):
+            for filename in os.listdir(self.path):
+                if filename.endswith(".npy"):
+                    os.remove(os.path.join(self.path, filename))
+
+    def _remember(self, fingerprint: str, data: np.ndarray) -> None:
+        """Add an entry to the in-memory tier, evicting the least recently used."""
+        with self._lock:
+            self._entries[fingerprint] = data
+            self._entries.move_to_end(fingerprint)
+            while len(self._entries) > self.capacity:
+                self._entries.popitem(last=False)
+
+    def _filepath(self, fingerprint: str) -> str:
+        return os.path.join(self.path, f"{fingerprint}.npy")
+
+    def _read(self, fingerprint: str) -> np.ndarray | None:
+        """Memory-map an entry of the on-disk tier, or None if it is not there."""
+        if self.path is None or not os.path.isfile(self._filepath(fingerprint)):
+            return None
+        try:
+            return np.load(self._filepath(fingerprint), mmap_mode="r")
+        except (OSError, ValueError):
+            logger.warning("Could not read cached helix data %s.", fingerprint)
+            return None
+
+    def _write(self, fingerprint: str, data: np.ndarray) -> None:
+        """Write an entry to the on-disk tier, if there is one."""
+        if self.path is None:
+            return
+        filepath = self._filepath(fingerprint)
+        if os.path.isfile(filepath):
+            return
+        # Write to a temporary file first, so that other threads (and later runs)
+        # never memory-map a half-written file
+        temporary = f"{filepath}.{os.getpid()}.{get_ident()}.tmp"
+        try:
+            os.makedirs(self.path, exist_ok=True)
+            with open(temporary, "wb") as file:
+                np.save(file, data)
+            os.replace(temporary, filepath)
+        except OSError:
+            logger.warning("Could not write cached helix data %s.", fingerprint)
+
+
+#: The cache that DoubleHelices.compute() uses.
+geometry_cache = GeometryCache(
+    settings.geometry_cache_capacity,
+    settings.geometry_cache_path if settings.geometry_cache_on_disk else None,
+)
@@ -1,34 +1,58 @@
 import itertools
 import logging
+import os
 from dataclasses import dataclass, field
-from typing import Iterable, Literal, Type
-from uuid import uuid1
+from tempfile import TemporaryFile
+from typing import Iterable, List, Literal, Type
 
 import numpy as np
 import pandas as pd
 
+from natug import settings
 from natug.constants.directions import DOWN, UP
 from natug.structures.domains.domain import GenerationCount
+from natug.structures.identifiers import Identified, registry
 from natug.structures.points import NEMid, Nucleoside
+from natug.structures.points.point import Point
 from natug.structures.profiles import NucleicAcidProfile
 from natug.structures.strands import Strand
 
 logger = logging.getLogger(__name__)
 
+# The number of decimals that point coords are rounded to
+coord_decimals = 5
+
 
 @dataclass(slots=True)
 class HelixData:
     """
     A container for the data of a helix.
 
+    Helices that are at least settings.memmap_threshold points long have their
+    coord and angle arrays backed by scratch files in settings.helix_scratch_path
+    (if it is set), so that designs larger than RAM can be computed. Assigning a
+    same-sized array to a file-backed array writes into the file instead of
+    replacing the array.
+
+    Once computed, the coord and angle arrays are converted to
+    settings.geometry_dtype with compact().
+
     Attributes:
         helix: The helix that this data belongs to.
         x_coords: The x-coordinates of the points in the helix.
         z_coords: The z-coordinates of the points in the helix.
         angles: The angles of the points in the helix.
         points: References to Point objects in the strand derived from this data.
+            Entries for points that have not been created yet are 0.
         left_joint_points: The points that are on the left joint of the helix.
         right_joint_points: The points that are on the right joint of the helix.
+        z_indices: The z coords of the points as integer multiples of
+            10**-coord_decimals, which is the lattice that point coords are rounded
+            to. Two points have the same z coord exactly when they have the same z
+            index. Built by index_lattice(), or None before then.
+        boundaries: The domain boundary (integer x coord) that each point lies on,
+            or -1 for points that are not on a boundary. Built by index_lattice(), or
+            None before then.
     """
 
     helix: Type["Helix"] | None = None
@@ -39,8 +63,21 @@ class HelixData:
     points: np.ndarray | None = None
     left_joint_points: list = field(default_factory=list)
     right_joint_points: list = field(default_factory=list)
+    z_indices: np.ndarray | None = None
+    boundaries: np.ndarray | None = None
 
     _data_arrays = ("x_coords", "z_coords", "angles", "points")
+    _mappable_arrays = ("x_coords", "z_coords", "angles")
+
+    def __setattr__(self, name, value):
+        # Write into file-backed arrays instead of replacing them, so that they
+        # stay out of RAM
+        if name in HelixData._mappable_arrays:
+            current = getattr(self, name, None)
+            if isinstance(current, np.memmap) and np.shape(value) == current.shape:
+                current[...] = value
+                return
+        object.__setattr__(self, name, value)
 
     def __len__(self):
         return self.size()
@@ -65,14 +102,73 @@ class HelixData:
             This method flushes the data of the helix. Use with caution.
         """
         logger.debug(f"Resizing helix data to %s points.", size)
-        self.x_coords = np.zeros(size)
-        self.z_coords = np.zeros(size)
-        self.angles = np.zeros(size)
+        self.x_coords = self._allocate(size)
+        self.z_coords = self._allocate(size)
+        self.angles = self._allocate(size)
         self.points = np.zeros(size, dtype=object)
+        self.z_indices = None
+        self.boundaries = None
+
+    def index_lattice(self) -> None:
+        """
+        Build the z indices and boundaries of the points from the coord arrays.
+
+        The indices are taken from the coords as they are stored (after compact()),
+        so that they agree with the rounded coords of the points created from them.
+        """
+        scale = 10**coord_decimals
+        z_coords = np.asarray(self.z_coords, dtype=float)
+        x_coords = np.asarray(self.x_coords, dtype=float)
+        self.z_indices = np.rint(z_coords * scale).astype(np.int64)
+        x_indices = np.rint(x_coords * scale).astype(np.int64)
+        self.boundaries = np.where(x_indices % scale == 0, x_indices // scale, -1)
+
+    def compact(self) -> None:
+        """
+        Convert the coord and angle arrays to settings.geometry_dtype.
+
+        Nothing happens to arrays that already have that dtype. File-backed arrays
+        stay file-backed.
+        """
+        dtype = np.dtype(settings.geometry_dtype)
+        for name in self._mappable_arrays:
+            array = getattr(self, name)
+            if array is None or array.dtype == dtype:
+                continue
+            compacted = self._allocate(len(array), dtype)
+            compacted[...] = array
+            # Bypass __setattr__, which would write into a file-backed array
+            object.__setattr__(self, name, compacted)
+
+    @staticmethod
+    def _allocate(size: int, dtype=float) -> np.ndarray:
+        """
+        Allocate a zeroed array for a coord or angle array.
+
+        Large arrays are memory-mapped to an anonymous scratch file, which is deleted
+        once the array is no longer referenced.
+
+        Args:
+            size: The size of the array.
+            dtype: The dtype of the array. Defaults to float64.
+
+        Returns:
+            The array.
+        """
+        threshold = max(settings.memmap_threshold, 1)
+        if settings.helix_scratch_path is None or size < threshold:
+            return np.zeros(size, dtype=dtype)
+        os.makedirs(settings.helix_scratch_path, exist_ok=True)
+        return np.memmap(
+            TemporaryFile(dir=settings.helix_scratch_path),
+            dtype=dtype,
+            mode="w+",
+            shape=(size,),
+        )
 
 
 @dataclass(slots=True)
-class Helix:
+class Helix(Identified):
     """
     A singular helix in a double helix.
 
@@ -83,11 +179,13 @@ class Helix:
         double_helix: The parent DoubleHelix object.
         data: The data for the helix. This is a HelixData object that stores the
             actual positional and angle datapoints of all Points within the helix.
-        uuid: The unique identifier of the helix.
+        id: The identifier of the helix. Automatically taken from the registry.
+        uuid: The uuid of the helix. Generated when it is first requested.
 
     Methods:
         point: Generate a specific point object parented to this helix.
         points: Generate all the points along the helix.
+        window: Obtain the points between two heights, creating only those points.
         strand: Generate a strand full of points for this helix.
         other_helix: Obtain the other helix in the double helix.
     """
@@ -95,7 +193,8 @@ class Helix:
     direction: Literal[UP, DOWN]
     double_helix: Type["DoubleHelix"] | None
     data: HelixData = field(default_factory=HelixData)
-    uuid: str = field(default_factory=lambda: str(uuid1()))
+    id: int = field(default_factory=registry.new)
+    _uuid: str | None = field(default=None, init=False, repr=False)
 
     def __post_init__(self):
         self.data.helix = self
@@ -107,9 +206,22 @@ class Helix:
         )
         return len(self.data.angles)
 
-    def __getitem__(self, index: int) -> None:
-        """Get a point at a given index along the helix."""
-        return self.data.points[index]
+    def __getitem__(self, index: int) -> Point:
+        """
+        Get a point at a given index along the helix.
+
+        If the point has not been created yet (because the helix's points have not
+        been generated) then it is created, as if the points began with a
+        Nucleoside.
+        """
+        if self.data.points is None:
+            self.data.points = np.zeros(len(self), dtype=object)
+        point = self.data.points[index]
+        if not isinstance(point, Point):
+            index = range(len(self))[index]
+            point = self._point(index, (Nucleoside, NEMid)[index % 2])
+            self.data.points[index] = point
+        return point
 
     @property
     def domain(self):
@@ -168,9 +280,9 @@ class Helix:
             self.data.z_coords,
         ):
             point = cls(  # type: ignore
-                angle=angle,
-                x_coord=round(x_coord, 5),
-                z_coord=round(z_coord, 5),
+                angle=float(angle),
+                x_coord=round(float(x_coord), coord_decimals),
+                z_coord=round(float(z_coord), coord_decimals),
                 direction=self.direction,
                 domain=domain,
                 helix=self,
@@ -179,6 +291,44 @@ class Helix:
             self.data.points[index] = point
             yield point
 
+    def _point(self, index: int, cls: Type[Point]) -> Point:
+        """Create the point at an index of the helix's data."""
+        return cls(  # type: ignore
+            angle=float(self.data.angles[index]),
+            x_coord=round(float(self.data.x_coords[index]), coord_decimals),
+            z_coord=round(float(self.data.z_coords[index]), coord_decimals),
+            direction=self.direction,
+            domain=self.double_helix.domain if self.double_helix else None,
+            helix=self,
+            helical_index=index,
+        )
+
+    def window(self, z_min: float, z_max: float) -> List[Point]:
+        """
+        Obtain the points of the helix between two heights.
+
+        Only the points in the window are created (if they were not already), so
+        this is much cheaper than generating every point of a long helix, for
+        example to plot the part of it that is visible.
+
+        Args:
+            z_min: The lowest z coord to include.
+            z_max: The highest z coord to include.
+
+        Returns:
+            The points in the window, in the order of the helix.
+        """
+        z_coords = self.data.z_coords
+        # Up helices are stored bottom to top and down helices top to bottom
+        if len(z_coords) > 1 and z_coords[0] > z_coords[-1]:
+            reversed_z_coords = z_coords[::-1]
+            start = len(z_coords) - np.searchsorted(reversed_z_coords, z_max, "right")
+            stop = len(z_coords) - np.searchsorted(reversed_z_coords, z_min, "left")
+        else:
+            start = np.searchsorted(z_coords, z_min, "left")
+            stop = np.searchsorted(z_coords, z_max, "right")
+        return [self[index] for index in range(start, stop)]
+
     def strand(
         self,
         nucleic_acid_profile: NucleicAcidProfile,
@@ -223,7 +373,7 @@ def to_df(helices: Iterable[Helix]) -> pd.DataFrame:
 
     Data for each helix is stored in a row. The data for each helix
     is stored in the following columns:
-        "uuid": The UUID of the helix.
+        "id": The id of the helix.
         "data:domain": The UUID of the domain that the helix lies within.
         "data:direction": The direction of the helix. Either UP or DOWN.
         "data:generation_count": The number of points to generate for the double
@@ -234,7 +384,7 @@ def to_df(helices: Iterable[Helix]) -> pd.DataFrame:
             by semicolons.
         "data:angles": The angles of the points in the helix, separated by
             semicolons.
-        "data:points": The UUIDs of the points in the helix, separated by
+        "data:points": The ids of the points in the helix, separated by
             semicolons.
 
     Arguments:
@@ -244,7 +394,7 @@ def to_df(helices: Iterable[Helix]) -> pd.DataFrame:
         A pandas dataframe containing data for many helices.
     """
     data = {
-        "uuid": [],
+        "id": [],
         "data:double_helix": [],
         "data:direction": [],
         "data:x_coords": [],
@@ -253,14 +403,14 @@ def to_df(helices: Iterable[Helix]) -> pd.DataFrame:
         "data:points": [],
     }
     for helix in helices:
-        data["uuid"].append(helix.uuid)
+        data["id"].append(helix.id)
         data["data:double_helix"].append(helix.double_helix.uuid)
         data["data:direction"].append("UP" if helix.direction == UP else "DOWN")
         data["data:x_coords"].append(";".join(map(str, helix.data.x_coords)))
         data["data:z_coords"].append(";".join(map(str, helix.data.z_coords)))
         data["data:angles"].append(";".join(map(str, helix.data.angles)))
         data["data:points"].append(
-            ";".join(map(lambda point: point.uuid, helix.data.points))
+            ";".join(map(lambda point: str(point.id), helix.data.points))
         )
 
     return pd.DataFrame(data)
@@ -0,0 +1,178 @@
+import logging
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List
+
+import numpy as np
+
+from natug.structures.points.nick import Nick
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class PairingTable:
+    """
+    A table of which point on each helix pairs with which point on the other helix.
+
+    Every point in every helix is given a global index, which is the offset of its
+    helix plus its helical index. The table maps each global index to the global index
+    of the matching point on the other helix of the same double helix.
+
+    Since the table is built from helix positions, and not from point objects, it
+    stays valid when points are nicked (nicks take the place of points within their
+    helices' data, and keep the original point's helix and helical index).
+
+    Attributes:
+        helices: All the helices, in global index order.
+        offsets: A (helix count + 1,) array. The points of helix h have global indexes
+            offsets[h] through offsets[h + 1] - 1.
+        mates: A (point count,) array mapping each global index to the global index
+            of its matching point, or -1 if it has no matching point.
+
+    Methods:
+        from_helices: Build a pairing table for many helices.
+        index: Obtain the global index of a point.
+        indexes: Obtain the global indexes of many points.
+        point: Obtain the point at a global index.
+        mate: Obtain the matching point of a point.
+        mates_of: Obtain the matching points of many points.
+    """
+
+    helices: List["Helix"]
+    offsets: np.ndarray
+    mates: np.ndarray
+    _helix_numbers: Dict[int, int] = field(default_factory=dict, repr=False)
+
+    @classmethod
+    def from_helices(cls, helices: Iterable["Helix"]) -> "PairingTable":
+        """
+        Build a pairing table for many helices.
+
+        The helices must come in (up helix, down helix) pairs for each double helix,
+        as yielded by DoubleHelices.helices(), and must have their data computed.
+
+        Args:
+            helices: The helices to build the table for.
+
+        Returns:
+            The new pairing table.
+        """
+        helices = list(helices)
+        sizes = np.array([len(helix.data.angles) for helix in helices], dtype=np.int64)
+        offsets = np.zeros(len(helices) + 1, dtype=np.int64)
+        np.cumsum(sizes, out=offsets[1:])
+
+        # The point at helical index i of a helix matches the point at helical index
+        # len(other_helix) - 1 - i of the other helix of its double helix. The other
+        # helix of helix h is helix h ^ 1, since they come in pairs.
+        helix_numbers = np.repeat(np.arange(len(helices)), sizes)
+        helical_indexes = np.arange(offsets[-1]) - offsets[helix_numbers]
+        other_helices = helix_numbers ^ 1
+        other_sizes = sizes[other_helices]
+        other_indexes = other_sizes - 1 - helical_indexes
+        mates = np.where(
+            (other_indexes >= 0) & (other_indexes < other_sizes),
+            offsets[other_helices] + other_indexes,
+            -1,
+        )
+
+        logger.debug("Built a pairing table for %s points.", offsets[-1])
+        return cls(
+            helices,
+            offsets,
+            mates,
+            {id(helix): number for number, helix in enumerate(helices)},
+        )
+
+    def __len__(self) -> int:
+        return len(self.mates)
+
+    def __contains__(self, point) -> bool:
+        return getattr(point, "helix", None) is not None and (
+            id(point.helix) in self._helix_numbers
+        )
+
+    def index(self, point) -> int:
+        """
+        Obtain the global index of a point.
+
+        Args:
+            point: The point (or nick) to obtain the index of.
+
+        Returns:
+            The global index of the point.
+
+        Raises:
+            KeyError: If the point's helix is not in the table.
+        """
+        return self.offsets[self._helix_numbers[id(point.helix)]] + point.helical_index
+
+    def indexes(self, points: Iterable) -> np.ndarray:
+        """
+        Obtain the global indexes of many points.
+
+        Args:
+            points: The points (or nicks) to obtain the indexes of.
+
+        Returns:
+            An array of global indexes, with -1 for points that aren't in the table.
+        """
+        numbers = self._helix_numbers
+        offsets = self.offsets
+        return np.fromiter(
+            (
+                (
+                    offsets[numbers[id(point.helix)]] + point.helical_index
+                    if id(point.helix) in numbers
+                    else -1
+                )
+                for point in points
+            ),
+            dtype=np.int64,
+        )
+
+    def point(self, index: int):
+        """
+        Obtain the point at a global index.
+
+        If the point has been nicked, the original point (not the nick) is returned.
+
+        Args:
+            index: The global index of the point.
+
+        Returns:
+            The point at the index.
+        """
+        helix_number = int(np.searchsorted(self.offsets, index, side="right")) - 1
+        helix = self.helices[helix_number]
+        point = helix.data.points[index - self.offsets[helix_number]]
+        return point.original_item if isinstance(point, Nick) else point
+
+    def mate(self, point):
+        """
+        Obtain the matching point of a point.
+
+        Args:
+            point: The point to obtain the matching point of.
+
+        Returns:
+            The matching point, or None if there is none.
+        """
+        if point not in self:
+            return None
+        mate = self.mates[self.index(point)]
+        return None if mate == -1 else self.point(mate)
+
+    def mates_of(self, points: Iterable) -> List:
+        """
+        Obtain the matching points of many points.
+
+        Args:
+            points: The points to obtain the matching points of.
+
+        Returns:
+            A list of the matching points, with None for points without one.
+        """
+        indexes = self.indexes(points)
+        mates = np.where(indexes >= 0, self.mates[np.maximum(indexes, 0)], -1)
+        return [None if mate == -1 else self.point(mate) for mate in mates]
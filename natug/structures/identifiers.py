@@ -0,0 +1,68 @@
+import itertools
+import logging
+from uuid import uuid1
+
+logger = logging.getLogger(__name__)
+
+
+class Registry:
+    """
+    Hands out dense integer identifiers.
+
+    Identifiers are consecutive integers, so creating one is a counter increment,
+    which is far cheaper than generating a UUID, and they are small and fast to hash
+    when structures reference each other in save files.
+
+    Methods:
+        new: Obtain a new identifier.
+    """
+
+    __slots__ = ("_counter",)
+
+    def __init__(self, start: int = 0) -> None:
+        """
+        Initialize a Registry.
+
+        Args:
+            start: The first identifier to hand out.
+        """
+        self._counter = itertools.count(start)
+
+    def new(self) -> int:
+        """
+        Obtain a new identifier.
+
+        This is safe to call from any thread, since advancing an itertools.count is
+        atomic.
+
+        Returns:
+            An identifier that has not been handed out before.
+        """
+        return next(self._counter)
+
+
+#: The registry that all structures take their identifiers from.
+registry = Registry()
+
+
+class Identified:
+    """
+    A mixin for structures with an integer identifier and a lazily made UUID.
+
+    Subclasses must have an "id" attribute, which should be set from
+    registry.new(), and a "_uuid" attribute, which should start out as None.
+
+    Attributes:
+        uuid (str): A UUID for the structure, for when an identifier that is unique
+            outside this program is needed. Generated when it is first requested.
+    """
+
+    __slots__ = ()
+
+    @property
+    def uuid(self) -> str:
+        # Dataclasses that subclass a slotted dataclass never set its init=False
+        # fields, so _uuid may be missing rather than None
+        if getattr(self, "_uuid", None) is None:
+            self._uuid = str(uuid1())
+        return self._uuid
@@ -3,6 +3,7 @@ from typing import Iterable
 
 import pandas as pd
 
+from natug.constants.directions import LEFT, RIGHT
 from natug.structures.points.point import Point
 
 
@@ -15,13 +16,41 @@ class NEMid(Point):
         junctable: Whether this NEMid overlaps another NEMid and can thus can conjunct.
         juncmate: NEMid that can this NEMid can conjunct-with. NoneType if this no
             NEMid overlaps.
-        junction: Whether this NEMid is a member of an active junction.
+        junction: Whether this NEMid is a member of an active junction. Changing
+            this updates the junction index of the NEMid's double helix.
+        joint: The helical joint of its domain that the NEMid lies on.
     """
 
     juncmate: None = None
     junctable: bool = False
     junction: bool = False
 
+    def __setattr__(self, key, value):
+        """
+        Index the NEMid in its double helix when its junction status changes.
+        """
+        previous = getattr(self, "junction", False) if key == "junction" else value
+        super().__setattr__(key, value)
+        if key == "junction" and bool(value) != bool(previous):
+            double_helix = getattr(self.helix, "double_helix", None)
+            if hasattr(double_helix, "index_junction"):
+                double_helix.index_junction(self)
+
+    @property
+    def joint(self) -> int | None:
+        """
+        The helical joint of its domain that the NEMid lies on.
+
+        Domain #i lies between i and i + 1 on the x axis, so junctable NEMids on the
+        left joint are at about x = i, and those on the right joint at about x = i + 1.
+
+        Returns:
+            LEFT or RIGHT, or None if the NEMid isn't junctable.
+        """
+        if not self.junctable or self.domain is None or self.x_coord is None:
+            return None
+        return RIGHT if self.x_coord - self.domain.index >= 0.5 else LEFT
+
     def to_nucleoside(self):
         """
         Convert the nucleoside to NEMid type.
@@ -65,7 +94,7 @@ def to_df(NEMids: Iterable[NEMid]) -> pd.DataFrame:
     data["NEMid:junctable"] = [NEMid_.junctable for NEMid_ in NEMids]
     data["NEMid:junction"] = [NEMid_.junction for NEMid_ in NEMids]
     data["NEMid:juncmate"] = [
-        (NEMid_.juncmate.uuid if NEMid_.juncmate is not None else None)
+        (NEMid_.juncmate.id if NEMid_.juncmate is not None else None)
         for NEMid_ in NEMids
     ]
 
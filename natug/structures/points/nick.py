@@ -1,14 +1,14 @@
 from dataclasses import dataclass, field
 from typing import Iterable
-from uuid import uuid1
 
 import pandas as pd
 
+from natug.structures.identifiers import Identified, registry
 from natug.structures.points.point import Point
 
 
 @dataclass(slots=True)
-class Nick:
+class Nick(Identified):
     """
     A Nick object.
 
@@ -16,7 +16,8 @@ class Nick:
     object.
 
     Attributes:
-        uuid: The unique identifier of the nick.
+        id: The identifier of the nick. Automatically taken from the registry.
+        uuid: The uuid of the nick. Generated when it is first requested.
         original_item: The NEMid object that was transformed into a nick.
         previously_closed_strand: Whether the strand the nick used to belong to was
             closed.
@@ -29,7 +30,8 @@ class Nick:
     original_item: Point
     previously_closed_strand: "Strand" = None
 
-    uuid: str = field(default_factory=lambda: str(uuid1()))
+    id: int = field(default_factory=registry.new)
+    _uuid: str | None = field(default=None, init=False, repr=False)
 
     def next_item(self) -> "Point":
         return self.helix[self.helical_index + 1]
@@ -60,10 +62,10 @@ def to_df(nicks: Iterable[Nick]) -> pd.DataFrame:
         A pandas dataframe with all the Nick data.
 
     Notes:
-        The original NEMid objects are referenced by uuid.
+        The original NEMid objects are referenced by id.
     """
     data = {
-        "uuid": [nick.uuid for nick in nicks],
-        "data:original_item": [nick.original_item.uuid for nick in nicks],
+        "id": [nick.id for nick in nicks],
+        "data:original_item": [nick.original_item.id for nick in nicks],
     }
     return pd.DataFrame(data)
@@ -1,12 +1,12 @@
 import logging
 from dataclasses import dataclass, field
 from typing import Iterable, Tuple
-from uuid import uuid1
 
 import pandas as pd
 
 from natug import settings
 from natug.constants.directions import DOWN, UP
+from natug.structures.identifiers import Identified, registry
 from natug.utils import rgb_to_hex
 
 logger = logging.getLogger(__name__)
@@ -165,7 +165,7 @@ class PointStyles:
 
 
 @dataclass(kw_only=True, slots=True)
-class Point:
+class Point(Identified):
     """
     A point object.
 
@@ -187,7 +187,8 @@ class Point:
         linkage: The linkage that this point belongs to. Can be None.
         domain: The domain this point belongs to.
         styles: The styles of the point.
-        uuid (str): The uuid of the point. This is automatically generated post init.
+        id (int): The identifier of the point. Automatically taken from the registry.
+        uuid (str): The uuid of the point. Generated when it is first requested.
 
     Methods:
         x_coord_from_angle: Obtain the x coord of the point from the angle.
@@ -215,7 +216,8 @@ class Point:
     # plotting attributes
     styles: PointStyles = field(default=None, repr=False)
 
-    uuid: str = field(default_factory=lambda: str(uuid1()))
+    id: int = field(default_factory=registry.new, repr=False)
+    _uuid: str | None = field(default=None, init=False, repr=False, compare=False)
 
     def __post_init__(self):
         """
@@ -225,7 +227,6 @@ class Point:
         2) Ensure that the direction is either UP or DOWN.
         3) Compute the x coord from the angle if the x coord is not provided.
         4) Set the styles of the point.
-        5) Generate a UUID for the point.
         """
         # Modulo the angle to be between 0 and 360 degrees
         if self.angle is not None:
@@ -336,10 +337,10 @@ class Point:
         assert self.strand is not None, "Point has no strand"
 
         if of_its_type:
-            items = self.strand.items.by_type(type(self))
-            return self == items[0] or self == items[-1]
+            items, type_ = self.strand.items, type(self)
+            return self is items.first_of(type_) or self is items.last_of(type_)
         else:
-            return self == self.strand.items[0] or self == self.strand.items[-1]
+            return self is self.strand.items[0] or self is self.strand.items[-1]
 
     def is_tail(self, of_its_type) -> bool:
         """
@@ -362,10 +363,9 @@ class Point:
         assert self.strand is not None, "Point has no strand"
 
         if of_its_type:
-            items = self.strand.items.by_type(type(self))
-            return self == items[-1]
+            return self is self.strand.items.last_of(type(self))
         else:
-            return self == self.strand.items[-1]
+            return self is self.strand.items[-1]
 
     def is_head(self, of_its_type) -> bool:
         """
@@ -388,10 +388,9 @@ class Point:
         assert self.strand is not None, "Point has no strand"
 
         if of_its_type:
-            items = self.strand.items.by_type(type(self))
-            return self == items[0]
+            return self is self.strand.items.first_of(type(self))
         else:
-            return self == self.strand.items[0]
+            return self is self.strand.items[0]
 
     @property
     def index(self):
@@ -444,7 +443,7 @@ def to_df(points: Iterable[Point]) -> pd.DataFrame:
     """
     # create a dataframe from the points
     data = {
-        "uuid": [],
+        "id": [],
         "data:x_coord": [],
         "data:z_coord": [],
         "data:angle": [],
@@ -458,7 +457,7 @@ def to_df(points: Iterable[Point]) -> pd.DataFrame:
         "style:state": [],
     }
     for point in points:
-        data["uuid"].append(point.uuid)
+        data["id"].append(point.id)
         data["data:x_coord"].append(point.x_coord)
         data["data:z_coord"].append(point.z_coord)
         data["data:angle"].append(point.angle)
@@ -29,14 +29,18 @@ class ActionRepeaterProfile:
     def run(
         self,
         point: Point | Nick,
-        action: Literal["nick", "unnick", "highlight", "conjunct"],
+        action: Literal[
+            "nick", "unnick", "highlight", "conjunct", "unjunct", "link", "set base"
+        ],
+        base: str | None = None,
     ) -> None:
         """
         Run an action with the current settings along a helix beginning at a point.
 
         Args:
             point: The point to start the action at. Must have a "helix" attribute.
-            action: The action to run.
+            action: The action to run. See Strands.do_many for the actions.
+            base: The base to set, for the "set base" action.
         """
         self.strands.do_many(
             action,
@@ -45,4 +49,5 @@ class ActionRepeaterProfile:
             self.repeat_for,
             self.bidirectional,
             point.helix.data.points,
+            base=base,
         )
@@ -7,6 +7,8 @@ import pandas as pd
 from openpyxl.worksheet.worksheet import Worksheet as pyxlWorksheet
 from xlsxwriter.utility import xl_col_to_name
 
+from natug.structures.events import PROFILE_CHANGED, EventBus
+
 
 @dataclass(kw_only=True)
 class NucleicAcidProfile:
@@ -25,6 +27,8 @@ class NucleicAcidProfile:
         theta_s: Switch angle.
         notes: Notes about the nucleic acid profile.
         uuid: The uuid of the nucleic acid profile. This is automatically generated.
+        events: The event bus that PROFILE_CHANGED events are emitted on. This is not
+            a dataclass field, so it is not saved or compared.
 
     Methods:
         update: Update our nucleic_acid_profile in place.
@@ -45,6 +49,9 @@ class NucleicAcidProfile:
 
     uuid: str = field(default_factory=lambda: str(uuid1()))
 
+    def __post_init__(self):
+        self.events = EventBus()
+
     @property
     def Z_b(self) -> float:
         """The base height."""
@@ -84,6 +91,7 @@ class NucleicAcidProfile:
         """
         for attr in self.__dataclass_fields__:
             setattr(self, attr, getattr(profile, attr))
+        self.events.emit(PROFILE_CHANGED, self)
 
     def to_file(self, filepath: str) -> None:
         """
@@ -0,0 +1,248 @@
+import logging
+from typing import Iterable, List, Sequence, Tuple
+
+from natug.structures.points import NEMid
+from natug.structures.points.point import Point
+
+logger = logging.getLogger(__name__)
+
+
+class _Head:
+    """A placeholder that comes before the first item of an open strand."""
+
+    __slots__ = ()
+
+
+def repeat_targets(
+    first_point: Point,
+    items: Sequence,
+    repeat_every: int,
+    repeat_for: int | None,
+    bidirectional: bool,
+) -> List:
+    """
+    Compute all the items that a repeated action is run on, before running it.
+
+    Targets are every repeat_every-th item of the items, counting from the first
+    point, so that every target lines up with the first point.
+
+    Args:
+        first_point: The point to run the action on first. It must be one of the
+            items.
+        items: The items to run the action along, generally a helix's points.
+        repeat_every: The number of items between each target.
+        repeat_for: The number of targets to run the action on in each direction,
+            including the first point. If None, the action runs to the end(s) of the
+            items.
+        bidirectional: Whether to also run the action on items before the first
+            point.
+
+    Returns:
+        The targets, in the order of the items.
+
+    Raises:
+        ValueError: If repeat_every is not positive, or the first point is not one of
+            the items.
+    """
+    if repeat_every < 1:
+        raise ValueError(f"repeat_every must be positive. Got: {repeat_every}")
+
+    # Points know where they are in their helix, so the items (which are generally
+    # the points of the helix) rarely need to be scanned for the first point.
+    index = getattr(first_point, "helical_index", None)
+    if index is None or not 0 <= index < len(items) or items[index] is not first_point:
+        index = next((i for i, item in enumerate(items) if item is first_point), None)
+        if index is None:
+            raise ValueError(f"The first point {first_point} is not one of the items.")
+
+    if repeat_for is None:
+        start = index % repeat_every if bidirectional else index
+        end = len(items)
+    else:
+        reach = (repeat_for - 1) * repeat_every
+        start = max(index - reach, index % repeat_every) if bidirectional else index
+        end = min(index + reach + 1, len(items))
+
+    return list(items[start:end:repeat_every])
+
+
+def split_items(items: Sequence, closed: bool, indices: Iterable[int]) -> List[list]:
+    """
+    Split the items of a strand at many indexes at once.
+
+    This has the same result as nicking the strand at each of the indexes one after
+    another, but only walks over the items once.
+
+    Args:
+        items: The items of the strand.
+        closed: Whether the strand is closed. The items after the last index are
+            joined onto the items before the first index for closed strands.
+        indices: The indexes to split at. The items at the indexes are left out.
+
+    Returns:
+        The items of each piece, in order. Pieces may be empty.
+    """
+    indices = sorted(set(indices))
+    if not indices:
+        return [list(items)]
+    starts = (-1, *indices)
+    ends = (*indices, len(items))
+    pieces = [list(items[start + 1 : end]) for start, end in zip(starts, ends)]
+    if closed:
+        pieces = [pieces[-1] + pieces[0], *pieces[1:-1]]
+    return pieces
+
+
+def relink(
+    strands: Iterable[Tuple[Sequence, bool]], pairs: Iterable[Tuple[NEMid, NEMid]]
+) -> List[Tuple[list, bool]]:
+    """
+    Reassemble strands after making many junctions at once.
+
+    A junction between two NEMids swaps the items that come after the items before
+    each NEMid, so the strands are turned into a table of the item that comes after
+    each item, all the junctions are made as swaps in that table, and then the
+    strands are reassembled from it in one pass. The result is the same as
+    conjuncting the pairs one after another, in order.
+
+    The junction flags of the items on either side of each splice are updated, since
+    they are the only items whose neighbors change.
+
+    Args:
+        strands: The (items, closed) of every strand that the NEMids are in.
+        pairs: The pairs of NEMids to make junctions between. Making a junction where
+            one already exists removes it.
+
+    Returns:
+        The (items, closed) of the new strands. Open strands come first, in the order
+        of the strands that they begin with. Empty strands are left out.
+    """
+    strands = [(items, closed) for items, closed in strands]
+    after, before, heads = {}, {}, []
+
+    for items, closed in strands:
+        if not items:
+            continue
+        if closed:
+            chain = [*items, items[0]]
+        else:
+            heads.append(head := _Head())
+            chain = [head, *items]
+            after[id(items[-1])] = None
+        for item, next_item in zip(chain, chain[1:]):
+            after[id(item)] = next_item
+            before[id(next_item)] = item
+
+    spliced = {}
+    for NEMid1, NEMid2 in pairs:
+        previous1, previous2 = before[id(NEMid1)], before[id(NEMid2)]
+        after[id(previous1)], after[id(previous2)] = NEMid2, NEMid1
+        before[id(NEMid1)], before[id(NEMid2)] = previous2, previous1
+        for item in (NEMid1, NEMid2, previous1, previous2):
+            if not isinstance(item, _Head):
+                spliced[id(item)] = item
+
+    rebuilt, seen = [], set()
+    for head in heads:
+        chain = []
+        item = after[id(head)]
+        while item is not None:
+            chain.append(item)
+            seen.add(id(item))
+            item = after[id(item)]
+        if chain:
+            rebuilt.append((chain, False))
+
+    # Everything that can't be reached from the start of an open strand is in a loop
+    for items, _ in strands:
+        for start in items:
+            if id(start) in seen:
+                continue
+            chain, item = [], start
+            while id(item) not in seen:
+                chain.append(item)
+                seen.add(id(item))
+                item = after[id(item)]
+            rebuilt.append((chain, True))
+
+    for key, item in spliced.items():
+        if isinstance(item, NEMid):
+            previous = before[key]
+            item.junction = is_junction(
+                item, None if isinstance(previous, _Head) else previous, after[key]
+            )
+
+    logger.debug("Relinked %s strands into %s strands.", len(strands), len(rebuilt))
+    return rebuilt
+
+
+def neighbors(items: Sequence, index: int, closed: bool) -> Tuple[object, object]:
+    """
+    Obtain the items on either side of an item of a strand.
+
+    Args:
+        items: The items of the strand.
+        index: The index of the item.
+        closed: Whether the strand is closed, in which case its ends are neighbors.
+
+    Returns:
+        The previous and next items. Either is None at the end of an open strand.
+    """
+    if closed:
+        return items[(index - 1) % len(items)], items[(index + 1) % len(items)]
+    return (
+        items[index - 1] if index > 0 else None,
+        items[index + 1] if index < len(items) - 1 else None,
+    )
+
+
+def is_junction(item, previous, next_item) -> bool:
+    """
+    Determine whether an item of a strand is part of an active junction.
+
+    A NEMid is part of a junction if it is junctable and the strand crosses from one
+    domain to another at it, so the ends of open strands are never junctions.
+
+    Args:
+        item: The item of the strand.
+        previous: The item before it in the strand, or None.
+        next_item: The item after it in the strand, or None.
+
+    Returns:
+        Whether the item is part of an active junction.
+    """
+    return (
+        isinstance(item, NEMid)
+        and item.junctable
+        and previous is not None
+        and next_item is not None
+        and previous.domain != next_item.domain
+    )
+
+
+def link_mate(point: Point) -> NEMid | None:
+    """
+    Obtain the NEMid that a repeated link joins a point to.
+
+    This is the NEMid across the double helix from the point, if both are opposite
+    ends (one head and one tail) of their strands. Closed strands have no ends.
+
+    Args:
+        point: The point to find the link mate of.
+
+    Returns:
+        The link mate, or None if the point can't be linked.
+    """
+    if not isinstance(point, NEMid) or point.strand is None or point.helix is None:
+        return None
+    if point.strand.closed:
+        return None
+    other_helix = point.helix.other_helix()
+    mate = other_helix.data.points[len(other_helix) - 1 - point.helical_index]
+    if not isinstance(mate, NEMid) or mate.strand is None or mate.strand.closed:
+        return None
+    if (point.is_head(True) and mate.is_tail(True)) or (
+        point.is_tail(True) and mate.is_head(True)
+    ):
+        return mate
+    return None
@@ -0,0 +1,165 @@
+import csv
+import logging
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, Iterator, Tuple
+
+from xlsxwriter import Workbook
+
+logger = logging.getLogger(__name__)
+
+# A (name, sequence, color) tuple for one strand. Sequences are 5' to 3'.
+SequenceRecord = Tuple[str, str, str]
+
+# The number of bases per line of FASTA output
+fasta_line_length = 80
+
+# The rows and columns of the plates written by the IDT plate exporter
+plate_rows = "ABCDEFGH"
+plate_columns = 12
+
+
+@dataclass(slots=True)
+class SequenceExporter:
+    """
+    A file format that strand sequences can be exported to.
+
+    Attributes:
+        name: The name of the format, which is passed as the mode of
+            Strands.export_sequence.
+        suffix: The file suffix of the format, including the leading period.
+        description: A human-readable description of the format, used in file
+            choosers.
+        write: A function that writes (name, sequence, color) records to a filepath.
+            It is given the records lazily, and should stream them to the file.
+    """
+
+    name: str
+    suffix: str
+    description: str
+    write: Callable[[Iterable[SequenceRecord], str, str], None]
+
+
+#: All the registered exporters, by name.
+exporters: Dict[str, SequenceExporter] = {}
+
+
+def register_exporter(name: str, suffix: str, description: str):
+    """
+    Register a function as a sequence exporter.
+
+    The function is called with the records to export, the filepath to export to
+    (including the suffix), and the name of the strands that are being exported.
+
+    Args:
+        name: The name of the format.
+        suffix: The file suffix of the format, including the leading period.
+        description: A human-readable description of the format.
+
+    Returns:
+        A decorator that registers the function and returns it unchanged.
+    """
+
+    def decorator(write):
+        exporters[name] = SequenceExporter(name, suffix, description, write)
+        return write
+
+    return decorator
+
+
+def exporter(name: str) -> SequenceExporter:
+    """
+    Obtain a registered exporter.
+
+    Args:
+        name: The name of the format.
+
+    Returns:
+        The exporter for the format.
+
+    Raises:
+        ValueError: If there is no exporter for the format.
+    """
+    try:
+        return exporters[name]
+    except KeyError:
+        raise ValueError(
+            f"Unknown mode: {name}. Supported modes are {', '.join(exporters)}."
+        ) from None
+
+
+def _write_delimited(records: Iterable[SequenceRecord], filepath: str, delimiter):
+    """Write the records as a delimited text file with a header row."""
+    with open(filepath, "w", newline="") as file:
+        writer = csv.writer(file, delimiter=delimiter)
+        writer.writerow(("Name", "Sequence (5' to 3')", "Color"))
+        writer.writerows(records)
+
+
+@register_exporter("csv", ".csv", "Comma Separated Values")
+def write_csv(records: Iterable[SequenceRecord], filepath: str, title: str) -> None:
+    """Write the records as comma separated values."""
+    _write_delimited(records, filepath, ",")
+
+
+@register_exporter("tsv", ".tsv", "Tab Separated Values")
+def write_tsv(records: Iterable[SequenceRecord], filepath: str, title: str) -> None:
+    """Write the records as tab separated values."""
+    _write_delimited(records, filepath, "\t")
+
+
+@register_exporter("fasta", ".fasta", "FASTA")
+def write_fasta(records: Iterable[SequenceRecord], filepath: str, title: str) -> None:
+    """Write the records as FASTA, with the strand names as the headers."""
+    with open(filepath, "w") as file:
+        for name, sequence, _ in records:
+            file.write(f">{name}\n")
+            for start in range(0, len(sequence), fasta_line_length):
+                file.write(sequence[start : start + fasta_line_length] + "\n")
+
+
+def wells() -> Iterator[Tuple[int, str]]:
+    """
+    Yield the plate number and well position of every well, plate after plate.
+
+    Wells are filled down each column of a 96-well plate (A1, B1, ..., H1, A2, ...).
+
+    Yields:
+        (plate number, well position) tuples, with plates numbered from 1.
+    """
+    plate = 1
+    while True:
+        for column in range(1, plate_columns + 1):
+            for row in plate_rows:
+                yield plate, f"{row}{column}"
+        plate += 1
+
+
+@register_exporter("idt", ".csv", "IDT 96-Well Plate Layout")
+def write_idt_plates(
+    records: Iterable[SequenceRecord], filepath: str, title: str
+) -> None:
+    """Write the records as an IDT plate upload sheet, 96 wells per plate."""
+    with open(filepath, "w", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerow(("Plate Name", "Well Position", "Name", "Sequence"))
+        for (plate, well), (name, sequence, _) in zip(wells(), records):
+            writer.writerow((f"{title} Plate {plate}", well, name, sequence))
+
+
+@register_exporter("xlsx", ".xlsx", "Excel Spreadsheet")
+def write_xlsx(records: Iterable[SequenceRecord], filepath: str, title: str) -> None:
+    """Write the records to a single worksheet of an Excel workbook."""
+    workbook = Workbook(filepath, {"constant_memory": True})
+    try:
+        # Excel limits worksheet names to 31 characters
+        worksheet = workbook.add_worksheet(title[:31] or None)
+        worksheet.set_column(0, 0, 15)
+        worksheet.set_column(1, 1, 50)
+        worksheet.set_column(2, 3, 15)
+
+        bold = workbook.add_format({"bold": True})
+        worksheet.write_row(0, 0, ("Name", "Sequence (5' to 3')", "Color"), bold)
+        for row, record in enumerate(records, start=1):
+            worksheet.write_row(row, 0, record)
+    finally:
+        workbook.close()
@@ -0,0 +1,466 @@
+import logging
+from abc import ABC, abstractmethod
+from collections import deque
+from contextlib import contextmanager
+from copy import deepcopy
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, List, Tuple
+
+from natug import settings
+from natug.structures.events import BASES_CHANGED
+from natug.structures.points import NEMid, Nucleoside
+from natug.structures.points.point import Point
+from natug.structures.points.nick import Nick
+from natug.structures.strands.linkage import Linkage
+from natug.structures.strands.sequencing import assign_bases
+
+if TYPE_CHECKING:
+    from natug.structures.strands.strand import Strand, StrandStyles
+    from natug.structures.strands.strands import Strands
+
+logger = logging.getLogger(__name__)
+
+
+class Command(ABC):
+    """
+    An edit to a Strands container that knows how to reverse itself.
+
+    Commands are recorded by the Strands container after the edit has already been
+    made, so they only need to be able to undo and redo the edit.
+
+    Methods:
+        undo: Reverse the edit.
+        redo: Make the edit again, after it was undone.
+    """
+
+    __slots__ = ()
+
+    #: A human-readable name for the edit.
+    name = "Edit"
+
+    @abstractmethod
+    def undo(self, strands: "Strands") -> None:
+        """Reverse the edit."""
+
+    @abstractmethod
+    def redo(self, strands: "Strands") -> None:
+        """Make the edit again, after it was undone."""
+
+
+def _nick_at(point: NEMid, strands: "Strands") -> Nick:
+    """
+    Find the nick that currently replaces a point.
+
+    Undoing and redoing a nick creates a new Nick object each time, so commands refer
+    to nicks by the point that they replace instead.
+    """
+    for nick in strands.nicks:
+        if nick.original_item is point:
+            return nick
+    raise IndexError(f"There is no nick at {point}.")
+
+
+@dataclass(slots=True)
+class Nicked(Command):
+    """
+    A nick that was created at a point.
+
+    The nick split the point's strand into a strand before the point and a strand
+    after it (the same strand, if the nick opened up a closed strand). Since later
+    edits rebuild strands, each is referred to by its item next to the point, or by
+    the strand itself if it was left empty.
+    """
+
+    point: NEMid
+    before: "Point | Linkage | Strand"
+    after: "Point | Linkage | Strand"
+    closed: bool
+    name = "Nick"
+
+    @classmethod
+    def between(
+        cls, point: NEMid, first: "Strand", second: "Strand", closed: bool
+    ) -> "Nicked":
+        """
+        Record a nick that split a strand into two strands.
+
+        Args:
+            point: The point that was nicked.
+            first: The strand that ends just before the point.
+            second: The strand that begins just after the point.
+            closed: Whether the strand was closed before it was nicked.
+        """
+        return cls(
+            point,
+            first.items[-1] if first.items else first,
+            second.items[0] if second.items else second,
+            closed,
+        )
+
+    def undo(self, strands):
+        first, second = (
+            end.strand if isinstance(end, (Point, Linkage)) else end
+            for end in (self.before, self.after)
+        )
+        strands.rejoin(_nick_at(self.point, strands), first, second, self.closed)
+
+    def redo(self, strands):
+        strands.nick(self.point)
+
+
+@dataclass(slots=True)
+class Unnicked(Command):
+    """A nick that was removed from a point."""
+
+    point: NEMid
+    name = "Unnick"
+
+    def undo(self, strands):
+        strands.nick(self.point)
+
+    def redo(self, strands):
+        strands.unnick(_nick_at(self.point, strands))
+
+
+@dataclass(slots=True)
+class Conjuncted(Command):
+    """
+    A junction that was created or removed between two NEMids.
+
+    Conjuncting the same two NEMids again reverses the junction, so undo and redo
+    are the same operation.
+    """
+
+    NEMid1: NEMid
+    NEMid2: NEMid
+    name = "Junction"
+
+    def undo(self, strands):
+        strands.conjunct(self.NEMid1, self.NEMid2, skip_checks=True)
+
+    def redo(self, strands):
+        strands.conjunct(self.NEMid1, self.NEMid2, skip_checks=True)
+
+
+def linkage_ends(linkage: Linkage) -> Tuple[NEMid, NEMid]:
+    """
+    Find the NEMids that a linkage joins.
+
+    These are the NEMids that were passed to Strands.link() to create the linkage:
+    the nearest NEMids before and after the linkage in its strand, skipping over any
+    nucleosides that trail the ends of the strands that were linked.
+
+    Args:
+        linkage: The linkage to find the ends of.
+
+    Returns:
+        The NEMid before the linkage and the NEMid after it.
+    """
+    items = linkage.strand.items
+    # Linkages are dataclasses that compare by value, so find this one by identity
+    index = next(index for index, item in enumerate(items) if item is linkage)
+
+    def nearest(step: int) -> NEMid:
+        for offset in range(1, len(items)):
+            item = items[(index + step * offset) % len(items)]
+            if isinstance(item, NEMid):
+                return item
+        raise ValueError(f"Linkage {linkage} does not join two NEMids.")
+
+    return nearest(-1), nearest(1)
+
+
+def _linkage_between(NEMid1: NEMid, NEMid2: NEMid) -> Linkage:
+    """
+    Find the linkage that currently joins two NEMids.
+
+    Undoing and redoing a linkage creates a new Linkage object each time, so commands
+    refer to linkages by the NEMids that they join instead.
+    """
+    ends = {id(NEMid1), id(NEMid2)}
+    for linkage in NEMid1.strand.items.by_type(Linkage):
+        if {id(end) for end in linkage_ends(linkage)} == ends:
+            return linkage
+    raise IndexError(f"There is no linkage between {NEMid1} and {NEMid2}.")
+
+
+def _transplant(old: Linkage, new: Linkage) -> None:
+    """Move the nucleosides (and thus bases) of an old linkage onto a new one."""
+    for item in old.items:
+        item.linkage = new
+    new.items = old.items
+    new.resized()
+
+
+@dataclass(slots=True)
+class Linked(Command):
+    """
+    A linkage that was created between the ends of two strands.
+
+    The linkage is the most recent linkage between the NEMids, and is only kept so
+    that its nucleosides can be moved onto the linkage that redoing creates.
+    """
+
+    NEMid1: NEMid
+    NEMid2: NEMid
+    linkage: Linkage
+    name = "Link"
+
+    def undo(self, strands):
+        self.linkage = _linkage_between(self.NEMid1, self.NEMid2)
+        strands.unlink(self.linkage)
+
+    def redo(self, strands):
+        _transplant(self.linkage, strands.link(self.NEMid1, self.NEMid2))
+
+
+@dataclass(slots=True)
+class Unlinked(Command):
+    """
+    A linkage that was removed from between the ends of two strands.
+
+    The linkage is the most recently removed linkage between the NEMids, and is only
+    kept so that its nucleosides can be moved onto the linkage that undoing creates.
+    """
+
+    NEMid1: NEMid
+    NEMid2: NEMid
+    linkage: Linkage
+    name = "Unlink"
+
+    def undo(self, strands):
+        _transplant(self.linkage, strands.link(self.NEMid1, self.NEMid2))
+
+    def redo(self, strands):
+        self.linkage = _linkage_between(self.NEMid1, self.NEMid2)
+        strands.unlink(self.linkage)
+
+
+@dataclass(slots=True)
+class Resized(Command):
+    """The nucleosides of a linkage that were added or removed."""
+
+    NEMid1: NEMid
+    NEMid2: NEMid
+    previous: List[Nucleoside]
+    current: List[Nucleoside]
+    name = "Linkage length"
+
+    def _apply(self, items, strands):
+        linkage = _linkage_between(self.NEMid1, self.NEMid2)
+        for item in items:
+            item.linkage = linkage
+        linkage.items = list(items)
+        linkage.resized()
+        linkage.strand.changed()
+
+    def undo(self, strands):
+        self._apply(self.previous, strands)
+
+    def redo(self, strands):
+        self._apply(self.current, strands)
+
+
+@dataclass(slots=True)
+class Sequenced(Command):
+    """Bases that were changed, including the complementary bases."""
+
+    nucleosides: List[Nucleoside]
+    previous: List[str | None]
+    current: List[str | None]
+    name = "Sequence"
+
+    def undo(self, strands):
+        assign_bases(self.nucleosides, self.previous)
+        strands.events.emit(BASES_CHANGED, strands, nucleosides=self.nucleosides)
+
+    def redo(self, strands):
+        assign_bases(self.nucleosides, self.current)
+        strands.events.emit(BASES_CHANGED, strands, nucleosides=self.nucleosides)
+
+
+@dataclass(slots=True)
+class Restyled(Command):
+    """Styles that were changed for a strand."""
+
+    strand: "Strand"
+    previous: "StrandStyles"
+    current: "StrandStyles"
+    name = "Style"
+
+    def _apply(self, styles, strands):
+        self.strand.styles.color = deepcopy(styles.color)
+        self.strand.styles.thickness = deepcopy(styles.thickness)
+        strands.style()
+        self.strand.changed()
+
+    def undo(self, strands):
+        self._apply(self.previous, strands)
+
+    def redo(self, strands):
+        self._apply(self.current, strands)
+
+
+@dataclass(slots=True)
+class Grouped(Command):
+    """Many edits that are undone and redone together."""
+
+    commands: List[Command] = field(default_factory=list)
+    name = "Edits"
+
+    def undo(self, strands):
+        for command in reversed(self.commands):
+            command.undo(strands)
+
+    def redo(self, strands):
+        for command in self.commands:
+            command.redo(strands)
+
+
+class History:
+    """
+    An in-memory undo/redo history of the edits made to a Strands container.
+
+    Each recorded command holds the inverse of its edit, so undoing and redoing only
+    costs as much as the edit itself. The history belongs to a single Strands
+    container; when the strands are recomputed a new, empty history begins.
+
+    Attributes:
+        since_checkpoint: The number of commands recorded since checkpoint() was last
+            called. Used to decide when to write a snapshot to disk.
+
+    Methods:
+        record: Record a command that was just run.
+        group: Record all the commands run within a block as one command.
+        undo: Undo the most recent command.
+        redo: Redo the most recently undone command.
+        can_undo: Whether there is a command to undo.
+        can_redo: Whether there is a command to redo.
+        checkpoint: Reset since_checkpoint.
+        clear: Forget all commands.
+    """
+
+    def __init__(self, capacity: int = settings.history_capacity):
+        """
+        Initialize a History.
+
+        Args:
+            capacity: The number of commands to remember. The oldest commands are
+                forgotten first.
+        """
+        self._undo = deque(maxlen=capacity)
+        self._redo = []
+        self._groups = []
+        self._replaying = False
+        self.since_checkpoint = 0
+
+    def __len__(self) -> int:
+        return len(self._undo)
+
+    def record(self, command: Command) -> None:
+        """
+        Record a command that was just run.
+
+        Nothing is recorded while a command is being undone or redone, since the
+        edits that it makes are already part of the command.
+
+        Args:
+            command: The command to record.
+        """
+        if self._replaying:
+            return
+        if self._groups:
+            self._groups[-1].commands.append(command)
+            return
+        self._undo.append(command)
+        self._redo.clear()
+        self.since_checkpoint += 1
+
+    @contextmanager
+    def group(self):
+        """Record all the commands run within a block as one command."""
+        self._groups.append(grouped := Grouped())
+        try:
+            yield grouped
+        finally:
+            self._groups.pop()
+            if grouped.commands:
+                self.record(grouped)
+
+    def undo(self, strands: "Strands") -> Command | None:
+        """
+        Undo the most recent command.
+
+        Args:
+            strands: The Strands container that the history belongs to.
+
+        Returns:
+            The command that was undone, or None if there was nothing to undo.
+
+        Raises:
+            Exception: Whatever the command raised while being undone. The history
+                is cleared, since the strands may have been left partly edited.
+        """
+        if not self._undo:
+            return None
+        command = self._undo.pop()
+        self._replaying = True
+        try:
+            command.undo(strands)
+        except Exception:
+            # The command may have been partly undone, so neither it nor the
+            # commands around it can be trusted to replay correctly anymore
+            self.clear()
+            raise
+        finally:
+            self._replaying = False
+        self._redo.append(command)
+        logger.info("Undid %s.", command.name)
+        return command
+
+    def redo(self, strands: "Strands") -> Command | None:
+        """
+        Redo the most recently undone command.
+
+        Args:
+            strands: The Strands container that the history belongs to.
+
+        Returns:
+            The command that was redone, or None if there was nothing to redo.
+
+        Raises:
+            Exception: Whatever the command raised while being redone. The history
+                is cleared, since the strands may have been left partly edited.
+        """
+        if not self._redo:
+            return None
+        command = self._redo.pop()
+        self._replaying = True
+        try:
+            command.redo(strands)
+        except Exception:
+            # The command may have been partly redone, so neither it nor the
+            # commands around it can be trusted to replay correctly anymore
+            self.clear()
+            raise
+        finally:
+            self._replaying = False
+        self._undo.append(command)
+        logger.info("Redid %s.", command.name)
+        return command
+
+    def can_undo(self) -> bool:
+        return bool(self._undo)
+
+    def can_redo(self) -> bool:
+        return bool(self._redo)
+
+    def checkpoint(self) -> None:
+        """Mark that the current state has been written to disk."""
+        self.since_checkpoint = 0
+
+    def clear(self) -> None:
+        """Forget all commands."""
+        self._undo.clear()
+        self._redo.clear()
+        self.since_checkpoint = 0
@@ -1,13 +1,14 @@
 from dataclasses import InitVar, dataclass
 from typing import Iterable, List, Literal, Tuple
-from uuid import uuid1
 
 import numpy as np
 import pandas as pd
 
 from natug import settings
 from natug.constants.directions import DOWN, UP
+from natug.structures.identifiers import Identified, registry
 from natug.structures.points import Nucleoside
+from natug.structures.strands.sequencing import assign_bases
 from natug.ui.plotters.utils import chaikins_corner_cutting
 from natug.utils import rgb_to_hex
 
@@ -47,7 +48,7 @@ class LinkageStyles:
 
 
 @dataclass
-class Linkage:
+class Linkage(Identified):
     """
     A single stranded region between the ends of two strands.
 
@@ -63,12 +64,13 @@ class Linkage:
             initialisation, and the third is the average of the two, with a boost in its
             z coord.
         inflection: Whether the linkage is bent upwards or downwards when plotted.
-        uuid (str): The unique identifier of the linkage. Automatically generated post
-            init.
+        id (int): The identifier of the linkage. Automatically taken from the registry.
+        uuid (str): The uuid of the linkage. Generated when it is first requested.
 
     Methods:
         trim: Trim the linkage to a certain length.
         generate: Generate additional Nucleoside objects, and add them to the linkage.
+        resized: Notify the linkage's strand that the nucleosides changed.
     """
 
     def __init__(
@@ -79,7 +81,6 @@ class Linkage:
         strand: "Strand" = None,  # type: ignore
         items: Iterable[Nucleoside] = None,
         count: int = 6,
-        uuid: str = None,
         styles: LinkageStyles = None,
     ):
         self.inflection = inflection
@@ -106,8 +107,8 @@ class Linkage:
         basic_plot_points = [coord_one, midpoint, coord_two]
         self.plot_points = chaikins_corner_cutting(basic_plot_points, refinements=3)
 
-        # Set the uuid of the linkage.
-        self.uuid = uuid or str(uuid1())
+        self.id = registry.new()
+        self._uuid = None
 
     def generate(self, length: int):
         """
@@ -125,6 +126,7 @@ class Linkage:
             self.items = [Nucleoside(linkage=self) for _ in range(-length)] + self.items
         else:
             self.items += [Nucleoside(linkage=self) for _ in range(length)]
+        self.resized()
 
     def trim(self, length: int):
         """
@@ -138,6 +140,17 @@ class Linkage:
             self.items = list(self.items)[:length]
         else:
             self.items = list(self.items)[length:]
+        self.resized()
+
+    def resized(self) -> None:
+        """
+        Notify the linkage's strand that the nucleosides of the linkage changed.
+
+        The strand caches its unpacked items and nucleoside counts, which include the
+        linkage's nucleosides, so these are discarded.
+        """
+        if self.strand is not None:
+            self.strand.items.invalidate()
 
     @property
     def sequence(self) -> List[Literal["A", "T", "C", "G"]]:
@@ -163,8 +176,10 @@ class Linkage:
                 f"linkage ({len(self)})."
             )
 
-        for nucleoside, base in zip(self, sequence):
-            nucleoside.base = base
+        changed, previous = assign_bases(self.items, sequence)
+        if self.strand is not None:
+            # Let the strand notify listeners and record the change for undoing
+            self.strand._bases_changed(changed, previous)
 
     def __iter__(self):
         return iter(self.items)
@@ -174,12 +189,14 @@ class Linkage:
 
     def __setitem__(self, key, value):
         self.items[key] = value
+        self.resized()
 
     def __getitem__(self, item):
         return self.items[item]
 
     def __delitem__(self, key):
         del self.items[key]
+        self.resized()
 
     def position(self):
         return self.plot_points[1][0], self.plot_points[1][1]
@@ -187,10 +204,12 @@ class Linkage:
     def append(self, item: Nucleoside):
         """Append a point to the linkage."""
         self.items.append(item)
+        self.resized()
 
     def extend(self, items: List[Nucleoside]):
         """Extend the linkage with a list of points."""
         self.items.extend(items)
+        self.resized()
 
 
 def to_df(linkages: Iterable[Linkage]):
@@ -205,7 +224,7 @@ def to_df(linkages: Iterable[Linkage]):
         linkages: The linkages to export.
     """
     data = {
-        "uuid": [],
+        "id": [],
         "data:sequence": [],
         "data:inflection": [],
         "data:coord_one": [],
@@ -220,12 +239,12 @@ def to_df(linkages: Iterable[Linkage]):
         for nucleoside in linkage:
             sequence += nucleoside.base or "X"
 
-        data["uuid"].append(linkage.uuid)
+        data["id"].append(linkage.id)
         data["data:sequence"].append(sequence)
         data["data:inflection"].append(linkage.inflection)
         data["data:coord_one"].append(", ".join(map(str, linkage.plot_points[0])))
         data["data:coord_two"].append(", ".join(map(str, linkage.plot_points[-1])))
-        data["data:strand"].append(linkage.strand.uuid if linkage.strand else None)
+        data["data:strand"].append(linkage.strand.id if linkage.strand else None)
         data["style:color"].append(rgb_to_hex(linkage.styles.color))
         data["style:thickness"].append(linkage.styles.thickness)
 
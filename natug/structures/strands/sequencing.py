@@ -0,0 +1,216 @@
+import logging
+import re
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+import numpy as np
+
+from natug.constants.bases import COMPLEMENTS, DNA
+from natug.structures.points import Nucleoside
+
+logger = logging.getLogger(__name__)
+
+# FASTA headers produced by Strands.export_sequence are of the form ">Strand #3"
+_strand_header = re.compile(r"Strand #(\d+)")
+
+
+@dataclass(slots=True)
+class NucleosideIndex:
+    """
+    A flat index of all the nucleosides in many strands.
+
+    Attributes:
+        nucleosides: All the nucleosides of all the strands, in strand order, and in
+            5' to 3' order within each strand.
+        offsets: A (strand count + 1,) array. The nucleosides of strand i are
+            nucleosides[offsets[i]:offsets[i + 1]].
+        matching: A (nucleoside count,) array mapping each nucleoside's flat index to
+            the flat index of its matching nucleoside, or -1 if it has none.
+
+    Methods:
+        from_strands: Build an index for many strands.
+        strand_nucleosides: The nucleosides of a given strand.
+    """
+
+    nucleosides: List[Nucleoside]
+    offsets: np.ndarray
+    matching: np.ndarray
+
+    @classmethod
+    def from_strands(
+        cls, strands: Iterable["Strand"], pairs: "PairingTable | None" = None
+    ) -> "NucleosideIndex":
+        """
+        Build an index of the nucleosides of many strands.
+
+        Args:
+            strands: The strands to index.
+            pairs: The pairing table of the helices that the strands were built from.
+                If provided, the matching map is computed from it with array
+                operations. Otherwise, each nucleoside's .matching is looked up.
+
+        Returns:
+            The new index.
+        """
+        nucleosides = []
+        offsets = [0]
+        for strand in strands:
+            nucleosides.extend(strand.items.unpacked().by_type(Nucleoside))
+            offsets.append(len(nucleosides))
+
+        if pairs is None:
+            # map each nucleoside to its flat index, and then look up each
+            # nucleoside's matching nucleoside once
+            positions = {id(nucleoside): i for i, nucleoside in enumerate(nucleosides)}
+            matching = np.fromiter(
+                (
+                    positions.get(id(nucleoside.matching), -1)
+                    for nucleoside in nucleosides
+                ),
+                dtype=np.int64,
+                count=len(nucleosides),
+            )
+        else:
+            # map the global (helix) index of each nucleoside to its flat index, and
+            # then send each nucleoside's mate through that map
+            indexes = pairs.indexes(nucleosides)
+            in_table = indexes >= 0
+            flat = np.full(len(pairs), -1, dtype=np.int64)
+            flat[indexes[in_table]] = np.flatnonzero(in_table)
+            mates = np.full(len(nucleosides), -1, dtype=np.int64)
+            mates[in_table] = pairs.mates[indexes[in_table]]
+            matching = np.where(mates >= 0, flat[np.maximum(mates, 0)], -1)
+
+        return cls(nucleosides, np.array(offsets, dtype=np.int64), matching)
+
+    def __len__(self) -> int:
+        return len(self.nucleosides)
+
+    def __iter__(self):
+        return iter(self.nucleosides)
+
+    def strand_nucleosides(self, index: int) -> List[Nucleoside]:
+        """
+        Obtain the nucleosides of a strand.
+
+        Args:
+            index: The index of the strand within the indexed strands.
+
+        Returns:
+            The nucleosides of the strand.
+        """
+        return self.nucleosides[self.offsets[index] : self.offsets[index + 1]]
+
+    def strand_lengths(self) -> np.ndarray:
+        """The number of nucleosides in each indexed strand."""
+        return np.diff(self.offsets)
+
+
+def assign_bases(
+    nucleosides: Sequence[Nucleoside],
+    new_bases: Sequence[str | None],
+    mates: Sequence[Nucleoside | None] = (),
+) -> Tuple[List[Nucleoside], List[str | None]]:
+    """
+    Set the bases of many nucleosides, and restyle them once at the end.
+
+    Setting Nucleoside.base normally restyles the nucleoside immediately. This instead
+    writes all the bases first and then restyles every changed nucleoside once.
+
+    Args:
+        nucleosides: The nucleosides to set the bases of.
+        new_bases: The new base for each nucleoside.
+        mates: The matching nucleoside of each nucleoside, or None for nucleosides
+            without one. Mates are set to the complementary base. If empty, mates
+            are left alone.
+
+    Returns:
+        The nucleosides whose bases actually changed (including mates), and the
+        bases that they had before.
+    """
+    changed = {}
+    previous = {}
+    for nucleoside, base in zip(nucleosides, new_bases):
+        if nucleoside.base != base:
+            previous.setdefault(id(nucleoside), nucleoside.base)
+            object.__setattr__(nucleoside, "base", base)
+            changed[id(nucleoside)] = nucleoside
+    for mate, base in zip(mates, new_bases):
+        # nicks stand in for nucleosides in helices, but don't have their own bases
+        if isinstance(mate, Nucleoside) and mate.base != COMPLEMENTS[base]:
+            previous.setdefault(id(mate), mate.base)
+            object.__setattr__(mate, "base", COMPLEMENTS[base])
+            changed[id(mate)] = mate
+
+    for nucleoside in changed.values():
+        if nucleoside.styles is not None and nucleoside.strand is not None:
+            nucleoside.styles.reset()
+
+    logger.debug("Assigned bases to %s nucleosides.", len(changed))
+    return list(changed.values()), list(previous.values())
+
+
+def parse_sequences(text: str) -> List[Tuple[str | None, List[str]]]:
+    """
+    Parse sequences from FASTA or plain text.
+
+    FASTA records begin with a ">" header line, and the sequence may be wrapped over
+    many lines. In plain text every non-empty line is a separate sequence. Blank
+    characters are ignored, and bases are upper-cased.
+
+    Args:
+        text: The text to parse.
+
+    Returns:
+        A list of (name, bases) tuples. Names are None for plain text sequences.
+
+    Raises:
+        ValueError: If a sequence contains characters that are not bases.
+    """
+    records: List[Tuple[str | None, List[str]]] = []
+
+    if text.lstrip().startswith(">"):
+        for line in text.splitlines():
+            line = line.strip()
+            if line.startswith(">"):
+                records.append((line[1:].strip(), []))
+            elif line and not line.startswith(";"):
+                records[-1][1].extend(line)
+    else:
+        for line in text.splitlines():
+            line = "".join(line.split())
+            if line:
+                records.append((None, list(line)))
+
+    for position, (name, bases) in enumerate(records):
+        for index, base in enumerate(bases):
+            bases[index] = base.upper()
+            if bases[index] not in DNA:
+                raise ValueError(
+                    f"Invalid base {base!r} in sequence {name or position + 1}. "
+                    f"Sequences must only consist of {DNA}."
+                )
+
+    return records
+
+
+def sequences_by_strand(
+    records: List[Tuple[str | None, List[str]]]
+) -> Dict[int, List[str]]:
+    """
+    Determine which strand each parsed sequence belongs to.
+
+    Records named like "Strand #3" (as written by Strands.export_sequence) go to that
+    strand. All other records are assigned to strands in the order that they appear.
+
+    Args:
+        records: The records obtained from parse_sequences.
+
+    Returns:
+        A dictionary mapping strand indexes to sequences.
+    """
+    output = {}
+    for position, (name, bases) in enumerate(records):
+        match = _strand_header.fullmatch(name) if name else None
+        output[int(match.group(1)) if match else position] = bases
+    return output
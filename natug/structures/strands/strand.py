@@ -3,17 +3,20 @@ import logging
 import random
 from copy import copy, deepcopy
 from dataclasses import dataclass, field
-from typing import Iterable, Iterator, List, Set, Tuple, Type
-from uuid import uuid1
+from typing import Dict, Iterable, Iterator, List, Set, Tuple, Type
 
 import pandas as pd
 
 from natug.constants.bases import DNA
 from natug.constants.directions import *
+from natug.structures.events import BASES_CHANGED, STRAND_MODIFIED, EventBus
+from natug.structures.identifiers import Identified, registry
 from natug.structures.points import NEMid, Nucleoside
 from natug.structures.points.point import Point
 from natug.structures.profiles import NucleicAcidProfile
+from natug.structures.strands.history import Sequenced
 from natug.structures.strands.linkage import Linkage
+from natug.structures.strands.sequencing import assign_bases
 from natug.structures.strands.utils import shuffled
 from natug.utils import rgb_to_hex
 
@@ -121,13 +124,145 @@ class StrandStyles:
         )
 
 
+@dataclass(slots=True)
+class ItemStats:
+    """
+    Aggregates of the items of a strand.
+
+    Only Points that are directly in the items count towards the bounding box,
+    directions, and domains, since those are what the strand is drawn through.
+
+    Attributes:
+        points: The number of Points in the items.
+        x_min: The minimum x coordinate of the points, or inf if there are none.
+        x_max: The maximum x coordinate of the points, or -inf if there are none.
+        z_min: The minimum z coordinate of the points, or inf if there are none.
+        z_max: The maximum z coordinate of the points, or -inf if there are none.
+        directions: The number of NEMids whose direction is falsy and truthy, in
+            that order.
+        domains: The number of points in each domain, by domain index.
+        linkages: The number of Linkages in the items.
+        nucleosides: The number of Nucleosides in the items, including the
+            nucleosides within linkages.
+        linkage_nucleosides: The number of nucleosides within linkages.
+
+    Methods:
+        of: Compute the aggregates of some items.
+        add: Include an item in the aggregates.
+        discard: Exclude an item from the aggregates, if possible.
+    """
+
+    points: int = 0
+    x_min: float = float("inf")
+    x_max: float = float("-inf")
+    z_min: float = float("inf")
+    z_max: float = float("-inf")
+    directions: List[int] = field(default_factory=lambda: [0, 0])
+    domains: Dict[int, int] = field(default_factory=dict)
+    linkages: int = 0
+    nucleosides: int = 0
+    linkage_nucleosides: int = 0
+
+    @classmethod
+    def of(cls, items: Iterable) -> "ItemStats":
+        """
+        Compute the aggregates of some items.
+
+        Args:
+            items: The items to compute the aggregates of.
+
+        Returns:
+            The aggregates of the items.
+        """
+        stats = cls()
+        for item in items:
+            stats.add(item)
+        return stats
+
+    def add(self, item) -> None:
+        """
+        Include an item in the aggregates.
+
+        Args:
+            item: The item that was added to the items.
+        """
+        if isinstance(item, Linkage):
+            self.linkages += 1
+            self.nucleosides += len(item.items)
+            self.linkage_nucleosides += len(item.items)
+            return
+        if not isinstance(item, Point):
+            return
+
+        self.points += 1
+        if item.x_coord is not None:
+            self.x_min = min(self.x_min, item.x_coord)
+            self.x_max = max(self.x_max, item.x_coord)
+        if item.z_coord is not None:
+            self.z_min = min(self.z_min, item.z_coord)
+            self.z_max = max(self.z_max, item.z_coord)
+        if isinstance(item, NEMid):
+            self.directions[bool(item.direction)] += 1
+        elif isinstance(item, Nucleoside):
+            self.nucleosides += 1
+        if item.domain is not None:
+            self.domains[item.domain.index] = self.domains.get(item.domain.index, 0) + 1
+
+    def discard(self, item) -> bool:
+        """
+        Exclude an item from the aggregates, if possible.
+
+        Counts can always be decremented, but the bounding box can't shrink without
+        knowing the remaining points, so items on its edge can't be discarded.
+
+        Args:
+            item: The item that was removed from the items.
+
+        Returns:
+            Whether the aggregates are still accurate. If not, they must be
+            recomputed.
+        """
+        if isinstance(item, Linkage):
+            self.linkages -= 1
+            self.nucleosides -= len(item.items)
+            self.linkage_nucleosides -= len(item.items)
+            return True
+        if not isinstance(item, Point):
+            return True
+        if item.x_coord in (self.x_min, self.x_max) or item.z_coord in (
+            self.z_min,
+            self.z_max,
+        ):
+            return False
+
+        self.points -= 1
+        if isinstance(item, NEMid):
+            self.directions[bool(item.direction)] -= 1
+        elif isinstance(item, Nucleoside):
+            self.nucleosides -= 1
+        if item.domain is not None:
+            self.domains[item.domain.index] -= 1
+            if not self.domains[item.domain.index]:
+                del self.domains[item.domain.index]
+        return True
+
+
 class StrandItems(list):
     """
     A container for the items in a Strand.
 
-    This is a subclass of deque with various utility methods.
+    This is a subclass of list with various utility methods. Aggregates of the items
+    (see ItemStats) are cached, and kept up to date as items are added and removed
+    through the list methods. The items are also partitioned by their exact type, and
+    the partitions, filtered, and unpacked versions of the items are cached views that
+    grow as items are appended. Other changes discard the views until next needed.
 
     Methods:
+        stats: Obtain the cached aggregates of the items.
+        partitions: Obtain the items partitioned by their exact type.
+        first_of: Obtain the first item of an exact type.
+        last_of: Obtain the last item of an exact type.
+        invalidate: Discard the cached aggregates and views.
         NEMids: A list of all the NEMids in the StrandItems.
         nucleosides: A list of all the nucleosides in the StrandItems.
         unpacked: A list of all the items in the StrandItems where all iterables are
@@ -137,6 +272,169 @@ class StrandItems(list):
         item_types: A list of all the types of items in the StrandItems.
     """
 
+    def __init__(self, items: Iterable = ()):
+        super().__init__(items)
+        self._stats: ItemStats | None = None
+        self._partitions: Dict[Type, StrandItems] | None = None
+        self._views: Dict[Tuple[Type, ...], StrandItems] = {}
+        self._unpacked: StrandItems | None = None
+
+    def __copy__(self) -> "StrandItems":
+        return StrandItems(self)
+
+    def stats(self) -> ItemStats:
+        """
+        Obtain the cached aggregates of the items.
+
+        The aggregates are computed in one pass the first time they are needed, and
+        then updated as items are added and removed.
+
+        Returns:
+            The aggregates of the items.
+        """
+        if self._stats is None:
+            self._stats = ItemStats.of(self)
+        return self._stats
+
+    def partitions(self) -> Dict[Type, "StrandItems"]:
+        """
+        Obtain the items partitioned by their exact type.
+
+        The partitions are built in one pass the first time they are needed, and then
+        kept up to date as items are added to (or popped from) the end of the items.
+
+        Returns:
+            The items of each type, in order, by type. Must not be modified.
+        """
+        if self._partitions is None:
+            partitions = {}
+            for item in self:
+                partitions.setdefault(type(item), StrandItems()).append(item)
+            self._partitions = partitions
+        return self._partitions
+
+    def invalidate(self) -> None:
+        """
+        Discard the cached aggregates and views.
+
+        This must be called when the items change without going through the list
+        methods, for example when the nucleosides of a linkage change.
+        """
+        self._stats = None
+        self._drop_views()
+
+    def _drop_views(self) -> None:
+        self._partitions = None
+        if self._views:
+            self._views = {}
+        self._unpacked = None
+
+    def _grow_views(self, items: Iterable) -> None:
+        """Add items that were appended to the end of the items to the views."""
+        for item in items:
+            if self._partitions is not None:
+                self._partitions.setdefault(type(item), StrandItems()).append(item)
+            for types, view in self._views.items():
+                if isinstance(item, types):
+                    view.append(item)
+            if self._unpacked is not None:
+                if isinstance(item, Iterable):
+                    self._unpacked.extend(item)
+                else:
+                    self._unpacked.append(item)
+
+    def _shrink_views(self, item) -> None:
+        """Remove an item that was popped from the end of the items from the views."""
+        if self._partitions is not None:
+            partition = self._partitions[type(item)]
+            partition.pop()
+            if not partition:
+                del self._partitions[type(item)]
+        for types, view in self._views.items():
+            if isinstance(item, types):
+                view.pop()
+        if isinstance(item, Iterable):
+            self._unpacked = None
+        elif self._unpacked is not None:
+            self._unpacked.pop()
+
+    def _discard(self, item) -> None:
+        if self._stats is not None and not self._stats.discard(item):
+            self._stats = None
+
+    def append(self, item) -> None:
+        super().append(item)
+        self._grow_views((item,))
+        if self._stats is not None:
+            self._stats.add(item)
+
+    def extend(self, items: Iterable) -> None:
+        start = len(self)
+        super().extend(items)
+        added = tuple(itertools.islice(self, start, None))
+        self._grow_views(added)
+        if self._stats is not None:
+            for item in added:
+                self._stats.add(item)
+
+    def __iadd__(self, items: Iterable) -> "StrandItems":
+        self.extend(items)
+        return self
+
+    def insert(self, index: int, item) -> None:
+        super().insert(index, item)
+        self._drop_views()
+        if self._stats is not None:
+            self._stats.add(item)
+
+    def remove(self, item) -> None:
+        super().remove(item)
+        self._drop_views()
+        self._discard(item)
+
+    def pop(self, index: int = -1):
+        at_end = index in (-1, len(self) - 1)
+        item = super().pop(index)
+        if at_end:
+            self._shrink_views(item)
+        else:
+            self._drop_views()
+        self._discard(item)
+        return item
+
+    def clear(self) -> None:
+        super().clear()
+        self._drop_views()
+        self._stats = ItemStats()
+
+    def reverse(self) -> None:
+        super().reverse()
+        self._drop_views()
+
+    def sort(self, *args, **kwargs) -> None:
+        super().sort(*args, **kwargs)
+        self._drop_views()
+
+    def __setitem__(self, key, value) -> None:
+        self._drop_views()
+        if isinstance(key, slice):
+            super().__setitem__(key, value)
+            self._stats = None
+        else:
+            self._discard(self[key])
+            super().__setitem__(key, value)
+            if self._stats is not None:
+                self._stats.add(value)
+
+    def __delitem__(self, key) -> None:
+        self._drop_views()
+        if isinstance(key, slice):
+            super().__delitem__(key)
+            self._stats = None
+        else:
+            self._discard(self[key])
+            super().__delitem__(key)
+
     def by_type(self, *types) -> "StrandItems":
         """
         Obtain a list of all the items of a specific type.
@@ -147,8 +445,44 @@ class StrandItems(list):
                 function call as arguments.
         Returns:
             list: A list of all the items of the specified type.
+
+        Notes:
+            The list is a copy of a cached view that is kept up to date as items are
+            appended, so it can be modified freely. When the items of only one exact
+            type match, the partition of that type is copied without any scanning.
+        """
+        matches = [
+            partition
+            for type_, partition in self.partitions().items()
+            if issubclass(type_, types)
+        ]
+        if len(matches) == 1:
+            return StrandItems(matches[0])
+        view = self._views.get(types)
+        if view is None:
+            view = StrandItems(item for item in self if isinstance(item, types))
+            self._views[types] = view
+        return StrandItems(view)
+
+    def first_of(self, type_: Type):
         """
-        return StrandItems((item for item in self if isinstance(item, types)))
+        Obtain the first item of an exact type, or None if there isn't one.
+
+        Args:
+            type_: The exact type of the item. Subclasses don't count.
+        """
+        partition = self.partitions().get(type_)
+        return partition[0] if partition else None
+
+    def last_of(self, type_: Type):
+        """
+        Obtain the last item of an exact type, or None if there isn't one.
+
+        Args:
+            type_: The exact type of the item. Subclasses don't count.
+        """
+        partition = self.partitions().get(type_)
+        return partition[-1] if partition else None
 
     def __add__(self, other):
         new_strand_items = self
@@ -185,14 +519,19 @@ class StrandItems(list):
         Returns:
             list: A list of all the items in the StrandItems where all iterables are
             unpacked.
+
+        Notes:
+            The list is cached until the items change, so it must not be modified.
         """
-        unpacked = []
-        for item in self:
-            if isinstance(item, Iterable):
-                unpacked.extend(item)
-            else:
-                unpacked.append(item)
-        return StrandItems(unpacked)
+        if self._unpacked is None:
+            unpacked = []
+            for item in self:
+                if isinstance(item, Iterable):
+                    unpacked.extend(item)
+                else:
+                    unpacked.append(item)
+            self._unpacked = StrandItems(unpacked)
+        return self._unpacked
 
     def item_types(self) -> Set[Type]:
         """
@@ -204,7 +543,7 @@ class StrandItems(list):
         return set([type(item) for item in self])
 
 
-class Strand:
+class Strand(Identified):
     """
     A strand of items.
 
@@ -227,8 +566,11 @@ class Strand:
         cross_screen: Whether the strand wraps around the screen in the side view plot.
             This is automatically set during plotting with the SideViewPlotter, but can be
             set manually.
-        uuid (str): The unique identifier of the strand. This is automatically
-            generated.
+        id (int): The identifier of the strand. Automatically taken from the
+            registry.
+        uuid (str): The uuid of the strand. Generated when it is first requested.
+        events: The event bus that STRAND_MODIFIED and BASES_CHANGED events are
+            emitted on. Events are forwarded to the strands container's bus.
 
     Methods:
         append(item): Add an item to the right of the strand.
@@ -254,7 +596,9 @@ class Strand:
         startswith(point): Determine whether the strand starts with a point.
         endswith(point): Determine whether the strand ends with a point.
         has_linkage(): Determine whether the strand has any linkages.
+        nucleoside_count(): The number of nucleosides in the strand.
         clear(): Clear the strand.
+        changed(kind): Notify listeners that the strand changed.
     """
 
     def __init__(
@@ -268,10 +612,10 @@ class Strand:
         strands=None,
         helix=None,
         cross_screen=None,
-        uuid: str = None,
     ):
         self.name = name
-        self.uuid = uuid or str(uuid1())
+        self.id = registry.new()
+        self._uuid = None
         self.items = StrandItems() if items is None else StrandItems(items)
         self.closed = closed
         self.helix = helix
@@ -284,6 +628,7 @@ class Strand:
         self.direction = direction
         self.strands = strands
         self.cross_screen = cross_screen
+        self.events = EventBus()
 
     def __post_init__(self):
         self.items = StrandItems(self.items)
@@ -294,11 +639,10 @@ class Strand:
         if self.styles.strand is None:
             self.styles.strand = self
 
-        self.uuid = str(uuid1())
-
     def __len__(self) -> int:
-        """Obtain number of items in strand."""
-        return len(self.items.unpacked())
+        """Obtain number of items in strand, counting each nucleoside of linkages."""
+        stats = self.items.stats()
+        return len(self.items) - stats.linkages + stats.linkage_nucleosides
 
     def __contains__(self, item) -> bool:
         """Determine whether item is in strand."""
@@ -331,6 +675,25 @@ class Strand:
             point.styles = copy(point.styles)
         return new_strand
 
+    def changed(self, kind: str = STRAND_MODIFIED, **data) -> None:
+        """
+        Notify listeners that the strand changed.
+
+        The event is emitted on the strand's bus, and then on the bus of the strands
+        container (if there is one) with the strand attached. Modifications also
+        discard the cached aggregates of the items, since they may have changed in
+        ways that the items can't see (such as a linkage being resized).
+
+        Args:
+            kind: The kind of change. Defaults to STRAND_MODIFIED.
+            **data: Details about the change.
+        """
+        if kind == STRAND_MODIFIED:
+            self.items.invalidate()
+        self.events.emit(kind, self, **data)
+        if self.strands is not None:
+            self.strands.events.emit(kind, self.strands, strand=self, **data)
+
     def clear(self) -> None:
         """Clear the strand."""
         self.items.clear()
@@ -523,44 +886,60 @@ class Strand:
 
     def has_linkage(self) -> bool:
         """Determine whether the strand has any linkages."""
-        for item in self.items:
-            if isinstance(item, Linkage):
-                return True
-        return False
+        return self.items.stats().linkages > 0
+
+    def nucleoside_count(self) -> int:
+        """The number of nucleosides in the strand, including those of linkages."""
+        return self.items.stats().nucleosides
 
     @property
     def sequence(self):
         return [
-            nucleoside.base
-            for nucleoside in StrandItems(self.items.unpacked()).by_type(Nucleoside)
+            nucleoside.base for nucleoside in self.items.unpacked().by_type(Nucleoside)
         ]
 
     @sequence.setter
     def sequence(self, new_sequence: List[str]):
         logger.debug(f"Setting sequence of %s to %s", self.name, new_sequence)
-        nucleosides = self.items.unpacked().by_type(Nucleoside)
-
-        if len(new_sequence) == len(self.sequence):
-            for index, base in enumerate(new_sequence):
-                our_nucleoside = nucleosides[index]
-                our_nucleoside.base = base
-
-                matching_nucleoside = our_nucleoside.matching
-                if matching_nucleoside:
-                    matching_nucleoside.base = our_nucleoside.complement
-        else:
+        if len(new_sequence) != self.nucleoside_count():
             raise ValueError(
                 f"Length of the new sequence ({len(new_sequence)}) must"
-                + f"match number of nucleosides in strand ({len(self)})"
+                + f"match number of nucleosides in strand ({self.nucleoside_count()})"
             )
 
+        nucleosides = self.items.unpacked().by_type(Nucleoside)
+        self._bases_changed(
+            *assign_bases(nucleosides, new_sequence, self._mates(nucleosides))
+        )
+
+    def _bases_changed(
+        self, changed: List[Nucleoside], previous: List[str | None]
+    ) -> None:
+        """Notify listeners of changed bases, and record the change for undoing."""
+        if not changed:
+            return
+        self.changed(BASES_CHANGED, nucleosides=changed)
+        if self.strands is not None:
+            current = [nucleoside.base for nucleoside in changed]
+            self.strands.history.record(Sequenced(changed, previous, current))
+
+    def _mates(self, nucleosides: Iterable[Nucleoside]) -> List[Nucleoside | None]:
+        """
+        Obtain the matching nucleoside of each of many nucleosides.
+
+        The pairing table of the strands container is used when there is one.
+        """
+        pairs = getattr(self.strands, "pairs", None)
+        if pairs is None:
+            return [nucleoside.matching for nucleoside in nucleosides]
+        return pairs.mates_of(nucleosides)
+
     @property
     def complements(self):
-        output = [
-            nucleoside.matching.base if nucleoside.matching is not None else None
-            for nucleoside in StrandItems(self.items.unpacked()).by_type(Nucleoside)
+        return [
+            mate.base if mate is not None else None
+            for mate in self._mates(self.items.unpacked().by_type(Nucleoside))
         ]
-        return output
 
     def has_complements(self):
         """
@@ -568,8 +947,8 @@ class Strand:
         is present (True) or not (False).
         """
         return [
-            nucleoside.matching is not None
-            for nucleoside in StrandItems(self.items.unpacked()).by_type(Nucleoside)
+            mate is not None
+            for mate in self._mates(self.items.unpacked().by_type(Nucleoside))
         ]
 
     @staticmethod
@@ -595,16 +974,25 @@ class Strand:
                 to a random nucleoside. If overwrite is True then all nucleosides
                 will be set to a random nucleoside.
         """
-        for nucleoside in self.items.unpacked().by_type(Nucleoside):
-            if overwrite or nucleoside.base is None:
-                nucleoside.base = random.choice(DNA)
-                if nucleoside.matching is not None:
-                    nucleoside.matching.complement = nucleoside.base
+        nucleosides = self.items.unpacked().by_type(Nucleoside)
+        mates = self._mates(nucleosides)
+        targets = [
+            (nucleoside, mate)
+            for nucleoside, mate in zip(nucleosides, mates)
+            if overwrite or nucleoside.base is None
+        ]
+        self._bases_changed(
+            *assign_bases(
+                [nucleoside for nucleoside, _ in targets],
+                [random.choice(DNA) for _ in targets],
+                [mate for _, mate in targets],
+            )
+        )
 
     def clear_sequence(self) -> None:
         """Clear the sequence of the strand."""
-        for nucleoside in self.items.by_type(Nucleoside):
-            nucleoside.base = None
+        nucleosides = self.items.by_type(Nucleoside)
+        self._bases_changed(*assign_bases(nucleosides, [None] * len(nucleosides)))
 
     def index(self, item) -> int | None:
         """Determine the index of an item."""
@@ -656,52 +1044,31 @@ class Strand:
 
     def up_strand(self) -> bool:
         """Whether the strand is an up strand."""
-        checks = [bool(NEMid_.direction) for NEMid_ in self.items.by_type(NEMid)]
-        return all(checks)
+        return not self.items.stats().directions[False]
 
     def down_strand(self) -> bool:
         """Whether the strand is a down strand."""
-        checks = [(not bool(NEMid_.direction)) for NEMid_ in self.items.by_type(NEMid)]
-        return all(checks)
+        return not self.items.stats().directions[True]
 
     def interdomain(self) -> bool:
-        """Whether all the items in this strand belong to the same domain."""
-        from natug.structures.domains import Domain
-
-        try:
-            points = self.items.by_type(Point)
-            checker = None
-
-            # Find the first domain that shows up in the strand to use as a checker
-            for item in points:
-                if isinstance(item.domain, Domain):
-                    checker = item.domain
-                    break
-
-            # Make sure that every other domain is the same as the checker
-            for item in points:
-                if item.domain != checker and item.domain is not None:
-                    return True
-        except IndexError:
-            return False
-
-        return False
+        """Whether the items in this strand belong to more than one domain."""
+        return len(self.items.stats().domains) > 1
 
     def y_min(self) -> float:
-        """The minimum y-coordinate of the strand."""
-        return min([item.z_coord for item in self.items if isinstance(item, Point)])
+        """The minimum y-coordinate of the strand, or inf if it has no points."""
+        return self.items.stats().z_min
 
     def y_max(self) -> float:
-        """The maximum y-coordinate of the strand."""
-        return max([item.z_coord for item in self.items if isinstance(item, Point)])
+        """The maximum y-coordinate of the strand, or -inf if it has no points."""
+        return self.items.stats().z_max
 
     def x_min(self) -> float:
-        """The minimum x-coordinate of the strand."""
-        return min([item.x_coord for item in self.items if isinstance(item, Point)])
+        """The minimum x-coordinate of the strand, or inf if it has no points."""
+        return self.items.stats().x_min
 
     def x_max(self) -> float:
-        """Obtain the maximum x-coordinate of the strand."""
-        return max([item.x_coord for item in self.items if isinstance(item, Point)])
+        """Obtain the maximum x-coordinate of the strand, or -inf if it has none."""
+        return self.items.stats().x_max
 
     def height(self) -> float:
         """The height of the strand in nanometers."""
@@ -737,7 +1104,7 @@ def to_df(strands: Iterable[Strand]) -> pd.DataFrame:
     """
     data = {
         "data:items": [],
-        "uuid": [],
+        "id": [],
         "name": [],
         "data:closed": [],
         "data:nucleic_acid_profile": [],
@@ -747,11 +1114,11 @@ def to_df(strands: Iterable[Strand]) -> pd.DataFrame:
     }
 
     for strand in strands:
-        data["uuid"].append(strand.uuid)
+        data["id"].append(strand.id)
         data["name"].append(strand.name)
         data["data:closed"].append(strand.closed)
         data["data:nucleic_acid_profile"].append(strand.nucleic_acid_profile.uuid)
-        data["data:items"].append("; ".join([item.uuid for item in strand.items]))
+        data["data:items"].append("; ".join([str(item.id) for item in strand.items]))
         data["style:thickness"].append(strand.styles.thickness.as_str())
         data["style:color"].append(strand.styles.color.as_str(valuemod=rgb_to_hex))
         data["style:highlighted"].append(strand.styles.highlighted)
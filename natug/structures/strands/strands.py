@@ -1,25 +1,69 @@
 import itertools
 import logging
+import os
 from collections import deque
 from copy import copy, deepcopy
 from functools import partial
-from typing import Generator, Iterable, List, Literal, Tuple
+from typing import (
+    Callable,
+    Dict,
+    Generator,
+    Iterable,
+    List,
+    Literal,
+    Sequence,
+    Tuple,
+)
 from uuid import uuid1
 
-import pandas as pd
-from pandas import ExcelWriter
+import numpy as np
 from PyQt6.QtCore import QTimer
 from xlsxwriter import Workbook
 
 from natug import settings
+from natug.constants.bases import COMPLEMENTS, DNA
 from natug.constants.directions import DOWN, UP
-from natug.structures.points import NEMid
+from natug.structures.events import (
+    BASES_CHANGED,
+    REPLACED,
+    STRAND_ADDED,
+    STRAND_REMOVED,
+    EventBus,
+    batch_events,
+)
+from natug.structures.points import NEMid, Nucleoside
 from natug.structures.points.nick import Nick
 from natug.structures.points.point import Point
 from natug.structures.profiles import NucleicAcidProfile
+from natug.structures.strands import exporters
+from natug.structures.strands.bulk import (
+    is_junction,
+    link_mate,
+    neighbors,
+    relink,
+    repeat_targets,
+    split_items,
+)
+from natug.structures.strands.exporters import SequenceRecord
+from natug.structures.strands.history import (
+    Conjuncted,
+    History,
+    Linked,
+    Nicked,
+    Sequenced,
+    Unlinked,
+    Unnicked,
+    linkage_ends,
+)
 from natug.structures.strands.linkage import Linkage
+from natug.structures.strands.sequencing import (
+    NucleosideIndex,
+    assign_bases,
+    parse_sequences,
+    sequences_by_strand,
+)
 from natug.structures.strands.strand import Strand, StrandItems
-from natug.utils import rgb_to_hex, show_in_file_explorer
+from natug.utils import Timer, rgb_to_hex, show_in_file_explorer
 
 logger = logging.getLogger(__name__)
 
@@ -28,9 +72,14 @@ class Strands:
     """
     A container for multiple strands.
 
+    The strands are indexed by identity, so membership checks, indexing, and removal
+    don't scale with the number of strands. Points are looked up through their strand
+    attribute, which the strand operations keep up to date.
+
     Attributes:
         nucleic_acid_profile: The nucleic acid settings for the strands container.
-        strands: The actual strands.
+        strands: The actual strands, in order. This list must not be modified
+            directly; use append(), extend() and remove() instead.
         up_strands: All up strands.
         down_strands: All down strands.
         nicks: All Nick objects within the strand. Automatically managed when nicking.
@@ -38,15 +87,22 @@ class Strands:
         size: The width and height of the domains when they are all laid next to one
             another.
         uuid: A unique identifier for the strands object. Automatically generated.
+        events: The event bus that changes to the strands are emitted on. Changes to
+            individual strands are forwarded here too.
+        history: The in-memory undo/redo history of the edits made to the strands.
 
     Methods:
         update: Update the strands object in-place with another Strands object.
         items: Obtain a list of all points and linkages in the container.
         nick: Nick the strands at the given point (split the strand into two).
         unnick: Unnick the strands at the given nick (merge the two strands).
+        rejoin: Remove a nick by joining two given strands back together.
+        sequence_records: Obtain the name, sequence, and color of each strand.
         export_sequence: Export the sequence of all the strands to a file.
         randomize_sequences: Randomize the sequences of all strands.
         clear_sequences: Clear the sequences of all strands.
+        set_sequences: Set the sequences of many strands at once.
+        import_sequences: Set the sequences of strands from a FASTA or text file.
         index: Obtain the index of a strand.
         append: Append a strand to the strands object.
         extend: Extend the strands object with a list of new Strands objects.
@@ -55,6 +111,7 @@ class Strands:
         link: Create a linkage between two endpoint NEMids.
         unlink: Remove a linkage between two endpoint NEMids.
         conjunct: Create a cross-strand or same-strand junction between two NEMids.
+        do_many: Run an action on many points at once.
         to_json: Convert the strands object to a JSON serializable dictionary.
         write_worksheets: Write all the strands and their items to an excel
             workbook's worksheet.
@@ -63,6 +120,17 @@ class Strands:
             by the SideViewPlotter, but can be set manually for strands.
     """
 
+    #: The actions that do_many can run.
+    bulk_actions = (
+        "nick",
+        "unnick",
+        "highlight",
+        "conjunct",
+        "unjunct",
+        "link",
+        "set base",
+    )
+
     def __init__(
         self,
         nucleic_acid_profile: NucleicAcidProfile,
@@ -84,32 +152,79 @@ class Strands:
         self.name = name
         self.uuid = uuid or str(uuid1())
         self.nucleic_acid_profile = nucleic_acid_profile
-        self.strands = list(strands)
+
+        # The strands by identity, in order, and caches of their order as a list and of
+        # their indexes, which are rebuilt lazily after strands are removed
+        self._strands: Dict[int, Strand] = {}
+        self._listed: List[Strand] | None = None
+        self._indexes: Dict[int, int] | None = None
+        self.strands = strands
 
         # Create various containers
         self.nicks = []
 
+        # Listeners are notified of changes to the strands through the event bus
+        self.events = EventBus()
+
+        # Edits to the strands are recorded so that they can be undone in memory
+        self.history = History()
+
         # Assign the strands attribute of all strands to this object
         for strand in self.strands:
             strand.strands = self
 
         # If this class is initialized with a list of strands, then there are no double
-        # helices to store
+        # helices to store (DoubleHelices.strands() sets this after the fact)
         self.double_helices = None
 
+    @property
+    def pairs(self) -> "PairingTable | None":
+        """
+        The pairing table of the double helices that the strands were built from.
+
+        Returns:
+            The pairing table, or None if there is none.
+        """
+        return getattr(self.double_helices, "pairs", None)
+
+    def _mates(self, nucleosides: Iterable[Nucleoside]) -> List[Nucleoside | None]:
+        """
+        Obtain the matching nucleoside of each of many nucleosides.
+
+        The pairing table is used when there is one.
+        """
+        if self.pairs is None:
+            return [nucleoside.matching for nucleoside in nucleosides]
+        return self.pairs.mates_of(nucleosides)
+
+    @property
+    def strands(self) -> List[Strand]:
+        """The strands, in order."""
+        if self._listed is None:
+            self._listed = list(self._strands.values())
+        return self._listed
+
+    @strands.setter
+    def strands(self, strands: Iterable[Strand]) -> None:
+        """Replace all the strands."""
+        self._strands = {id(strand): strand for strand in strands}
+        self._invalidate()
+
+    def _invalidate(self) -> None:
+        """Forget the cached order of the strands, after it changed."""
+        self._listed = None
+        self._indexes = None
+
     def __contains__(self, item):
         """Check if a strand or point is contained within this container."""
-        if item in self.strands:
+        if id(item) in self._strands:
             return True
-        else:
-            for strand in self.strands:
-                for item_ in strand:
-                    if item_ is item:
-                        return True
+        strand = getattr(item, "strand", None)
+        return strand is not None and id(strand) in self._strands
 
     def __len__(self):
         """Obtain the number of strands this Strands object contains."""
-        return len(self.strands)
+        return len(self._strands)
 
     def __getitem__(self, item):
         """Obtain a strand by index."""
@@ -117,11 +232,15 @@ class Strands:
 
     def __setitem__(self, key, value):
         """Set a strand at a given index."""
-        self.strands[key] = value
+        strands = self.strands.copy()
+        strands[key] = value
+        self.strands = strands
 
     def __delitem__(self, key):
         """Delete a strand by index."""
-        del self.strands[key]
+        strands = self.strands[key]
+        for strand in strands if isinstance(key, slice) else (strands,):
+            self.remove(strand)
 
     def __iter__(self):
         """Iterate over all strands."""
@@ -152,9 +271,12 @@ class Strands:
         self.nucleic_acid_profile = other.nucleic_acid_profile
 
         self.strands = other.strands
+        self.double_helices = other.double_helices
         for strand in self.strands:
             strand.strands = self
 
+        self.events.emit(REPLACED, self)
+
     def items(self, type_restriction=object) -> Generator:
         """
         Obtain a list of all points and linkages in the container.
@@ -172,6 +294,7 @@ class Strands:
             for item in strand.items.by_type(type_restriction):
                 yield item
 
+    @batch_events
     def nick(self, point: Point, style: bool = True) -> None:
         """
         Nick the strands at the given point (split the strand into two).
@@ -189,7 +312,7 @@ class Strands:
         strand = point.strand
 
         # Check if the strand is in this container.
-        if strand not in self.strands:
+        if strand not in self:
             raise ValueError(
                 f"The point's strands is not a strand of ours. "
                 f"Point: {point}, Strand: {strand}, Strands: {self.strands}"
@@ -201,6 +324,7 @@ class Strands:
 
         # Store the point's index
         point_index = point.index
+        was_closed = strand.closed
 
         if strand.closed:
             # Open up the strand by removing the point and then flagging it as open.
@@ -209,6 +333,8 @@ class Strands:
             new_strand_items.extend(strand.items[:point_index])
             strand.items = new_strand_items
             strand.closed = False
+            strand.changed()
+            first, second = strand, strand
         else:
             # Split the strand into two strands and then remove the old singular strand.
             new_strand_template = copy(strand)
@@ -223,14 +349,17 @@ class Strands:
             new_strand_2.items = StrandItems(strand.items[point_index + 1 :])
 
             for new_strand in (new_strand_1, new_strand_2):
-                for item in new_strand.items.by_type(Point):
-                    item.styles = copy(item.styles)
-                    item.styles.strand = new_strand
+                # Linkages must be moved to the new strands too, not just points
+                for item in new_strand.items:
+                    if isinstance(item, Point):
+                        item.styles = copy(item.styles)
+                        item.styles.strand = new_strand
                     item.strand = new_strand
 
             self.append(new_strand_1)
             self.append(new_strand_2)
             self.remove(strand)
+            first, second = new_strand_1, new_strand_2
 
         point.strand = None
 
@@ -240,6 +369,9 @@ class Strands:
         if style:
             self.style()
 
+        self.history.record(Nicked.between(point, first, second, was_closed))
+
+    @batch_events
     def unnick(self, nick: "Nick", style: bool = True) -> None:
         """
         Recombine a strand and remove a nick.
@@ -286,7 +418,8 @@ class Strands:
         else:
             logger.debug("Performing nick reversal that results in a open strand.")
             nick.previous_item().strand.extend(next_item_strand.items)
-            self.strands.remove(next_item_strand)
+            self.remove(next_item_strand)
+        previous_item_strand.changed()
 
         # Remove the nick.
         self.nicks.remove(nick)
@@ -297,18 +430,63 @@ class Strands:
         if style:
             self.style()
 
+        self.history.record(Unnicked(point))
+
+    @batch_events
+    def rejoin(self, nick: "Nick", first: Strand, second: Strand, closed: bool) -> None:
+        """
+        Remove a nick by joining the two given strands back together through it.
+
+        Unlike unnick(), which joins the strands of the nick's neighbours along its
+        helix, the strands to join are given. This is how nicks are undone, since a
+        nick at a junction has strand neighbours on a different helix.
+
+        Args:
+            nick: The nick to remove.
+            first: The strand that ends just before the nick.
+            second: The strand that begins just after the nick. This is the same
+                strand as first if the nick opened up a closed strand.
+            closed: Whether the strand was closed before the nick was made.
+
+        Raises:
+            IndexError: If the nick is not in the container.
+        """
+        if nick not in self.nicks:
+            raise IndexError(f"Nick {nick} is not in this container.")
+        point = nick.original_item
+
+        first.append(point)
+        if second is not first:
+            first.extend(second.items)
+            self.remove(second)
+        first.closed = closed
+        first.changed()
+
+        self.nicks.remove(nick)
+        point.helix.data.points[point.helical_index] = point
+        self.style()
+
+    @batch_events
     def do_many(
         self,
-        action: Literal["nick", "unnick", "highlight", "conjunct"],
+        action: Literal[
+            "nick", "unnick", "highlight", "conjunct", "unjunct", "link", "set base"
+        ],
         first_point: Point,
         repeat_every: int,
-        repeat_for: int,
+        repeat_for: int | None,
         bidirectional: bool,
-        items_to_run_on: Iterable,
+        items_to_run_on: Sequence,
+        base: str | None = None,
     ) -> None:
         """
         Run an action on many points by surfing a given array or the point's strand.
 
+        All the points that the action will be run on are found first, and then the
+        action is run on all of them as one edit. Nicks and junctions are made in a
+        single pass that reassembles each affected strand once, and the strands are
+        restyled once at the end.
+
         Args:
             action: The action to run on many points.
             first_point: The point to run an action on first and then surf from.
@@ -316,152 +494,271 @@ class Strands:
             repeat_for: The number of steps of repeat_every to take.
             bidirectional: Whether to repeat the bulk action going in both directions,
                 as opposed to only in the direction of the point starting at the point.
-            items_to_run_on: The iterable of Points to run the action along.
+            items_to_run_on: The sequence of Points to run the action along.
+            base: The base to set, for the "set base" action. None clears the bases.
 
         Raises:
-            ValueError: If the point's strand is not a strand of ours, or the point does
-                not have a strand assigned.
+            ValueError: If the point's strand is not a strand of ours, the point does
+                not have a strand assigned, or the action is unknown.
+
+        Notes:
+            - "conjunct" toggles the junction at every junctable NEMid, while
+                "unjunct" only removes existing junctions.
+            - "link" links every NEMid that is an end of its strand to the NEMid
+                across the double helix from it, if that is the other end of a strand.
+            - "set base" sets the base of every Nucleoside, and the complementary
+                base of its matching Nucleoside.
         """
-        # Check if the strand is in this container.
-        if (first_point.strand is None) and (first_point.strand not in self.strands):
+        # Check if the strand is in this container. Nicks no longer have strands.
+        if not isinstance(first_point, Nick) and first_point not in self:
             raise ValueError(
                 f"The point's strand is not a strand of ours. "
                 f"Point: {first_point}, Strand: {first_point.strand}"
             )
-
-        # fmt: off
-        if action == "nick":
-            def worker(point):
-                if isinstance(point, NEMid):
-                    self.nick(point, style=False)
-        elif action == "unnick":
-            def worker(point):
-                if isinstance(point, Nick):
-                    self.unnick(point, style=False)
-        elif action == "highlight":
-            def worker(point):
-                point.highlighted = True
-        elif action == "conjunct":
-            def worker(point):
-                if isinstance(point, NEMid) and point.juncmate is not None:
-                    self.conjunct(point, point.juncmate, style=False)
-        else:
+        if action not in self.bulk_actions:
             raise ValueError(f"Unknown action: {action}")
-        # fmt: on
+        if action == "set base" and base not in (*DNA, None):
+            raise ValueError(f"Invalid base: {base}")
 
-        first_point_index = tuple(items_to_run_on).index(first_point)
+        targets = repeat_targets(
+            first_point, items_to_run_on, repeat_every, repeat_for, bidirectional
+        )
+        logger.debug("Running action %s on %s points.", action, len(targets))
+
+        with self.history.group():
+            if action == "nick":
+                self._nick_many(
+                    [
+                        point
+                        for point in targets
+                        if isinstance(point, NEMid) and point.strand is not None
+                    ]
+                )
+            elif action == "unnick":
+                for point in targets:
+                    if isinstance(point, Nick):
+                        self.unnick(point, style=False)
+            elif action == "highlight":
+                for point in targets:
+                    point.highlighted = True
+            elif action in ("conjunct", "unjunct"):
+                self._conjunct_many(
+                    [
+                        (point, point.juncmate)
+                        for point in targets
+                        if isinstance(point, NEMid)
+                        and point.strand is not None
+                        and point.juncmate is not None
+                        and point.juncmate.strand is not None
+                        and (action == "conjunct" or point.junction)
+                    ]
+                )
+            elif action == "link":
+                for point in targets:
+                    if (mate := link_mate(point)) is not None:
+                        self.link(point, mate, style=False)
+            elif action == "set base":
+                nucleosides = [
+                    point for point in targets if isinstance(point, Nucleoside)
+                ]
+                self._bases_changed(
+                    *assign_bases(
+                        nucleosides,
+                        [base] * len(nucleosides),
+                        self._mates(nucleosides),
+                    )
+                )
+                return
 
-        if repeat_for is None:
-            end_at = len(items_to_run_on)
-        else:
-            end_at = first_point_index + repeat_for * repeat_every
-
-        if bidirectional:
-            logger.debug("Running action %s bidirectionally.", action)
-            start_at = first_point_index - end_at
-
-            # If the action is conjunct, we assume that the user only wants to make
-            # junctions for NEMids that have the same x coord as the first point
-            # starting at the first junctable point, or symmetrically (which is why
-            # we check whether the start_at is less than 1).
-            if start_at < 1:
-                if action == "conjunct":
-                    for index, item in enumerate(items_to_run_on):
-                        if (
-                            isinstance(item, NEMid)
-                            and item.junctable
-                            and round(item.x_coord) == round(first_point.x_coord)
-                        ):
-                            start_at = index
-                            break
-                else:
-                    start_at = 1
-        else:
-            start_at = first_point_index
+        self.style()
+
+    def _nick_many(self, points: List[NEMid]) -> None:
+        """
+        Nick the strands at many points at once.
+
+        This has the same result as nicking at each point one after another, but each
+        strand is only split up once.
+
+        Args:
+            points: The points to create nicks at.
+
+        Raises:
+            ValueError: If a point's strand is not a strand of ours.
+        """
+        by_strand: Dict[int, Tuple[Strand, List[NEMid]]] = {}
+        for point in points:
+            by_strand.setdefault(id(point.strand), (point.strand, []))[1].append(point)
+
+        for strand, strand_points in by_strand.values():
+            if strand not in self:
+                raise ValueError(
+                    f"The point's strands is not a strand of ours. "
+                    f"Point: {strand_points[0]}, Strand: {strand}"
+                )
+
+        for strand, strand_points in by_strand.values():
+            indices = {id(item): index for index, item in enumerate(strand.items)}
+            strand_points.sort(key=lambda point: indices[id(point)])
+            pieces = split_items(
+                strand.items,
+                strand.closed,
+                [indices[id(point)] for point in strand_points],
+            )
+            was_closed = strand.closed
+
+            if strand.closed and len(pieces) == 1:
+                # Nicking a closed strand once only opens it up
+                strand.items = StrandItems(pieces[0])
+                strand.closed = False
+                strand.changed()
+                piece_strands = [strand]
+            else:
+                piece_strands = []
+                new_strand_template = copy(strand)
+                new_strand_template.items = None
+                new_strand_template.closed = False
+                for piece in pieces:
+                    new_strand = deepcopy(new_strand_template)
+                    new_strand.items = StrandItems(piece)
+                    # Linkages must be moved to the new strands too, not just points
+                    for item in new_strand.items:
+                        if isinstance(item, Point):
+                            item.styles = copy(item.styles)
+                            item.styles.strand = new_strand
+                        item.strand = new_strand
+                    self.append(new_strand)
+                    piece_strands.append(new_strand)
+                self.remove(strand)
+
+            for count, point in enumerate(strand_points):
+                # Only the first nick of a closed strand opens it up
+                nick = Nick(point, previously_closed_strand=was_closed and not count)
+                self.nicks.append(nick)
+                point.strand = None
+                point.helix.data.points[point.helical_index] = nick
+                # The pieces of a closed strand wrap around, so the last point is
+                # followed by the first piece
+                self.history.record(
+                    Nicked.between(
+                        point,
+                        piece_strands[count],
+                        piece_strands[(count + 1) % len(piece_strands)],
+                        was_closed and not count,
+                    )
+                )
+
+        logger.debug("Created %s nicks in %s strands.", len(points), len(by_strand))
+
+    def _conjunct_many(self, pairs: List[Tuple[NEMid, NEMid]]) -> None:
+        """
+        Create or remove many junctions at once.
+
+        This has the same result as conjuncting each pair one after another, but the
+        affected strands are only reassembled once.
+
+        Args:
+            pairs: The pairs of NEMids to conjunct.
+
+        Raises:
+            ValueError: If the NEMids of a pair are not both junctable.
+        """
+        unique_pairs, seen = [], set()
+        for NEMid1, NEMid2 in pairs:
+            if (not NEMid1.junctable) or (not NEMid2.junctable):
+                raise ValueError("NEMids are not both junctable.", NEMid1, NEMid2)
+            if (key := frozenset((id(NEMid1), id(NEMid2)))) not in seen:
+                seen.add(key)
+                unique_pairs.append((NEMid1, NEMid2))
+        if not unique_pairs:
+            return
+
+        affected = {
+            id(NEMid_.strand): NEMid_.strand for pair in unique_pairs for NEMid_ in pair
+        }
+        rebuilt = relink(
+            ((strand.items, strand.closed) for strand in affected.values()),
+            unique_pairs,
+        )
+
+        for strand in affected.values():
+            self.remove(strand)
+        for items, closed in rebuilt:
+            new_strand = Strand(
+                items=items,
+                closed=closed,
+                nucleic_acid_profile=self.nucleic_acid_profile,
+            )
+            for item in new_strand.items:
+                item.strand = new_strand
+            self.append(new_strand)
+
+        for NEMid1, NEMid2 in unique_pairs:
+            self.history.record(Conjuncted(NEMid1, NEMid2))
 
         logger.debug(
-            "Running action %s, starting at item %s to item %s, every %s items.",
-            action,
-            start_at,
-            end_at,
-            repeat_every,
+            "Conjuncted %s pairs, turning %s strands into %s strands.",
+            len(unique_pairs),
+            len(affected),
+            len(rebuilt),
         )
 
-        for item in itertools.islice(items_to_run_on, start_at, end_at, repeat_every):
-            worker(item)
+    def sequence_records(self) -> Generator[SequenceRecord, None, None]:
+        """
+        Yield the name, sequence, and color of each strand, for exporting.
+
+        Unset bases are left out of the sequences.
 
-        self.style()
+        Yields:
+            (name, sequence, color) tuples. Sequences are 5' to 3'.
+        """
+        for index, strand in enumerate(self.strands):
+            yield (
+                f"Strand #{index}",
+                "".join(base for base in strand.sequence if base is not None),
+                rgb_to_hex(strand.styles.color.value),
+            )
 
     def export_sequence(
         self, filepath: str, open_in_file_explorer: bool = True, mode="xlsx"
-    ) -> None:
+    ) -> str:
         """
         Export all sequences to a file.
 
         Data exported includes the following for each strand:
             - Strand name
             - Sequence
-            - Sequence color
+            - Sequence color (for formats that support it)
 
         Args:
             filepath: The filepath to export to. Do not include the file suffix.
             open_in_file_explorer: Whether to open the file location in file after
                 exporting.
-            mode: The file format to export to. Currently only supports "xlsx".
+            mode: The file format to export to. Any format registered in
+                natug.structures.strands.exporters, such as "xlsx", "csv", "tsv",
+                "fasta", or "idt" (a 96-well plate layout).
+
+        Returns:
+            The filepath that was exported to, including the suffix.
+
+        Raises:
+            ValueError: If the mode is unknown or the filepath includes a suffix.
         """
-        if "." in filepath:
+        exporter = exporters.exporter(mode)
+
+        if os.path.splitext(filepath)[1]:
             raise ValueError(
                 "Filepath includes a suffix. Do not include suffixes in filepaths."
             )
+        filepath += exporter.suffix
 
-        # create a pandas dataset for exporting to the spreadsheet
-        dataset = []
-        for index, strand in enumerate(self.strands):
-            # the three columns of the spreadsheet are name, sequence, and color
-            name = f"Strand #{index}"
-            sequence = "".join(map(str, strand.sequence)).replace("None", "")
-            color = rgb_to_hex(strand.styles.color.value)
-            dataset.append(
-                (
-                    name,
-                    sequence,
-                    color,
-                )
-            )
-
-        # compile the dataset into pd.DataFrame
-        sequences = pd.DataFrame(
-            dataset, columns=["Name", "Sequence (5' to 3')", "Color"]
-        )
-
-        # create an Excel writer object
-        writer = ExcelWriter(filepath, engine="openpyxl")
-
-        if mode == "xlsx":
-            filepath += ".xlsx"
-
-            # export the dataframe to an Excel worksheet
-            sequences.to_excel(writer, sheet_name=self.name, index=False)
+        exporter.write(self.sequence_records(), filepath, self.name)
+        logger.info("Exported sequences as %s @ %s", exporter.name, filepath)
 
-            # adjust the widths of the various columns
-            worksheet = writer.sheets[self.name]
-            worksheet.column_dimensions["A"].width = 15
-            worksheet.column_dimensions["B"].width = 50
-            worksheet.column_dimensions["C"].width = 15
-            worksheet.column_dimensions["D"].width = 15
+        if open_in_file_explorer:
+            QTimer.singleShot(500, partial(show_in_file_explorer, filepath))
+            logger.info(f"Opened export @ %s in file explorer.", filepath)
 
-            # Save the workbook
-            workbook = writer.book
-            workbook.save(filepath)
-
-            # log
-            logger.info("Exported sequences as excel @ {filepath}")
-
-            if open_in_file_explorer:
-                QTimer.singleShot(500, partial(show_in_file_explorer, filepath))
-                logger.info(f"Opened export @ %s in file explorer.", filepath)
-        else:
-            raise ValueError(f"Unknown mode: %s", mode)
+        return filepath
 
     def randomize_sequences(self, overwrite: bool = False):
         """
@@ -470,15 +767,128 @@ class Strands:
         Args:
             overwrite: Whether to overwrite existing sequences.
         """
-        for strand in self.strands:
-            strand.randomize_sequence(overwrite)
+        index = NucleosideIndex.from_strands(self.strands, self.pairs)
+        bases = np.array([nucleoside.base for nucleoside in index], dtype=object)
+
+        # randomize the bases that we are allowed to overwrite
+        targets = np.array([overwrite or base is None for base in bases], dtype=bool)
+        bases[targets] = np.random.choice(DNA, size=int(targets.sum())).tolist()
+
+        # then make sure that paired nucleosides are complementary. If both halves of
+        # a pair were randomized the first one wins, otherwise the randomized half
+        # takes the complement of the half that was kept
+        sources = np.flatnonzero(targets & (index.matching >= 0))
+        mates = index.matching[sources]
+        kept = ~targets[mates]
+        first = ~kept & (sources < mates)
+        bases[mates[first]] = [COMPLEMENTS[base] for base in bases[sources[first]]]
+        bases[sources[kept]] = [COMPLEMENTS[base] for base in bases[mates[kept]]]
+
+        changed = np.flatnonzero(targets)
+        self._bases_changed(
+            *assign_bases([index.nucleosides[i] for i in changed], bases[changed])
+        )
 
     def clear_sequences(self):
         """
         Clear the sequences for all strands.
         """
-        for strand in self.strands:
-            strand.clear_sequence()
+        nucleosides = NucleosideIndex.from_strands(self.strands, self.pairs).nucleosides
+        self._bases_changed(*assign_bases(nucleosides, [None] * len(nucleosides)))
+
+    def set_sequences(
+        self,
+        sequences: Dict[int, List[str] | None] | List[List[str] | None],
+        complement: bool = True,
+    ) -> None:
+        """
+        Set the sequences of many strands at once.
+
+        All the bases are written first, and then every changed nucleoside is restyled
+        once, which is much faster than setting Strand.sequence for each strand.
+
+        Args:
+            sequences: The new sequence for each strand. Either a list of sequences in
+                strand order, or a dictionary mapping strand indexes to sequences.
+                Strands with a sequence of None (or that are missing from the
+                dictionary) are left alone.
+            complement: Whether to set the matching nucleosides of the changed
+                nucleosides to the complementary bases. Matching nucleosides that
+                are themselves given a base are not overwritten.
+
+        Raises:
+            IndexError: If a strand index is out of range.
+            ValueError: If a sequence's length doesn't match its strand's nucleoside
+                count.
+        """
+        if not isinstance(sequences, dict):
+            sequences = dict(enumerate(sequences))
+
+        index = NucleosideIndex.from_strands(self.strands, self.pairs)
+        lengths = index.strand_lengths()
+        bases = np.array([nucleoside.base for nucleoside in index], dtype=object)
+        assigned = np.zeros(len(index), dtype=bool)
+
+        for strand_index, sequence in sequences.items():
+            if sequence is None:
+                continue
+            if not 0 <= strand_index < len(self.strands):
+                raise IndexError(f"There is no strand #{strand_index}.")
+            if len(sequence) != lengths[strand_index]:
+                raise ValueError(
+                    f"Length of the new sequence ({len(sequence)}) for strand "
+                    f"#{strand_index} must match the number of nucleosides in the "
+                    f"strand ({lengths[strand_index]})"
+                )
+            start, end = index.offsets[strand_index], index.offsets[strand_index + 1]
+            bases[start:end] = list(sequence)
+            assigned[start:end] = True
+
+        if complement:
+            sources = np.flatnonzero(assigned & (index.matching >= 0))
+            mates = index.matching[sources]
+            keep = ~assigned[mates]
+            bases[mates[keep]] = [COMPLEMENTS[base] for base in bases[sources[keep]]]
+            assigned[mates[keep]] = True
+
+        changed = np.flatnonzero(assigned)
+        self._bases_changed(
+            *assign_bases([index.nucleosides[i] for i in changed], bases[changed])
+        )
+        logger.info("Set the sequences of %s strands.", len(sequences))
+
+    def import_sequences(self, filepath: str, complement: bool = True) -> None:
+        """
+        Set the sequences of strands from a FASTA or plain text file.
+
+        FASTA records named "Strand #i" (as exported by .export_sequence) are applied to
+        strand i. Other records, and the lines of plain text files, are applied to the
+        strands in order.
+
+        Args:
+            filepath: The file to load the sequences from.
+            complement: Whether to also set the complementary bases. See
+                .set_sequences().
+
+        Raises:
+            ValueError: If the file contains invalid bases or a sequence's length
+                doesn't match its strand.
+        """
+        with open(filepath) as file:
+            records = parse_sequences(file.read())
+        self.set_sequences(sequences_by_strand(records), complement)
+        logger.info("Imported %s sequences from %s", len(records), filepath)
+
+    def _bases_changed(
+        self, changed: List["Nucleoside"], previous: List[str | None]
+    ) -> None:
+        """Notify listeners of changed bases, and record the change for undoing."""
+        if not changed:
+            return
+        self.events.emit(BASES_CHANGED, self, nucleosides=changed)
+        self.history.record(
+            Sequenced(changed, previous, [nucleoside.base for nucleoside in changed])
+        )
 
     @property
     def up_strands(self):
@@ -489,13 +899,31 @@ class Strands:
         return list(filter(lambda strand: strand.up_strand(), self.strands))
 
     def index(self, item: object) -> int:
-        """Obtain the index of a given strand."""
-        return self.strands.index(item)
+        """
+        Obtain the index of a given strand.
+
+        Raises:
+            ValueError: If the strand is not in the container.
+        """
+        if self._indexes is None:
+            self._indexes = {id(strand): i for i, strand in enumerate(self.strands)}
+        try:
+            return self._indexes[id(item)]
+        except KeyError:
+            raise ValueError(f"{item} is not in the strands container.") from None
 
     def append(self, strand: Strand):
         """Add a strand to the container."""
         strand.strands = self
-        self.strands.append(strand)
+        if self._strands.pop(id(strand), None) is not None:
+            # Re-adding a strand moves it to the end
+            self._invalidate()
+        self._strands[id(strand)] = strand
+        if self._listed is not None:
+            self._listed.append(strand)
+        if self._indexes is not None:
+            self._indexes[id(strand)] = len(self._strands) - 1
+        self.events.emit(STRAND_ADDED, self, strand=strand)
 
     def extend(self, strands: List[Strand]):
         """Add multiple strands to the container."""
@@ -503,9 +931,17 @@ class Strands:
             self.append(strand)
 
     def remove(self, strand: Strand):
-        """Remove a strand from the container."""
+        """
+        Remove a strand from the container.
+
+        Raises:
+            ValueError: If the strand is not in the container.
+        """
+        if self._strands.pop(id(strand), None) is None:
+            raise ValueError(f"{strand} is not in the strands container.")
         strand.strands = None
-        self.strands.remove(strand)
+        self._invalidate()
+        self.events.emit(STRAND_REMOVED, self, strand=strand)
 
     def style(self) -> None:
         """
@@ -553,7 +989,8 @@ class Strands:
                 item.styles.change_state("default")
         logger.debug("Recomputed strand styles.")
 
-    def link(self, NEMid1: NEMid, NEMid2: NEMid) -> Linkage:
+    @batch_events
+    def link(self, NEMid1: NEMid, NEMid2: NEMid, style: bool = True) -> Linkage:
         """
         Create a linkage between two endpoint NEMids.
 
@@ -565,6 +1002,7 @@ class Strands:
         Args:
             NEMid1: A NEMid at either the beginning or end of a strand.
             NEMid2: A different NEMid at either the beginning or end of a strand.
+            style: Whether to restyle the strands after the linkage is made.
 
         Returns:
             The Linkage object that was created.
@@ -647,11 +1085,17 @@ class Strands:
         self.append(new_strand)
 
         # Restyle the strands
-        self.style()
+        if style:
+            self.style()
+
+        # Record the NEMids that the linkage actually joins, which can differ from the
+        # ones given when a strand with only one NEMid is linked
+        self.history.record(Linked(*linkage_ends(linkage), linkage))
 
         # Return the linkage
         return linkage
 
+    @batch_events
     def unlink(self, linkage: Linkage) -> Tuple[Strand, Strand]:
         """
         Split the strand at the site of a given linkage.
@@ -666,16 +1110,24 @@ class Strands:
             linkage.strand.strands is self
         ), "Linkage is not in this Strands container."
 
+        # Linkages are dataclasses that compare by value, so find this one by identity
+        linkage_index = next(
+            index for index, item in enumerate(linkage.strand.items) if item is linkage
+        )
         logger.debug(f"Unlinking %s in Strands object %s.", linkage, self.name)
-        logger.debug(f"Linkage is at index %s.", linkage.strand.index(linkage))
+        logger.debug(f"Linkage is at index %s.", linkage_index)
+
+        # Store the NEMids that the linkage joins, so that the unlinking can be undone
+        ends = linkage_ends(linkage)
 
         if linkage.strand.closed:
-            linkage_index = linkage.strand.index(linkage)
+            # Open up the strand at the linkage, leaving the linkage out
             linkage.strand.closed = False
             linkage.strand.items = StrandItems(
-                linkage.strand[0:linkage_index] + linkage.strand[linkage_index:-1]
+                linkage.strand[linkage_index + 1 :] + linkage.strand[:linkage_index]
             )
             to_return = (linkage.strand,)
+            linkage.strand.changed()
         else:
             # Create a copy of the strand that has the same styles and nucleic acid
             # profile as the original strand. The new strands will have the same name,
@@ -697,10 +1149,10 @@ class Strands:
 
             # Split up the strand items of the linkage, and do not include the linkage
             new_strand_one.extend(
-                tuple(linkage.strand[: linkage.strand.index(linkage)]),
+                tuple(linkage.strand[:linkage_index]),
             )
             new_strand_two.extend(
-                tuple(linkage.strand[linkage.strand.index(linkage) + 1 :]),
+                tuple(linkage.strand[linkage_index + 1 :]),
             )
 
             # Add the new strands to the container
@@ -715,8 +1167,10 @@ class Strands:
 
         # Restyle the strands and return the new strand(s)
         self.style()
+        self.history.record(Unlinked(*ends, linkage))
         return to_return
 
+    @batch_events
     def conjunct(
         self,
         NEMid1: NEMid,
@@ -760,6 +1214,17 @@ class Strands:
         NEMid1_index = NEMid1.index
         NEMid2_index = NEMid2.index
 
+        # Store the items on either side of both junction sites. Only these items
+        # gain new neighbors, so only their junction flags can change.
+        sites = []
+        for NEMid_, index in ((NEMid1, NEMid1_index), (NEMid2, NEMid2_index)):
+            items, closed = NEMid_.strand.items, NEMid_.strand.closed
+            previous, next_item = neighbors(items, index, closed)
+            before_previous = (
+                None if previous is None else neighbors(items, index - 1, closed)[0]
+            )
+            sites.append((previous, next_item, before_previous))
+
         # new strands we are creating
         new_strands = [
             Strand(nucleic_acid_profile=self.nucleic_acid_profile),
@@ -923,38 +1388,37 @@ class Strands:
             for item in new_strand.items:
                 item.strand = new_strand
 
-        for NEMid_ in (NEMid1, NEMid2):
-            for index, item in enumerate(NEMid_.strand):
-                if (
-                    isinstance(item, NEMid)
-                    and item.junctable
-                    and (
-                        NEMid_.strand[(index - 1) % len(NEMid_.strand)].domain
-                        != NEMid_.strand[(index + 1) % len(NEMid_.strand)].domain
-                    )
-                ):
-                    item.junction = True
-                else:
-                    item.junction = False
+        # The junction swaps the items that come after the items before each NEMid
+        (previous1, next1, before1), (previous2, next2, before2) = sites
+        for item, previous, next_item in (
+            (NEMid1, previous2, next1),
+            (NEMid2, previous1, next2),
+            (previous1, before1, NEMid2),
+            (previous2, before2, NEMid1),
+        ):
+            if isinstance(item, NEMid):
+                item.junction = is_junction(item, previous, next_item)
 
         if style:
             self.style()
 
+        self.history.record(Conjuncted(NEMid1, NEMid2))
+
     def y_min(self) -> float:
         """The minimum z coordinate of the strands container."""
-        return min([strand.y_min() for strand in self.strands])
+        return min(strand.y_min() for strand in self.strands)
 
     def y_max(self) -> float:
         """The maximum z coordinate of the strands container."""
-        return max([strand.y_max() for strand in self.strands])
+        return max(strand.y_max() for strand in self.strands)
 
     def x_min(self) -> float:
         """The minimum x coordinate of the strands container."""
-        return min([strand.x_min() for strand in self.strands])
+        return min(strand.x_min() for strand in self.strands)
 
     def x_max(self) -> float:
         """The maximum x coordinate of the strands container."""
-        return max([strand.x_max() for strand in self.strands])
+        return max(strand.x_max() for strand in self.strands)
 
     def height(self):
         """Obtain the height of the strands container."""
@@ -982,7 +1446,7 @@ class Strands:
         """
         Convert the domain to a JSON serializable dictionary.
 
-        All the strands and nicks are referenced by their uuids. The ordering of
+        All the strands and nicks are referenced by their ids. The ordering of
         strands and nicks is preserved.
 
         Returns:
@@ -991,10 +1455,34 @@ class Strands:
         return {
             "name": self.name,
             "uuid": self.uuid,
-            "data:strands": [strand.uuid for strand in self],
-            "data:nicks": [nick.uuid for nick in self.nicks],
+            "data:strands": [strand.id for strand in self],
+            "data:nicks": [nick.id for nick in self.nicks],
         }
 
+    def export_workbook(
+        self,
+        filepath: str,
+        progress: Callable[[int, int], None] | None = None,
+    ) -> None:
+        """
+        Export the strands and all their points to an Excel workbook.
+
+        The workbook is written in xlsxwriter's constant memory mode, so rows are
+        flushed to disk as they are written rather than held in memory.
+
+        Args:
+            filepath: The path of the .xlsx file to write.
+            progress: A function that is called with (points written, total points)
+                as the points sheet is written.
+        """
+        with Timer("Workbook export", logger=logger):
+            workbook = Workbook(filepath, {"constant_memory": True})
+            try:
+                self.write_worksheets(workbook, progress=progress)
+            finally:
+                workbook.close()
+        logger.info("Exported workbook @ %s", filepath)
+
     def write_worksheets(
         self,
         workbook: Workbook,
@@ -1002,6 +1490,8 @@ class Strands:
         strand_sheet_color: str = "#FFCC00",
         point_sheet_name: str = "Points",
         point_sheet_color: str = "#00CC99",
+        progress: Callable[[int, int], None] | None = None,
+        progress_interval: int = 1000,
     ):
         """
         Write two worksheets to an Excel spreadsheet containing the strands and all
@@ -1014,28 +1504,35 @@ class Strands:
         and more. The strands sheet's items that reference points by ID are linked
         to the points sheet.
 
+        Both sheets are written strictly row by row from generators, so this works
+        with workbooks in xlsxwriter's constant_memory mode.
+
         Args:
             workbook: The Excel workbook to create a tab for.
             strand_sheet_name: The name of the strand worksheet.
             strand_sheet_color: The color of the strand worksheet tab.
             point_sheet_name: The name of the point worksheet.
             point_sheet_color: The color of the point worksheet tab.
+            progress: A function that is called with (points written, total points)
+                every progress_interval points, and once more when done.
+            progress_interval: The number of points to write between progress calls.
         """
         from natug.structures.points import NEMid, Nucleoside
 
-        row_to_point = {}
-        point_id_to_row = {}
-        i = 2
-        for strand in self.strands:
-            for item in strand.items:
-                if isinstance(item, Point):
-                    points = (item,)
-                elif isinstance(item, Linkage):
-                    points = item.items
-                for point in points:
-                    i += 1
-                    row_to_point[i] = point
-                    point_id_to_row[id(point)] = i
+        # Number the strands and the points once, up front. Points are numbered by
+        # their row on the points sheet (the first two rows are headers).
+        strand_numbers = {id(strand): i for i, strand in enumerate(self.strands, 1)}
+        points = [
+            point for strand in self.strands for point in strand.items.by_type(Point)
+        ]
+        point_id_to_row = {id(point): row for row, point in enumerate(points, start=3)}
+
+        # Look up the matching nucleoside of every nucleoside at once
+        nucleosides = [point for point in points if isinstance(point, Nucleoside)]
+        mates = {
+            id(nucleoside): mate
+            for nucleoside, mate in zip(nucleosides, self._mates(nucleosides))
+        }
 
         border_color = "808080"
 
@@ -1069,195 +1566,228 @@ class Strands:
         # Format for URLs and hyperlinks
         links = workbook.add_format({"color": "blue", "underline": 1})
 
-        def write_strands_sheet(sheet):
-            column_start = 0  # the column where the current strand begins
-
-            for i, strand in enumerate(self.strands):
-
-                def c(index: int) -> int:
-                    return column_start + index
-
-                # Overall strand header
-                sheet.merge_range(0, c(0), 0, c(6), f"Strand#{i+1}", primary_headers)
-
-                # Secondary strand headers
-                sheet.merge_range(1, c(0), 1, c(1), "#", secondary_headers)
-
-                sheet.merge_range(1, c(2), 1, c(3), "Data", secondary_headers)
-
-                sheet.merge_range(1, c(4), 1, c(6), "Styles", secondary_headers)
+        def link(row: int | None) -> str | None:
+            """A hyperlink to a row of the points sheet."""
+            if row is None:
+                return None
+            return f'=HYPERLINK("#A{row}", "Point#{row}")'
 
-                # Territory strand headers
-                sheet.write(2, c(0), "ID", secondary_headers)
-                sheet.write(2, c(1), "Name", secondary_headers)
-                sheet.set_column(c(2), c(2), 12)
-                sheet.write(2, c(2), "Closed", secondary_headers)
-
-                sheet.set_column(c(3), c(3), 25)
-                sheet.write(2, c(3), "Sequence", secondary_headers)
-                sheet.set_column(c(4), c(6), 10)
-                sheet.write(2, c(4), "Color", secondary_headers)
-                sheet.write(2, c(5), "Thickness", secondary_headers)
-                sheet.write(2, c(6), "Highlighted", secondary_headers)
+        def strand_item_rows(strand: Strand) -> Generator[list, None, None]:
+            """Yield the cells of each item row of a strand's block."""
+            for item in strand.items:
+                item_row = point_id_to_row.get(id(item))
 
-                # Overall strand data
-                sheet.write(3, c(0), str(id(strand)))
-                sheet.write(3, c(1), strand.name)
-                sheet.write(3, c(2), strand.closed)
+                if isinstance(item, Linkage):
+                    str_sequence = "".join(
+                        "X" if base is None else base for base in item.sequence or ()
+                    )
+                    overview = f"{item.plot_points}"
+                else:
+                    str_sequence = ""
+                    overview = (
+                        f'="(" & ROUND(Points!C{item_row}, 3) & ", " & '
+                        f'ROUND(Points!D{item_row}, 3) & ")"'
+                    )
 
-                sequence = ""
-                for item in strand.sequence:
-                    sequence += item if item is not None else "X"
+                yield [str(item_row), item.__class__.__name__, overview, str_sequence]
 
-                sheet.write(3, c(3), "".join(sequence))
+        def write_strands_sheet(sheet):
+            # Each strand gets a block of 7 columns (plus a spacer column)
+            columns = [8 * i for i in range(len(self.strands))]
+
+            for c in columns:
+                sheet.set_column(c + 2, c + 2, 12)
+                sheet.set_column(c + 3, c + 3, 25)
+                sheet.set_column(c + 4, c + 6, 10)
+
+            # Overall strand headers
+            for i, c in enumerate(columns, start=1):
+                sheet.merge_range(0, c, 0, c + 6, f"Strand#{i}", primary_headers)
+
+            # Secondary strand headers
+            for c in columns:
+                sheet.merge_range(1, c, 1, c + 1, "#", secondary_headers)
+                sheet.merge_range(1, c + 2, 1, c + 3, "Data", secondary_headers)
+                sheet.merge_range(1, c + 4, 1, c + 6, "Styles", secondary_headers)
+
+            # Territory strand headers
+            for c in columns:
+                sheet.write_row(
+                    2,
+                    c,
+                    (
+                        "ID",
+                        "Name",
+                        "Closed",
+                        "Sequence",
+                        "Color",
+                        "Thickness",
+                        "Highlighted",
+                    ),
+                    secondary_headers,
+                )
 
+            # Overall strand data
+            for strand, c in zip(self.strands, columns):
+                sequence = "".join(
+                    base if base is not None else "X" for base in strand.sequence
+                )
                 color = rgb_to_hex(strand.styles.color.value)
                 if strand.styles.color.automatic:
-                    sheet.write(3, c(4), f"auto, {color}")
-                else:
-                    sheet.write(3, c(4), rgb_to_hex(strand.styles.color.value))
-
+                    color = f"auto, {color}"
                 thickness = strand.styles.thickness.value
                 if strand.styles.thickness.automatic:
-                    sheet.write(3, c(5), f"auto, {thickness}")
-                else:
-                    sheet.write(3, c(5), thickness)
-
-                sheet.write(3, c(6), strand.styles.highlighted)
-
-                # Add the strand items header
-                sheet.merge_range(4, c(0), 4, c(6), f"Items", primary_headers)
+                    thickness = f"auto, {thickness}"
+                sheet.write_row(
+                    3,
+                    c,
+                    (
+                        str(id(strand)),
+                        strand.name,
+                        strand.closed,
+                        sequence,
+                        color,
+                        thickness,
+                        strand.styles.highlighted,
+                    ),
+                )
 
-                # Add the strand items subheader
-                sheet.write(5, c(0), f"ID", secondary_headers)
-                sheet.write(5, c(1), f"Type", secondary_headers)
-                sheet.write(5, c(2), f"Overview", secondary_headers)
+            # The strand items headers and subheaders
+            for c in columns:
+                sheet.merge_range(4, c, 4, c + 6, "Items", primary_headers)
+            for c in columns:
+                sheet.write_row(5, c, ("ID", "Type", "Overview"), secondary_headers)
                 sheet.merge_range(
-                    5, c(3), 5, c(6), f"Linkage Sequence", secondary_headers
+                    5, c + 3, 5, c + 6, "Linkage Sequence", secondary_headers
                 )
 
-                for row, item in enumerate(strand.items, start=6):
-                    try:
-                        item_row = point_id_to_row[id(item)]
-                    except KeyError:
-                        item_row = None
-
-                    sheet.write(row, c(0), str(item_row))
-                    sheet.write(row, c(1), item.__class__.__name__)
-                    overview = '="(" & {x} & ", " & {y} & ")"'
-                    overview = overview.format(
-                        x=f"ROUND(Points!C{item_row}, 3)",
-                        y=f"ROUND(Points!D{item_row}, 3)",
-                    )
-
-                    if isinstance(item, Linkage):
-                        str_sequence = ""
-                        if item.sequence:
-                            for base in item.sequence:
-                                str_sequence += "X" if base is None else base
-                        overview = f"{item.plot_points}"
-                    else:
-                        str_sequence = ""
-
-                    sheet.write(row, c(2), overview)
-
-                    sheet.merge_range(row, c(3), row, c(6), str_sequence)
+            # The item rows of all the strands, written across all strands one row
+            # at a time. Strands drop out once they run out of items.
+            active = [
+                (strand_item_rows(strand), c)
+                for strand, c in zip(self.strands, columns)
+            ]
+            row = 6
+            while active:
+                still_active = []
+                for item_rows, c in active:
+                    cells = next(item_rows, None)
+                    if cells is None:
+                        continue
+                    sheet.write_row(row, c, cells[:3])
+                    sheet.merge_range(row, c + 3, row, c + 6, cells[3])
+                    still_active.append((item_rows, c))
+                active = still_active
+                row += 1
+
+        def point_rows() -> Generator[Tuple[int, list, str, str], None, None]:
+            """Yield the row number and cells of each point's row."""
+            for row, point in enumerate(points, start=3):
+                juncmate, mate = None, None
+                if isinstance(point, NEMid):
+                    type_ = "NEMid"
+                    NEMid_data = [point.junctable, None, point.junction]
+                    if point.juncmate is not None:
+                        juncmate = link(point_id_to_row.get(id(point.juncmate)))
+                else:
+                    type_ = "Nucleoside" if isinstance(point, Nucleoside) else None
+                    NEMid_data = [None, None, None]
 
-                column_start += 8
+                if isinstance(point, Nucleoside):
+                    base = point.base
+                    mate = mates.get(id(point))
+                    if mate is not None:
+                        mate = link(point_id_to_row.get(id(mate)))
+                else:
+                    base = None
+
+                yield row, [
+                    point_id_to_row[id(point)],
+                    type_,
+                    point.x_coord,
+                    point.z_coord,
+                    point.angle,
+                    "UP" if point.direction == UP else "DOWN",
+                    *NEMid_data,
+                    base,
+                    None,
+                    f"Strand#{strand_numbers[id(point.strand)]}",
+                    str(id(point.linkage)),
+                    f"Domain#{point.domain.index+1}",
+                    point.styles.state,
+                    point.styles.symbol,
+                    point.styles.size,
+                    point.styles.rotation,
+                    rgb_to_hex(point.styles.fill),
+                    rgb_to_hex(point.styles.outline[0]),
+                    point.styles.outline[1],
+                ], juncmate, mate
 
         def write_points_sheet(sheet):
-            sheet.merge_range("A1:B1", "#", primary_headers)
             sheet.set_column("A:A", 5)
-            sheet.write("A2", "ID", secondary_headers)
             sheet.set_column("B:B", 10)
-            sheet.write("B2", "Type", secondary_headers)
-
-            sheet.merge_range("C1:F1", "Data", primary_headers)
-            sheet.write("C2", "X coord", secondary_headers)
-            sheet.write("D2", "Z coord", secondary_headers)
-            sheet.write("E2", "Angle", secondary_headers)
             sheet.set_column("F:F", 5)
-            sheet.write("F2", "Direction", secondary_headers)
-
-            sheet.merge_range("G1:I1", "NEMid", primary_headers)
             sheet.set_column("G:G", 6)
-            sheet.write("G2", "Junctable", secondary_headers)
             sheet.set_column("H:H", 10)
-            sheet.write("H2", "Juncmate", secondary_headers)
             sheet.set_column("I:I", 6)
-            sheet.write("I2", "Junction", secondary_headers)
-
-            sheet.set_column("J:J", 12)
-            sheet.write("J1", "Nucleoside", primary_headers)
-            sheet.write("J2", "Base", secondary_headers)
-
-            sheet.merge_range("K1:M1", "Containers", primary_headers)
+            sheet.set_column("J:J", 6)
             sheet.set_column("K:K", 10)
-            sheet.write("K2", "Strand", secondary_headers)
-            sheet.write("L2", "Linkage", secondary_headers)
-            sheet.set_column("M:M", 10)
-            sheet.write("M2", "Domain", secondary_headers)
-
-            sheet.merge_range("N1:T1", "Styles", primary_headers)
-            sheet.write("N2", "State", secondary_headers)
-            sheet.set_column("O:O", 5)
-            sheet.write("O2", "Symbol", secondary_headers)
+            sheet.set_column("L:L", 10)
+            sheet.set_column("N:N", 10)
             sheet.set_column("P:P", 5)
-            sheet.write("P2", "Size", secondary_headers)
-            sheet.write("Q2", "Rotation", secondary_headers)
-            sheet.write("R2", "Fill Color", secondary_headers)
-            sheet.set_column("S:S", 11)
-            sheet.write("S2", "Outline Color", secondary_headers)
+            sheet.set_column("Q:Q", 5)
             sheet.set_column("T:T", 11)
-            sheet.write("T2", "Outline Width", secondary_headers)
+            sheet.set_column("U:U", 11)
 
-            points = []
-            for strand in self.strands:
-                points.extend(strand.items.by_type(Point))
+            sheet.merge_range("A1:B1", "#", primary_headers)
+            sheet.merge_range("C1:F1", "Data", primary_headers)
+            sheet.merge_range("G1:I1", "NEMid", primary_headers)
+            sheet.merge_range("J1:K1", "Nucleoside", primary_headers)
+            sheet.merge_range("L1:N1", "Containers", primary_headers)
+            sheet.merge_range("O1:U1", "Styles", primary_headers)
 
-            for row, point in enumerate(points, start=3):
-                # Store general point data
-                sheet.write(f"A{row}", point_id_to_row[id(point)])
-                # Column B is reserved for the type, which is written later
-                sheet.write(f"C{row}", point.x_coord)
-                sheet.write(f"D{row}", point.z_coord)
-                sheet.write(f"E{row}", point.angle)
-                sheet.write(f"F{row}", "UP" if point.direction == UP else "DOWN")
-
-                # Store NEMid specific data
-                if isinstance(point, NEMid):
-                    sheet.write(f"B{row}", "NEMid")
-                    sheet.write(f"G{row}", point.junctable)
-                    if point.juncmate is not None:
-                        juncmate_row = point_id_to_row[id(point.juncmate)]
-                        sheet.write(
-                            f"H{row}",
-                            f'=HYPERLINK("#A{juncmate_row}", "Point#{juncmate_row}")',
-                            links,
-                        )
-                    sheet.write(f"I{row}", point.junction)
-
-                # Store Nucleoside specific data
-                if isinstance(point, Nucleoside):
-                    sheet.write(f"B{row}", "Nucleoside")
-                    sheet.write(f"J{row}", point.base)
+            sheet.write_row(
+                "A2",
+                (
+                    "ID",
+                    "Type",
+                    "X coord",
+                    "Z coord",
+                    "Angle",
+                    "Direction",
+                    "Junctable",
+                    "Juncmate",
+                    "Junction",
+                    "Base",
+                    "Matching",
+                    "Strand",
+                    "Linkage",
+                    "Domain",
+                    "State",
+                    "Symbol",
+                    "Size",
+                    "Rotation",
+                    "Fill Color",
+                    "Outline Color",
+                    "Outline Width",
+                ),
+                secondary_headers,
+            )
 
-                # Store the various containers that the point is in
-                sheet.write(
-                    f"K{row}",
-                    f"Strand#{point.strand.strands.index(point.strand) + 1}",
-                )
-                sheet.write(f"L{row}", str(id(point.linkage)))
-                sheet.write(f"M{row}", f"Domain#{point.domain.index+1}")
-
-                # Store the point styles
-                sheet.write(f"N{row}", point.styles.state)
-                sheet.write(f"O{row}", point.styles.symbol)
-                sheet.write(f"P{row}", point.styles.size)
-                sheet.write(f"Q{row}", point.styles.rotation)
-                sheet.write(f"R{row}", rgb_to_hex(point.styles.fill))
-                sheet.write(f"S{row}", rgb_to_hex(point.styles.outline[0]))
-                sheet.write(f"T{row}", point.styles.outline[1])
+            total = len(points)
+            for written, (row, cells, juncmate, mate) in enumerate(point_rows(), 1):
+                # xlsxwriter rows are index-0, but point rows are numbered as they
+                # appear in Excel (index-1)
+                sheet.write_row(row - 1, 0, cells)
+                if juncmate is not None:
+                    sheet.write_formula(row - 1, 7, juncmate, links)
+                if mate is not None:
+                    sheet.write_formula(row - 1, 10, mate, links)
+                if progress is not None and written % progress_interval == 0:
+                    progress(written, total)
+
+            if progress is not None:
+                progress(total, total)
 
         # Create the strands sheet, set its color, and write the data
         strands_sheet = workbook.add_worksheet(strand_sheet_name)
@@ -0,0 +1,185 @@
+"""
+Validate a compact geometry dtype.
+
+Builds regular polygonal nanotubes of many sizes and heights, once with float64
+helix data and once with settings.geometry_dtype set to the compact dtype, and checks
+that both find exactly the same junctable NEMids and juncmates. Also reports how much
+memory the helix data took in each dtype. Exits with status 1 if any design differs.
+Run it as a script:
+
+    python -m natug.tools.compact_validation --domains 6 10 14 --heights 25 100
+"""
+
+import argparse
+import logging
+import sys
+from typing import FrozenSet, Iterator, List, Tuple
+
+from natug import settings
+from natug.constants.directions import DOWN, UP
+from natug.structures.domains import Domain, Domains
+from natug.structures.helices import DoubleHelices
+from natug.structures.points import NEMid
+from natug.structures.profiles import NucleicAcidProfile
+
+logger = logging.getLogger(__name__)
+
+#: The profile that the validation designs are built with.
+nucleic_acid_profile = NucleicAcidProfile(
+    D=2.2, H=3.549, g=134.8, T=2, B=21, Z_c=0.17, Z_mate=0.094
+)
+
+#: A junctable NEMid and its juncmate, each identified by its domain index,
+#: direction, and helical index.
+Junction = Tuple[Tuple[int, int, int], Tuple[int, int, int]]
+
+
+def design(domain_count: int, height: int) -> DoubleHelices:
+    """
+    Compute the double helices of a regular polygonal nanotube.
+
+    The helix data is computed without the geometry cache, in the current
+    settings.geometry_dtype.
+
+    Args:
+        domain_count: The number of domains (sides of the polygon).
+        height: The number of NEMids to generate for the body of each helix.
+
+    Returns:
+        The computed double helices.
+    """
+    theta_m_multiple = nucleic_acid_profile.B * (domain_count - 2) // (2 * domain_count)
+    domains = Domains(
+        nucleic_acid_profile,
+        [
+            Domain(
+                nucleic_acid_profile,
+                theta_m_multiple,
+                UP,
+                DOWN,
+                (0, height, 0),
+                (0, height, 0),
+                index=index,
+            )
+            for index in range(domain_count)
+        ],
+        symmetry=1,
+    )
+    double_helices = DoubleHelices.from_domains(domains, nucleic_acid_profile)
+    double_helices.compute(cache=False)
+    return double_helices
+
+
+def junctions(double_helices: DoubleHelices) -> FrozenSet[Junction]:
+    """
+    Find the junctable NEMids of double helices.
+
+    Args:
+        double_helices: The computed double helices.
+
+    Returns:
+        Every junctable NEMid with its juncmate.
+    """
+
+    def identify(point: NEMid) -> Tuple[int, int, int]:
+        return point.domain.index, int(point.direction), point.helical_index
+
+    return frozenset(
+        (identify(point), identify(point.juncmate))
+        for strand in double_helices.strands()
+        for point in strand.items.by_type(NEMid)
+        if point.junctable
+    )
+
+
+def nbytes(double_helices: DoubleHelices) -> int:
+    """The number of bytes that the coord and angle arrays of double helices take."""
+    return sum(
+        getattr(helix.data, name).nbytes
+        for helix in double_helices.helices()
+        for name in helix.data._mappable_arrays
+    )
+
+
+def validate(
+    domain_counts: List[int], heights: List[int], dtype: str
+) -> Iterator[Tuple[int, int, int, int, int, int]]:
+    """
+    Compare the junctions of designs computed in float64 and in a compact dtype.
+
+    Args:
+        domain_counts: The domain counts of the designs to validate.
+        heights: The body heights of the designs to validate.
+        dtype: The compact dtype to validate.
+
+    Yields:
+        The domain count, height, number of junctions, number of junctions that
+        differ, and float64 and compact helix data sizes in bytes of each design.
+    """
+    previous = settings.geometry_dtype
+    try:
+        for domain_count in domain_counts:
+            for height in heights:
+                settings.geometry_dtype = "float64"
+                reference = design(domain_count, height)
+                settings.geometry_dtype = dtype
+                compact = design(domain_count, height)
+
+                expected, actual = junctions(reference), junctions(compact)
+                yield (
+                    domain_count,
+                    height,
+                    len(expected),
+                    len(expected ^ actual),
+                    nbytes(reference),
+                    nbytes(compact),
+                )
+    finally:
+        settings.geometry_dtype = previous
+
+
+def main(argv: List[str] | None = None) -> None:
+    """Run the compact dtype validation from the command line."""
+    parser = argparse.ArgumentParser(description="Validate a compact geometry dtype.")
+    parser.add_argument(
+        "--domains",
+        type=int,
+        nargs="+",
+        default=[6, 10, 14, 20],
+        help="The domain counts of the designs to validate.",
+    )
+    parser.add_argument(
+        "--heights",
+        type=int,
+        nargs="+",
+        default=[25, 100, 400],
+        help="The body heights of the designs to validate.",
+    )
+    parser.add_argument(
+        "--dtype", default="float32", help="The compact dtype to validate."
+    )
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.WARNING)
+
+    print(
+        f"{'Domains':>8} {'Height':>8} {'Junctions':>10} {'Differ':>8} "
+        f"{'KiB':>10} {args.dtype + ' KiB':>14}"
+    )
+    failed = False
+    for domain_count, height, count, differ, full, compact in validate(
+        args.domains, args.heights, args.dtype
+    ):
+        failed = failed or bool(differ)
+        print(
+            f"{domain_count:>8} {height:>8} {count:>10} {differ:>8} "
+            f"{full // 1024:>10} {compact // 1024:>14}",
+            flush=True,
+        )
+    if failed:
+        print(f"Junctions differ in {args.dtype}.")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""
+Benchmark the strands workbook export.
+
+Builds regular 14-gon nanotubes of increasing height, exports each one with
+Strands.export_workbook, and reports how long the export took and how large the
+workbook was for each point count. Run it as a script:
+
+    python -m natug.tools.export_benchmark 25 50 100 200 --directory benchmark
+"""
+
+import argparse
+import logging
+import os
+import tempfile
+import time
+from typing import Iterator, List, Tuple
+
+from natug.constants.directions import DOWN, UP
+from natug.structures.domains import Domain, Domains
+from natug.structures.helices import DoubleHelices
+from natug.structures.points.point import Point
+from natug.structures.profiles import NucleicAcidProfile
+from natug.structures.strands import Strands
+
+logger = logging.getLogger(__name__)
+
+#: The profile that the benchmark designs are built with.
+nucleic_acid_profile = NucleicAcidProfile(
+    D=2.2, H=3.549, g=134.8, T=2, B=21, Z_c=0.17, Z_mate=0.094
+)
+
+#: The number of domains in the benchmark designs (a regular 14-gon).
+domain_count = 14
+
+
+def design(height: int) -> Strands:
+    """
+    Build the strands of a regular 14-gon nanotube.
+
+    Args:
+        height: The number of NEMids to generate for the body of each helix.
+
+    Returns:
+        The strands of the nanotube.
+    """
+    theta_m_multiple = nucleic_acid_profile.B * (domain_count - 2) // (2 * domain_count)
+    domains = Domains(
+        nucleic_acid_profile,
+        [
+            Domain(
+                nucleic_acid_profile,
+                theta_m_multiple,
+                UP,
+                DOWN,
+                (0, height, 0),
+                (0, height, 0),
+                index=index,
+            )
+            for index in range(domain_count)
+        ],
+        symmetry=1,
+    )
+    double_helices = DoubleHelices.from_domains(domains, nucleic_acid_profile)
+    double_helices.compute()
+    return double_helices.strands()
+
+
+def benchmark(heights: List[int], directory: str) -> Iterator[Tuple[int, float, int]]:
+    """
+    Time the workbook export of designs of many heights.
+
+    Args:
+        heights: The body heights of the designs to benchmark.
+        directory: The directory to write the workbooks to.
+
+    Yields:
+        The point count, export time in seconds, and workbook size in bytes of each
+        design.
+    """
+    for height in heights:
+        strands = design(height)
+        points = sum(len(strand.items.by_type(Point)) for strand in strands)
+        filepath = os.path.join(directory, f"export_{height}.xlsx")
+
+        start = time.perf_counter()
+        strands.export_workbook(filepath)
+        duration = time.perf_counter() - start
+
+        yield points, duration, os.path.getsize(filepath)
+
+
+def main(argv: List[str] | None = None) -> None:
+    """Run the export benchmark from the command line."""
+    parser = argparse.ArgumentParser(description="Benchmark the workbook export.")
+    parser.add_argument(
+        "heights",
+        type=int,
+        nargs="*",
+        default=[25, 50, 100, 200, 400],
+        help="The body heights of the designs to export.",
+    )
+    parser.add_argument(
+        "-d",
+        "--directory",
+        help="A directory to keep the workbooks in (defaults to a temporary one).",
+    )
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.WARNING)
+
+    with tempfile.TemporaryDirectory() as temporary:
+        directory = args.directory or temporary
+        os.makedirs(directory, exist_ok=True)
+
+        print(f"{'Points':>10} {'Seconds':>10} {'Points/s':>10} {'KiB':>10}")
+        for points, duration, size in benchmark(args.heights, directory):
+            print(
+                f"{points:>10} {duration:>10.3f} {points / duration:>10.0f} "
+                f"{size // 1024:>10}",
+                flush=True,
+            )
+
+
+if __name__ == "__main__":
+    main()
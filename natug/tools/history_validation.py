@@ -0,0 +1,231 @@
+"""
+Validate the undo/redo history of strand edits.
+
+Builds a regular polygonal nanotube, makes edits to its strands, and then checks
+that undoing each edit restores exactly the strands from before it, and that
+redoing each edit restores exactly the strands from after it. There are fixed
+regression scenarios (for example, nicking a strand beside a linkage and then
+undoing both edits) followed by random sequences of edits. Exits with status 1 if
+any check fails. Run it as a script:
+
+    python -m natug.tools.history_validation --domains 12 --height 30 --trials 40
+"""
+
+import argparse
+import logging
+import random
+import sys
+from typing import Callable, FrozenSet, Iterator, List, Tuple
+
+from natug.structures.points import NEMid
+from natug.structures.strands import Strands
+from natug.structures.strands.bulk import link_mate
+from natug.structures.strands.linkage import Linkage
+from natug.tools.compact_validation import design
+
+logger = logging.getLogger(__name__)
+
+#: The strands of a container, as the closedness and item identities of each strand.
+#: Closed strands are rotated to begin at a fixed item, since they have no start.
+#: Linkages are identified by their nucleosides, since redoing a link creates a new
+#: Linkage object that takes over the nucleosides of the old one.
+State = FrozenSet[Tuple[bool, tuple]]
+
+#: An edit to make to a Strands container. Returns False if it could not be made.
+Edit = Callable[[Strands, random.Random], bool]
+
+
+def state(strands: Strands) -> State:
+    """Capture the strands of a container, for comparing before and after edits."""
+    captured = set()
+    for strand in strands.strands:
+        items = [
+            tuple(map(id, item.items)) if isinstance(item, Linkage) else id(item)
+            for item in strand.items
+        ]
+        if strand.closed and items:
+            start = items.index(min(item for item in items if isinstance(item, int)))
+            items = items[start:] + items[:start]
+        captured.add((strand.closed, tuple(items)))
+    return frozenset(captured)
+
+
+def _NEMids(strands: Strands) -> List[NEMid]:
+    return [point for point in strands.items(NEMid) if point.strand is not None]
+
+
+def nick(strands: Strands, rng: random.Random) -> bool:
+    """Nick a random NEMid."""
+    strands.nick(rng.choice(_NEMids(strands)))
+    return True
+
+
+def conjunct(strands: Strands, rng: random.Random) -> bool:
+    """Toggle the junction at a random junctable NEMid."""
+    candidates = [
+        point
+        for point in _NEMids(strands)
+        if point.junctable and point.juncmate.strand is not None
+    ]
+    if not candidates:
+        return False
+    point = rng.choice(candidates)
+    strands.conjunct(point, point.juncmate)
+    return True
+
+
+def link(strands: Strands, rng: random.Random) -> bool:
+    """Link a random strand end to the strand end across its double helix."""
+    candidates = [point for point in _NEMids(strands) if link_mate(point) is not None]
+    if not candidates:
+        return False
+    point = rng.choice(candidates)
+    strands.link(point, link_mate(point))
+    return True
+
+
+def nick_many(strands: Strands, rng: random.Random) -> bool:
+    """Nick every other NEMid along the helix of a random NEMid."""
+    point = rng.choice(_NEMids(strands))
+    strands.do_many("nick", point, 2, None, rng.random() < 0.5, point.helix.data.points)
+    return True
+
+
+def junction_nick(strands: Strands, rng: random.Random) -> List[Edit]:
+    """Make a junction, and then nick one of the NEMids of the junction."""
+    point = rng.choice(
+        [point for point in _NEMids(strands) if point.junctable and point.juncmate]
+    )
+
+    def make_junction(strands, _):
+        strands.conjunct(point, point.juncmate)
+        return True
+
+    def nick_junction(strands, _):
+        strands.nick(point)
+        return True
+
+    return [make_junction, nick_junction]
+
+
+def linkage_nick(strands: Strands, rng: random.Random) -> List[Edit]:
+    """Make a linkage, and then nick a NEMid after it in the linked strand."""
+    point = rng.choice(
+        [point for point in _NEMids(strands) if link_mate(point) is not None]
+    )
+
+    def make_linkage(strands, _):
+        strands.link(point, link_mate(point))
+        return True
+
+    def nick_after_linkage(strands, rng):
+        items = point.strand.items
+        start = next(
+            index for index, item in enumerate(items) if isinstance(item, Linkage)
+        )
+        candidates = [
+            item
+            for item in items[start + 1 :]
+            if isinstance(item, NEMid) and not item.is_endpoint(True)
+        ]
+        strands.nick(rng.choice(candidates))
+        return True
+
+    return [make_linkage, nick_after_linkage]
+
+
+def check(strands: Strands, edits: List[Edit], rng: random.Random) -> List[str]:
+    """
+    Make edits, and then check that undoing and redoing them restores the strands.
+
+    Args:
+        strands: The strands to edit.
+        edits: The edits to make, in order.
+        rng: The random number generator that the edits pick points with.
+
+    Returns:
+        A description of each check that failed.
+    """
+    states = [state(strands)]
+    for edit in edits:
+        if edit(strands, rng):
+            states.append(state(strands))
+
+    failures = []
+    try:
+        for index in range(len(states) - 1, 0, -1):
+            strands.history.undo(strands)
+            if state(strands) != states[index - 1]:
+                failures.append(f"undoing edit {index} did not restore the strands")
+        for index in range(1, len(states)):
+            strands.history.redo(strands)
+            if state(strands) != states[index]:
+                failures.append(f"redoing edit {index} did not restore the strands")
+    except Exception as error:
+        logger.exception("Replaying the history failed.")
+        failures.append(f"replaying the history raised {error!r}")
+    return failures
+
+
+def validate(
+    domain_count: int, height: int, trials: int, length: int, seed: int
+) -> Iterator[Tuple[str, List[str]]]:
+    """
+    Run the regression scenarios and random trials.
+
+    Args:
+        domain_count: The number of domains of the nanotube to edit.
+        height: The number of NEMids to generate for the body of each helix.
+        trials: The number of random sequences of edits to check.
+        length: The number of edits in each random sequence.
+        seed: The seed for the random number generator.
+
+    Yields:
+        The name of each scenario or trial, and its failures.
+    """
+    rng = random.Random(seed)
+
+    # Each check gets a new design, since nicks are written into the helix data
+    for scenario in (junction_nick, linkage_nick):
+        strands = design(domain_count, height).strands()
+        yield scenario.__name__, check(strands, scenario(strands, rng), rng)
+
+    edits = (nick, conjunct, link, nick_many)
+    for trial in range(trials):
+        strands = design(domain_count, height).strands()
+        chosen = [rng.choice(edits) for _ in range(length)]
+        yield f"trial {trial + 1}", check(strands, chosen, rng)
+
+
+def main(argv: List[str] | None = None) -> None:
+    """Run the history validation from the command line."""
+    parser = argparse.ArgumentParser(description="Validate the undo/redo history.")
+    parser.add_argument(
+        "--domains", type=int, default=12, help="The domain count of the nanotube."
+    )
+    parser.add_argument(
+        "--height", type=int, default=30, help="The body height of the nanotube."
+    )
+    parser.add_argument(
+        "--trials", type=int, default=40, help="The number of random trials."
+    )
+    parser.add_argument(
+        "--length", type=int, default=6, help="The number of edits in each trial."
+    )
+    parser.add_argument("--seed", type=int, default=0, help="The random seed.")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.WARNING)
+
+    failed = False
+    for name, failures in validate(
+        args.domains, args.height, args.trials, args.length, args.seed
+    ):
+        failed = failed or bool(failures)
+        print(f"{name}: {'; '.join(failures) or 'ok'}", flush=True)
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
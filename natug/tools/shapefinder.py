@@ -1,91 +1,286 @@
-from functools import cache
+"""
+Search for closed nanotube shapes.
 
+A shape is described by the theta_m multiples of the domains in a single subunit.
+The full tube is that subunit repeated R (the symmetry) times, and a tube with C
+domains closes if the sum of its theta_m multiples is B * (C - 2) / 2 and the
+top view of the domains loops back onto itself.
+
+This module enumerates every distinct subunit (with rotational and reflective
+duplicates removed), tests batches of candidates for closure with the batched top
+view geometry of natug.structures.domains, and spreads the search across processes.
+Run it as a script to search from the command line:
+
+    python -m natug.tools.shapefinder 8 1 --profile profile.json -o matches.txt
+"""
+
+import argparse
+import logging
+import multiprocessing
+from itertools import islice
+from typing import Iterable, Iterator, List, Tuple
+
+import numpy as np
+
+from natug import settings
+from natug.structures.domains import domains
 from natug.structures.profiles import NucleicAcidProfile
 
-C = 8  # number of domains
-R = 1  # symmetry factor
-nucleic_acid_profile = NucleicAcidProfile(
+logger = logging.getLogger(__name__)
+
+#: The profile searched with when none is given on the command line.
+default_nucleic_acid_profile = NucleicAcidProfile(
     D=2.2, H=3.549, g=134.8, T=2, B=21, Z_c=0.17, Z_mate=0.094
 )
 
+#: The number of candidates that are tested for closure at once.
+batch_size = 50000
 
-class Combo(tuple):
-    """A combination of numbers that add up to a target number."""
 
-    def __eq__(self, other):
-        return sorted(self) == sorted(other)
+def target_sum(nucleic_acid_profile: NucleicAcidProfile, C: int, R: int) -> int:
+    """
+    The sum of the theta_m multiples of a subunit of a closed tube.
 
-    def __hash__(self):
-        return hash(tuple(sorted(tuple(self))))
+    Args:
+        nucleic_acid_profile: The nucleic acid profile to search with.
+        C: The total number of domains.
+        R: The symmetry.
 
+    Returns:
+        The sum that the theta_m multiples of one subunit must add up to.
 
-def find_combos(n, c):
-    """Find all the ways to combine c numbers to add up to n."""
-    combinations = set()
+    Raises:
+        ValueError: If no integer sum exists for the given C and R.
+    """
+    if C < 3 or R < 1 or C % R != 0:
+        raise ValueError("C must be at least 3 and a multiple of R", (C, R))
+    total = nucleic_acid_profile.B * (C - 2)
+    if total % (2 * R) != 0:
+        raise ValueError("B * (C - 2) is not divisible by 2R", (C, R))
+    return total // (2 * R)
 
-    @cache
-    def new_options(current_combo):
-        current_combo = list(current_combo)
 
-        options = []
-        for i in range(c):
-            new_combo = list(current_combo)
+def is_canonical(combo: Tuple[int, ...]) -> bool:
+    """
+    Whether a combo is the representative of its bracelet.
 
-            if new_combo[i] - 1 < 0:
-                continue
+    Every rotation and reflection of a combo describes the same shape, so only the
+    lexicographically smallest of them is kept.
 
-            new_combo[i] -= 1
-            for ii in range(c):
-                rerun_on_combo = new_combo.copy()
-                rerun_on_combo[ii] += 1
-                options.append(rerun_on_combo)
+    Args:
+        combo: The theta_m multiples of a subunit.
 
-        return options
+    Returns:
+        True if no rotation or reflection of the combo is smaller than it.
+    """
+    reflected = combo[::-1]
+    for shift in range(len(combo)):
+        if combo[shift:] + combo[:shift] < combo:
+            return False
+        if reflected[shift:] + reflected[:shift] < combo:
+            return False
+    return True
 
-    def combo_finder():
-        base = tuple([n] + [0] * (c - 1))  # [1, 0, 0, ...0] where length is c
 
-        options = new_options(base)
-        for option in options:
-            if 0 not in option:
-                combinations.add(tuple(option))
+def prefixes(n: int, k: int, maximum: int) -> List[Tuple[int, int]]:
+    """
+    Split the search for bracelets into independent tasks.
 
-        counter = 0
+    Each task is a (first, second) pair of leading theta_m multiples. Since a
+    canonical combo starts with its smallest element, every other element must be
+    at least as large as the first one.
 
-        def searcher(options, tick):
-            nonlocal counter
+    Args:
+        n: The sum that the combos must add up to.
+        k: The number of elements in each combo.
+        maximum: The largest allowed theta_m multiple.
 
-            counter += 1
-            if counter % 10000000 == 0:
-                print(counter, tick, len(combinations), combinations)
+    Returns:
+        A list of the leading pairs that may start a canonical combo.
+    """
+    tasks = []
+    for first in range(1, min(n // k, maximum) + 1):
+        if k == 1:
+            tasks.append((first,))
+            continue
+        for second in range(first, min(maximum, n - first * (k - 1)) + 1):
+            remaining = n - first - second
+            if first * (k - 2) <= remaining <= maximum * (k - 2):
+                tasks.append((first, second))
+    return tasks
 
-            if tick == 0:
-                return
-            else:
-                for option in options:
-                    option = tuple(option)
-                    if 0 not in option:
-                        combinations.add(option)
-                    searcher(new_options(option), tick - 1)
 
-        searcher(options, n)  # should be n
+def bracelets(
+    n: int, k: int, maximum: int, prefix: Tuple[int, ...] = ()
+) -> Iterator[Tuple[int, ...]]:
+    """
+    Yield every canonical combo of k positive integers that add up to n.
+
+    Args:
+        n: The sum that the combos must add up to.
+        k: The number of elements in each combo.
+        maximum: The largest allowed theta_m multiple.
+        prefix: Leading elements that every yielded combo must start with.
+
+    Yields:
+        Canonical combos, with rotational and reflective duplicates removed.
+    """
+    if not prefix:
+        for task in prefixes(n, k, maximum):
+            yield from bracelets(n, k, maximum, task)
+        return
+
+    minimum = prefix[0]
+    combo = list(prefix) + [0] * (k - len(prefix))
+
+    def fill(index: int, remaining: int):
+        slots = k - index
+        if slots == 0:
+            if remaining == 0:
+                candidate = tuple(combo)
+                if is_canonical(candidate):
+                    yield candidate
+            return
+        lower = max(minimum, remaining - maximum * (slots - 1))
+        upper = min(maximum, remaining - minimum * (slots - 1))
+        for value in range(lower, upper + 1):
+            combo[index] = value
+            yield from fill(index + 1, remaining - value)
+
+    yield from fill(len(prefix), n - sum(prefix))
+
+
+def closure_gaps(
+    combos: np.ndarray, nucleic_acid_profile: NucleicAcidProfile, R: int
+) -> np.ndarray:
+    """
+    Compute how far from closed many candidate tubes are.
+
+    All the domains are taken to have parallel helical joints (so that theta_i =
+    theta_m).
+
+    Args:
+        combos: An (N, C/R) integer array of subunit theta_m multiples.
+        nucleic_acid_profile: The nucleic acid profile to search with.
+        R: The symmetry.
 
-    combo_finder()
+    Returns:
+        An (N,) array of distances between the first and last top view coordinates.
+    """
+    theta_i = np.tile(combos, R) * nucleic_acid_profile.theta_c
+    return domains.closure_gaps(theta_i, nucleic_acid_profile.D)
 
-    return combinations
 
+def _batches(
+    combos: Iterable[Tuple[int, ...]], size: int
+) -> Iterator[List[Tuple[int, ...]]]:
+    """Split an iterable of combos into lists of at most size combos."""
+    combos = iter(combos)
+    while batch := list(islice(combos, size)):
+        yield batch
 
-def shapefind():
-    target_M_over_R = (nucleic_acid_profile.B * (C - 2)) // (2 * R)
 
-    assert closes([4, 13, 4, 14] * 3, nucleic_acid_profile)
+def _search_prefix(
+    args: Tuple[Tuple[int, ...], int, int, int, int, NucleicAcidProfile]
+) -> Tuple[int, List[Tuple[int, ...]]]:
+    """
+    Search the subtree of combos that start with a given prefix.
 
+    This is the unit of work handed to the worker processes.
+
+    Returns:
+        The number of candidates tested, and the combos that closed.
+    """
+    prefix, n, k, maximum, R, nucleic_acid_profile = args
+
+    tested = 0
     matches = []
-    for combo in find_combos(target_M_over_R, C):
-        if closes(combo, nucleic_acid_profile):
-            matches.append(combo)
+    for batch in _batches(bracelets(n, k, maximum, prefix), batch_size):
+        candidates = np.array(batch, dtype=np.int16)
+        gaps = closure_gaps(candidates, nucleic_acid_profile, R)
+        matches.extend(
+            tuple(int(m) for m in combo)
+            for combo in candidates[gaps < settings.closed_threshold]
+        )
+        tested += len(batch)
+
+    return tested, matches
+
+
+def shapefind(
+    C: int,
+    R: int,
+    nucleic_acid_profile: NucleicAcidProfile = default_nucleic_acid_profile,
+    processes: int | None = None,
+) -> Iterator[Tuple[int, ...]]:
+    """
+    Find every distinct subunit that produces a closed tube.
+
+    Args:
+        C: The total number of domains.
+        R: The symmetry.
+        nucleic_acid_profile: The nucleic acid profile to search with.
+        processes: The number of worker processes. Defaults to the cpu count.
+
+    Yields:
+        The theta_m multiples of each closing subunit, as they are found.
+    """
+    n = target_sum(nucleic_acid_profile, C, R)
+    k = C // R
+    maximum = nucleic_acid_profile.B - 1
+    tasks = [
+        (prefix, n, k, maximum, R, nucleic_acid_profile)
+        for prefix in prefixes(n, k, maximum)
+    ]
+    logger.info("Searching C=%s, R=%s (sum %s) across %s tasks", C, R, n, len(tasks))
+
+    tested = 0
+    with multiprocessing.Pool(processes) as pool:
+        for count, matches in pool.imap_unordered(_search_prefix, tasks):
+            tested += count
+            yield from matches
+
+    logger.info("Tested %s candidates", tested)
+
+
+def main(argv: List[str] | None = None) -> None:
+    """Run the shape finder from the command line."""
+    parser = argparse.ArgumentParser(description="Search for closed nanotubes.")
+    parser.add_argument("C", type=int, help="The total number of domains.")
+    parser.add_argument("R", type=int, help="The symmetry.")
+    parser.add_argument(
+        "-p", "--profile", help="A nucleic acid profile json file to search with."
+    )
+    parser.add_argument(
+        "-o", "--output", help="A file to stream matches to (defaults to stdout)."
+    )
+    parser.add_argument("-j", "--processes", type=int, help="Worker process count.")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO)
+
+    if args.profile:
+        nucleic_acid_profile = NucleicAcidProfile.from_file(args.profile)
+    else:
+        nucleic_acid_profile = default_nucleic_acid_profile
+
+    found = 0
+    output = open(args.output, "w") if args.output else None
+    try:
+        for combo in shapefind(args.C, args.R, nucleic_acid_profile, args.processes):
+            line = " ".join(map(str, combo))
+            if output:
+                output.write(line + "\n")
+                output.flush()
+            else:
+                print(line, flush=True)
+            found += 1
+    finally:
+        if output:
+            output.close()
 
-    print(matches)
+    logger.info("Found %s closing shapes", found)
 
 
-shapefind()
+if __name__ == "__main__":
+    main()
@@ -4,6 +4,7 @@ from PyQt6.QtCore import pyqtSlot
 from PyQt6.QtWidgets import QVBoxLayout, QWidget
 from PyQt6 import uic
 
+from natug import utils
 from natug.constants.tabs import *
 from natug.constants.toolbar import *
 from natug.structures.points import NEMid, Nucleoside
@@ -39,6 +40,7 @@ class Panel(QWidget):
         self.domains = None
         self.sequencing = None
         self.snapshots = None
+        self._refresh_requested = False
 
         # Load the panel
         uic.loadUi("./ui/config/panel.ui", self)
@@ -84,20 +86,25 @@ class Panel(QWidget):
             self.nucleic_acid.updated: When the nucleic acid tab has been updated.
             self.tab_area.currentChanged: When the current tab has been changed.
             self.update_graphs.clicked: When the update graphs button has been clicked.
+            self.runner.recomputer.progressed: When a background recompute progresses.
+            self.runner.recomputer.recomputed: When a background recompute finishes.
+            self.runner.recomputer.failed: When a background recompute fails.
         """
         self.domains.updated.connect(self._on_tab_update)
         self.nucleic_acid.updated.connect(self._on_tab_update)
         self.tab_area.currentChanged.connect(self._on_tab_change)
         self.update_graphs.clicked.connect(self._on_update_graphs)
         self.export_graphs.clicked.connect(self._on_export_graphs)
+        self.runner.recomputer.progressed.connect(self._on_recompute_progressed)
+        self.runner.recomputer.recomputed.connect(self._on_recomputed)
+        self.runner.recomputer.failed.connect(self._on_recompute_failed)
 
     @pyqtSlot()
     def _on_update_graphs(self):
         """Update the graphs and recompute the helix graph."""
         if RefreshConfirmer.run(self.runner):
-            self.runner.managers.strands.recompute()
-            self.runner.window.side_view.refresh()
-            self.runner.window.top_view.refresh()
+            self._refresh_requested = True
+            self.runner.recomputer.start()
 
     @pyqtSlot()
     def _on_export_graphs(self):
@@ -107,11 +114,36 @@ class Panel(QWidget):
     @pyqtSlot()
     def _on_tab_update(self):
         """Worker for when a tab is updated and wants to call a function"""
-        self.runner.managers.strands.recompute()
-        if self.auto_update_side_view.isChecked():
+        self.runner.recomputer.start()
+
+    @pyqtSlot(str, int, int)
+    def _on_recompute_progressed(self, stage: str, number: int, count: int):
+        """Show the progress of a background recompute in the status bar."""
+        self.runner.window.statusBar().showMessage(
+            f"Recomputing: {stage} ({number}/{count})"
+        )
+
+    @pyqtSlot()
+    def _on_recomputed(self):
+        """Refresh the graphs once a background recompute has finished."""
+        self.runner.window.statusBar().clearMessage()
+        if self._refresh_requested or self.auto_update_side_view.isChecked():
             self.runner.window.side_view.refresh()
-        if self.auto_update_top_view.isChecked():
+        if self._refresh_requested or self.auto_update_top_view.isChecked():
             self.runner.window.top_view.refresh()
+        self._refresh_requested = False
+
+    @pyqtSlot(str)
+    def _on_recompute_failed(self, message: str):
+        """Clear the recompute progress, and warn if the user asked for it."""
+        self.runner.window.statusBar().clearMessage()
+        if self._refresh_requested:
+            utils.warning(
+                self.runner.window,
+                "Recompute failed",
+                f"The graphs could not be recomputed: {message}",
+            )
+        self._refresh_requested = False
 
     @pyqtSlot()
     def _on_tab_change(self):
@@ -10,6 +10,7 @@ from PyQt6 import uic
 from natug import settings, utils
 from natug.structures.domains import Domains
 from natug.structures.profiles import NucleicAcidProfile
+from natug.ui.config.tabs.domains.previewer import DomainsPreviewer
 from natug.ui.config.tabs.domains.tables.panel import DomainsTablesArea
 from natug.ui.dialogs.refresh_confirmer.refresh_confirmer import RefreshConfirmer
 from natug.ui.resources import fetch_icon
@@ -43,6 +44,9 @@ class DomainsPanel(QWidget):
         )
         self.layout().addWidget(self.tables)
 
+        # Previews table edits in the top view while live preview is checked
+        self.previewer = DomainsPreviewer(self, self.runner)
+
         # Run setup functions
         self._hook_signals()
         self._prettify()
@@ -73,6 +77,14 @@ class DomainsPanel(QWidget):
             antiparallel=self.auto_antiparallel.isChecked(),
         )
 
+    def _fetch_normalized_domains(self) -> Domains:
+        """Fetch the domains, with theta multiples reduced modulo B."""
+        nucleic_acid_profile = self.runner.managers.nucleic_acid_profile.current
+        domains = self.fetch_domains(nucleic_acid_profile)
+        for domain in domains.subunit:
+            domain.theta_m_multiple = domain.theta_m_multiple % nucleic_acid_profile.B
+        return domains
+
     def dump_domains(self, domains: Domains) -> None:
         """
         Dump a Domains object's domains into the domains table and settings into the
@@ -80,7 +92,11 @@ class DomainsPanel(QWidget):
 
         Args:
             domains: The Domains object to dump.
+
+        Notes:
+            Any domains that were being previewed are discarded.
         """
+        self.previewer.discard()
         self.tables.blockSignals(True)
         self.symmetry.blockSignals(True)
         self.auto_antiparallel.blockSignals(True)
@@ -171,14 +187,7 @@ class DomainsPanel(QWidget):
         # Warn the user if they are about to overwrite strand data, and give them the
         # opportunity to save the current state and then update the domains.
         if RefreshConfirmer.run(self.runner):
-            new_domains = self.fetch_domains(
-                self.runner.managers.nucleic_acid_profile.current
-            )
-            for domain in new_domains.subunit:
-                domain.theta_m_multiple = (
-                    domain.theta_m_multiple
-                    % self.runner.managers.nucleic_acid_profile.current.B
-                )
+            new_domains = self._fetch_normalized_domains()
 
             if (
                 new_domains.antiparallel
@@ -213,6 +222,7 @@ class DomainsPanel(QWidget):
 
         Hooks the following signals:
             - table.cell_widget_updated
+            - live_preview.stateChanged
             - table.helix_joint_updated
             - symmetry.valueChanged
             - subunit_count.valueChanged
@@ -220,7 +230,8 @@ class DomainsPanel(QWidget):
             - table.helix_joint_updated
             - auto_antiparallel_button.clicked
         """
-        self.tables.cell_widget_updated.connect(self._push_updates)
+        self.tables.cell_widget_updated.connect(self._on_domains_edited)
+        self.live_preview.stateChanged.connect(self._on_live_preview_toggled)
 
         # Make sure that the total domain count is updated as the summands are changed.
         self.symmetry.valueChanged.connect(self._on_symmetry_setting_change)
@@ -232,7 +243,7 @@ class DomainsPanel(QWidget):
         # Reset the checked button when a helix joint is updated because the user has
         # opted out of the auto-antiparallel feature by changing the helix joint
         self.tables.helix_joint_updated.connect(self._on_helix_joint_updated)
-        self.auto_antiparallel.stateChanged.connect(self._push_updates)
+        self.auto_antiparallel.stateChanged.connect(self._on_domains_edited)
 
         # Set up the save/load buttons slots
         self.save_domains_button.clicked.connect(self._on_save_button_clicked)
@@ -246,6 +257,20 @@ class DomainsPanel(QWidget):
         self.subunit_count.valueChanged.connect(self._on_settings_panel_input_update)
         self.symmetry.valueChanged.connect(self._on_settings_panel_input_update)
 
+    @pyqtSlot()
+    def _on_domains_edited(self):
+        """Preview the edited domains if live preview is checked, or apply them."""
+        if self.live_preview.isChecked():
+            self.previewer.preview(self._fetch_normalized_domains())
+        else:
+            self._push_updates()
+
+    @pyqtSlot()
+    def _on_live_preview_toggled(self):
+        """Apply the previewed domains when live preview is unchecked."""
+        if not self.live_preview.isChecked() and self.previewer.domains is not None:
+            self._push_updates()
+
     @pyqtSlot()
     def _on_rotate_down_button_clicked(self):
         """Rotate the domains down by one. Top domain becomes bottom domain."""
@@ -287,7 +312,13 @@ class DomainsPanel(QWidget):
 
     @pyqtSlot()
     def _on_table_update_button_clicked(self):
-        new_table_domains = copy(self.runner.managers.domains.current)
+        # While previewing the table holds edits that have not been applied yet
+        if self.previewer.domains is not None:
+            new_table_domains = self.fetch_domains(
+                self.runner.managers.nucleic_acid_profile.current
+            )
+        else:
+            new_table_domains = copy(self.runner.managers.domains.current)
         new_table_domains.subunit.count = self.subunit_count.value()
         self.tables.dump_domains(new_table_domains.subunit.domains)
         self._push_updates()
@@ -0,0 +1,125 @@
+import logging
+from contextlib import suppress
+from dataclasses import replace
+from functools import partial
+from typing import TYPE_CHECKING
+
+from PyQt6.QtCore import QObject, QTimer, pyqtSlot
+
+from natug import settings
+from natug.runner.recomputer import RecomputeWorker
+from natug.structures.domains import Domains
+from natug.structures.helices import DoubleHelices
+from natug.structures.helices.double_helices import geometry_key
+
+if TYPE_CHECKING:
+    from natug import runner
+
+logger = logging.getLogger(__name__)
+
+
+class DomainsPreviewer(QObject):
+    """
+    A live preview of domains that are being edited but have not been applied yet.
+
+    Previewed domains are plotted in the top view right away, since the top view only
+    needs the cheap Domains.top_view() path. Once the edits pause, the helix data of
+    the previewed domains is computed by a background RecomputeWorker and offered to
+    the double helices manager, so that applying the domains only has to rebuild the
+    strands. A computation is cancelled as soon as a newer preview arrives.
+
+    Attributes:
+        runner: NATuG's runner.
+        domains: The domains being previewed, or None if nothing is being previewed.
+
+    Methods:
+        preview: Preview domains.
+        discard: Stop previewing, and plot the current domains again.
+    """
+
+    def __init__(self, parent, runner: "runner.Runner") -> None:
+        """
+        Initialize the previewer.
+
+        Args:
+            parent: The parent QObject.
+            runner: NATuG's runner.
+        """
+        super().__init__(parent)
+        self.runner = runner
+        self.domains = None
+        self._worker: RecomputeWorker | None = None
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(settings.preview_delay)
+        self._timer.timeout.connect(self._compute)
+
+    def preview(self, domains: Domains) -> None:
+        """
+        Preview domains.
+
+        The top view is replotted immediately, and the helix data is computed after
+        settings.preview_delay milliseconds without a newer preview.
+
+        Args:
+            domains: The domains to preview.
+        """
+        self.domains = domains
+        # Cancel any computation that is still running for an older preview
+        if self._worker is not None:
+            self._worker.cancel()
+            self._worker = None
+        self._plot(domains)
+        self._timer.start()
+
+    def discard(self) -> None:
+        """
+        Stop previewing, and plot the current domains again.
+
+        A computation that is already running is left to finish, since its result is
+        only used if the current domains end up with the same shape.
+        """
+        self._timer.stop()
+        if self.domains is None:
+            return
+        self.domains = None
+        self._plot(self.runner.managers.domains.current)
+
+    def _plot(self, domains: Domains) -> None:
+        """
+        Plot domains in the top view.
+
+        The inversion buttons are hidden while previewing, since they would invert
+        the previewed domains rather than the current ones.
+        """
+        with suppress(AttributeError):
+            plot = self.runner.window.top_view.plot
+            plot.domains = domains
+            plot.plot_buttons = domains is self.runner.managers.domains.current
+            self.runner.window.top_view.refresh()
+
+    @pyqtSlot()
+    def _compute(self) -> None:
+        """Compute the helix data of the previewed domains in the background."""
+        if self.domains is None:
+            return
+        # Snapshot the current state, since it may be edited while the worker runs
+        nucleic_acid_profile = replace(
+            self.runner.managers.nucleic_acid_profile.current
+        )
+        domains = self.domains.snapshot(nucleic_acid_profile)
+        key = geometry_key(domains, nucleic_acid_profile)
+        prepared = self.runner.managers.double_helices.prepared
+        if prepared is not None and prepared[0] == key:
+            return
+        self._worker = worker = RecomputeWorker(
+            domains, nucleic_acid_profile, build_strands=False, parent=self
+        )
+        worker.computed.connect(partial(self._on_computed, key))
+        worker.finished.connect(worker.deleteLater)
+        worker.start()
+
+    def _on_computed(self, key: tuple, double_helices: DoubleHelices, _) -> None:
+        """Offer computed double helices to the double helices manager."""
+        self.runner.managers.double_helices.prepare(key, double_helices)
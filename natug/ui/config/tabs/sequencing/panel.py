@@ -5,6 +5,7 @@ from PyQt6.QtWidgets import QFileDialog, QLineEdit, QWidget
 from PyQt6 import uic
 
 from natug import utils
+from natug.structures.strands import exporters
 
 logger = logging.getLogger(__name__)
 
@@ -53,6 +54,25 @@ class SequencingPanel(QWidget):
                         "Cannot Clear Bases",
                         "You cannot clear bases for all bases that have not been set!",
                     )
+            elif operation == "Import":
+                logger.debug("Performing import bulk operation.")
+                filepath = QFileDialog.getOpenFileName(
+                    self.parent(),
+                    "Sequence Import File Chooser",
+                    f"{os.getcwd()}/saves/sequencing/preset",
+                    filter="Sequences (*.fasta *.fa *.txt)",
+                )[0]
+                if not filepath:
+                    return
+                try:
+                    self.runner.managers.strands.current.import_sequences(filepath)
+                except (IndexError, ValueError) as error:
+                    utils.warning(
+                        self.runner.window, "Cannot Import Sequences", str(error)
+                    )
+                    return
+                refresh()
+                logger.info("Imported sequences from %s.", filepath)
 
             self.runner.snapshot()
 
@@ -60,14 +80,22 @@ class SequencingPanel(QWidget):
 
     def _configuration(self):
         """Set up the configuration group box."""
+        for exporter in exporters.exporters.values():
+            self.filetype.addItem(
+                f"{exporter.description} ({exporter.suffix})", exporter.name
+            )
+
+        def current_exporter():
+            """The exporter for the currently chosen filetype."""
+            return exporters.exporter(self.filetype.currentData())
 
         def filetype_updated():
             """Worker for when the filetype is updated."""
             self.filepath.setText(
-                f"{os.getcwd()}{os.path.sep}export{self.filetype.currentText()}"
+                f"{os.getcwd()}{os.path.sep}export{current_exporter().suffix}"
             )
 
-        self.filetype.currentTextChanged.connect(filetype_updated)
+        self.filetype.currentIndexChanged.connect(filetype_updated)
 
         # set the initial filepath
         filetype_updated()
@@ -75,15 +103,17 @@ class SequencingPanel(QWidget):
         # hook the filepath changed click event
         def change_filepath_clicked(event):
             """Worker for when the change filepath button is clicked."""
-            filetype = self.filetype.currentText().replace(".", "")
+            exporter = current_exporter()
             # by default open up the file explorer in the presets folder
             filepath = QFileDialog.getSaveFileName(
                 self.parent(),
                 "Sequence Export Location Chooser",
                 f"{os.getcwd()}/saves/strands/preset",
-                filter=f"*.{filetype} (Excel Spreadsheet)",
+                filter=f"{exporter.description} (*{exporter.suffix})",
             )[0]
             if len(filepath) > 0:
+                if not filepath.endswith(exporter.suffix):
+                    filepath += exporter.suffix
                 self.filepath.setText(filepath)
                 super(QLineEdit, self.filepath).mouseReleaseEvent(event)
 
@@ -92,7 +122,12 @@ class SequencingPanel(QWidget):
         # hook the generate sequences button click event
         def export_sequences_clicked():
             """Worker for when the export sequences button is clicked."""
-            filepath = self.filepath.text()[: self.filepath.text().find(".")]
-            self.runner.managers.strands.current.export_sequence(filepath)
+            exporter = current_exporter()
+            filepath = self.filepath.text()
+            if filepath.endswith(exporter.suffix):
+                filepath = filepath[: -len(exporter.suffix)]
+            self.runner.managers.strands.current.export_sequence(
+                filepath, mode=exporter.name
+            )
 
         self.export_sequences.clicked.connect(export_sequences_clicked)
@@ -5,6 +5,7 @@ from PyQt6.QtWidgets import QDialog
 from PyQt6 import uic
 
 from natug import utils
+from natug.structures.strands.history import Resized, linkage_ends
 from natug.structures.strands.linkage import Linkage
 from natug.ui.dialogs.sequence_editor.display_area import SequenceDisplayArea
 from natug.ui.dialogs.sequence_editor.sequence_editor import SequenceEditor
@@ -30,6 +31,8 @@ class LinkageConfig(QDialog):
     @pyqtSlot()
     def when_finished(self) -> None:
         self.linkage.styles.thickness -= 5
+        if self.linkage.strand is not None:
+            self.linkage.strand.changed()
         self.updated.emit()
 
     def _nucleoside_count(self):
@@ -38,10 +41,22 @@ class LinkageConfig(QDialog):
         @pyqtSlot()
         def nucleoside_count_changed():
             new_count = self.nucleoside_count.value()
+            if new_count == len(self.linkage):
+                return
+            previous = list(self.linkage.items)
             if new_count > len(self.linkage):
                 self.linkage.generate(new_count - len(self.linkage))
             else:
                 self.linkage.trim(len(self.linkage) - new_count)
+
+            # record the resize so that it can be undone
+            if self.linkage.strand is not None:
+                self.linkage.strand.strands.history.record(
+                    Resized(
+                        *linkage_ends(self.linkage), previous, list(self.linkage.items)
+                    )
+                )
+                self.linkage.strand.changed()
             self.sequence_display.bases = self.linkage.sequence
             self.sequence_display.refresh()
 
@@ -35,14 +35,20 @@ class BulkInputSequenceEditor(QWidget):
                 self,
                 "Choose File Location",
                 directory=f"{os.getcwd()}/saves/sequencing/preset",
-                filter="*.txt",
+                filter="Sequences (*.txt *.fasta *.fa)",
             )[0]
             if filepath:
                 # open and load file
                 with open(filepath) as file:
                     file_bases = file.read()
 
-                # remove blank characters
+                # strip FASTA headers and comments, and remove blank characters
+                if file_bases.lstrip().startswith(">"):
+                    file_bases = "\n".join(
+                        line
+                        for line in file_bases.splitlines()
+                        if not line.lstrip().startswith((">", ";"))
+                    )
                 file_bases = "".join(file_bases.split())
 
                 # make sure that the file doesn't contain more bases than we are allowed
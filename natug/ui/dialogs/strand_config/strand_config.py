@@ -1,10 +1,14 @@
+from copy import deepcopy
+
 from PyQt6.QtCore import QTimer, pyqtSignal
 from PyQt6.QtGui import QBrush, QColor
 from PyQt6.QtWidgets import QColorDialog, QDialog, QGraphicsScene
 from PyQt6 import uic
 
+from natug.structures.events import BASES_CHANGED
 from natug.structures.points import NEMid, Nucleoside
 from natug.structures.strands import Strand
+from natug.structures.strands.history import Restyled
 from natug.ui.dialogs.sequence_editor.display_area import SequenceDisplayArea
 from natug.ui.dialogs.sequence_editor.sequence_editor import SequenceEditor
 
@@ -19,6 +23,7 @@ class StrandConfig(QDialog):
         uic.loadUi("./ui/dialogs/strand_config/strand_config.ui", self)
 
         self.strand = strand
+        self.previous_styles = deepcopy(strand.styles)
         self.setWindowTitle(
             f"Strand #{self.strand.strands.index(self.strand) + 1} Config"
         )
@@ -32,7 +37,14 @@ class StrandConfig(QDialog):
         self.finished.connect(self.when_finished)
 
     def when_finished(self) -> None:
+        self.strand.strands.events.unsubscribe(self._on_bases_changed)
         self.strand.styles.reset()
+
+        # record style changes so that they can be undone
+        previous, current = self.previous_styles, deepcopy(self.strand.styles)
+        if (previous.color, previous.thickness) != (current.color, current.thickness):
+            self.strand.strands.history.record(Restyled(self.strand, previous, current))
+        self.strand.changed()
         self.updated.emit()
 
     def _strand_params(self):
@@ -52,16 +64,28 @@ class StrandConfig(QDialog):
         self.sequence_display = SequenceDisplayArea(None, self.strand.sequence)
         self.sequencing_area.layout().insertWidget(0, self.sequence_display)
 
+        # keep the display up to date with bases that change elsewhere, such as by
+        # undoing, or by sequencing the complementary strand
+        self.strand.strands.events.subscribe(self._on_bases_changed, BASES_CHANGED)
+
         def sequencing_editor_clicked():
             """Worker for when 'sequence editor' is clicked."""
             self.strand.sequence = SequenceEditor.fetch_sequence(
                 self.parent(), self.strand.sequence, self.strand.has_complements()
             )
-            self.sequence_display.bases = self.strand.sequence
             self.updated.emit()
 
         self.sequence_editor.clicked.connect(sequencing_editor_clicked)
 
+    def _on_bases_changed(self, event) -> None:
+        """Show the strand's new sequence if any of its bases changed."""
+        for nucleoside in event.data.get("nucleosides", ()):
+            linkage = nucleoside.linkage
+            strand = nucleoside.strand if linkage is None else linkage.strand
+            if strand is self.strand:
+                self.sequence_display.bases = self.strand.sequence
+                return
+
     def _color_selector(self):
         """Set up the color selector."""
 
@@ -5,6 +5,7 @@ from PyQt6.QtCore import pyqtSlot
 from PyQt6.QtWidgets import QGroupBox, QVBoxLayout
 
 from natug.constants.toolbar import *
+from natug.structures.events import STRAND_ADDED, STRAND_MODIFIED, STRAND_REMOVED
 from natug.structures.strands import Strand
 from natug.structures.strands.linkage import Linkage
 from natug.ui import plotters
@@ -24,6 +25,9 @@ class SideViewPanel(QGroupBox):
     contains the refresh() method to update the plot based on the current program's
     settings. To access the child widget, use the .plot attribute.
 
+    Edits to the current strands are replotted as they happen, by listening to the
+    strands' events. Replacing the strands (recomputing) still requires a refresh().
+
     Attributes:
         plot (TopViewPlotter): The top view plot.
 
@@ -62,6 +66,11 @@ class SideViewPanel(QGroupBox):
         self.plot.linkage_clicked.connect(self._on_linkage_clicked)
         self.layout().addWidget(self.plot)
 
+        # The strands manager hands the listener over to new current strands
+        self.runner.managers.strands.current.events.subscribe(
+            self._on_strands_edited, STRAND_ADDED, STRAND_REMOVED, STRAND_MODIFIED
+        )
+
     def refresh(self) -> None:
         """
         Update the current plot.
@@ -75,6 +84,11 @@ class SideViewPanel(QGroupBox):
         self.plot.point_types = self.runner.managers.misc.plot_types
         self.plot.refresh()
 
+    def _on_strands_edited(self, event) -> None:
+        """Replot the strands once they have been edited."""
+        if event.source is self.plot.strands:
+            self.plot.refresh_strands()
+
     @pyqtSlot(object)
     def _on_linkage_clicked(self, linkage: Linkage) -> None:
         """
@@ -124,6 +138,8 @@ class SideViewPanel(QGroupBox):
         strands = self.runner.managers.strands.current
         domains = self.runner.managers.domains.current
         parent = self.parent()
+        # Edits are replotted through the strands' events, so this is only needed for
+        # changes that are not edits, such as selecting and highlighting points
         refresh = self.runner.window.side_view.refresh
 
         if self.runner.window.toolbar.repeat.isChecked():
@@ -146,12 +162,12 @@ class SideViewPanel(QGroupBox):
                 strands,
                 refresh,
                 self.runner,
+                repeat,
             ),
             JUNCTER: partial(
                 workers.juncter,
                 points,
                 strands,
-                refresh,
                 self.runner,
                 repeat,
             ),
@@ -160,7 +176,6 @@ class SideViewPanel(QGroupBox):
                 points,
                 strands,
                 self.runner,
-                refresh,
                 repeat,
             ),
             HIGHLIGHTER: partial(
@@ -20,7 +20,6 @@ logger = logging.getLogger(__name__)
 def juncter(
     point: Point,
     strands: Strands,
-    refresh: Callable,
     runner: "runner.Runner",
     repeat: ActionRepeaterProfile | None,
     error_title: str = "Invalid Point Clicked",
@@ -30,11 +29,8 @@ def juncter(
 
     Args:
         point: The point that was clicked.
-        strands: A reference to all the strands currently plotted.
-        refresh: Function called to refresh plot after juncter mode is run. This
-            function does not always create junctions (for instance, if only one
-            point is passed), so the function only calls refresh if a junction is
-            created.
+        strands: A reference to all the strands currently plotted. The plot reacts
+            to the junctions made in them.
         runner: NATuG's runner.
         error_title: The title of the error dialog that is shown when the user clicks
             an invalid point.
@@ -43,7 +39,8 @@ def juncter(
     """
     if isinstance(point, NEMid) and point.junctable:
         if repeat:
-            repeat.run(point, "conjunct")
+            # Clicking an existing junction removes junctions rather than toggling
+            repeat.run(point, "unjunct" if point.junction else "conjunct")
         else:
             if not bool(point.juncmate) or not bool(point.juncmate.strand):
                 utils.warning(
@@ -55,7 +52,6 @@ def juncter(
                 )
                 return
             strands.conjunct(point, point.juncmate)
-        refresh()
         runner.snapshot()
     else:
         utils.warning(
@@ -177,7 +173,6 @@ def nicker(
     point: Point,
     strands: Strands,
     runner: "Runner",
-    refresh: Callable,
     repeat: ActionRepeaterProfile,
 ) -> None:
     """
@@ -189,7 +184,6 @@ def nicker(
         strands: The strands object containing the points. The nick() method is called
             on this object.
         runner: NATuG's runner.
-        refresh: Function called to refresh plot after nicker mode is run.
         repeat: The action repeater profile to use for repeating the action, or None
             to not repeat the action.
     """
@@ -210,16 +204,19 @@ def nicker(
                     "site.",
                 )
                 return
-            with suppress(IndexError):
-                if isinstance(
-                    potential_linkage := point.surf_strand(2), Linkage
-                ) or isinstance(potential_linkage := point.surf_strand(-2), Linkage):
-                    strands.unlink(potential_linkage)
-
-            strands.nick(point)
+            # unlinking and nicking are undone together
+            with strands.history.group():
+                with suppress(IndexError):
+                    if isinstance(
+                        potential_linkage := point.surf_strand(2), Linkage
+                    ) or isinstance(
+                        potential_linkage := point.surf_strand(-2), Linkage
+                    ):
+                        strands.unlink(potential_linkage)
+
+                strands.nick(point)
 
     runner.snapshot()
-    refresh()
     logger.info("Nicker mode was run.")
 
 
@@ -251,6 +248,7 @@ def linker(
     strands: Strands,
     refresh: Callable,
     runner: "runner.Runner",
+    repeat: ActionRepeaterProfile | None = None,
     error_title="Invalid Selection",
 ):
     """
@@ -261,8 +259,12 @@ def linker(
             recursively created for all points.
         strands: The strands object containing the points. The hairpin() method is
             called on this object.
-        refresh: Function called to refresh plot after linker mode is run.
+        refresh: Function called to refresh plot after points are selected. Linkages
+            that are made are replotted by the plot itself.
         runner: NATuG's runner.
+        repeat: The action repeater profile to use for repeating the action, or None
+            to not repeat the action. Repeated linkages join the ends of strands to
+            the ends across their double helices, so no second point is selected.
         error_title: The title of the error dialog that is shown if the user tries to
             create an invalid linkage. Defaults to "Invalid Selection".
     """
@@ -305,6 +307,12 @@ def linker(
         )
         return
 
+    if repeat:
+        repeat.run(point, "link")
+        runner.snapshot()
+        logger.info("Linkage mode was run.")
+        return
+
     # Store the points that are currently selected
     currently_selected = runner.managers.misc.currently_selected
 
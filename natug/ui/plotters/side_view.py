@@ -83,11 +83,18 @@ class PlotData:
         modifiers: Various modifiers for the scale of various plot aspects.
         points: A mapping of positions of plotted_points to point objects.
         plotted_points: The points.
-        plotted_nicks: The nicks.
+        plotted_nicks: The nicks. All the nicks are plotted as one item.
+        nicks: The plotted nicks, in the order that they were plotted.
+        nick_coords: The plotted (x, z) coordinates of each of the nicks, for finding
+            which nick was clicked.
         plotted_linkages: The linkages.
         plotted_unstable_indicators: All plotted unstable indicators.
         plotted_strokes: The strand pen line.
-        plotted_gridlines: All the grid lines.
+        plotted_gridlines: All the grid lines. Stable gridlines and unstable joint
+            gridlines are each plotted as one multi-segment item.
+        gridlines_key: What the plotted gridlines were built from: the joint
+            stabilities, the number of horizontal gridlines, and the styles. The
+            gridlines are only rebuilt when this changes.
     """
 
     strands: "Strands" = None
@@ -98,10 +105,13 @@ class PlotData:
     points: Dict[Tuple[float, float], "Point"] = field(default_factory=dict)
     plotted_points: List[pg.PlotDataItem] = field(default_factory=list)
     plotted_nicks: List[pg.PlotDataItem] = field(default_factory=list)
+    nicks: List["Nick"] = field(default_factory=list)
+    nick_coords: np.ndarray = field(default_factory=lambda: np.empty((0, 2)))
     plotted_linkages: List[pg.PlotDataItem] = field(default_factory=list)
     plotted_unstable_indicators: List[pg.PlotDataItem] = field(default_factory=list)
     plotted_strokes: List[pg.PlotDataItem] = field(default_factory=list)
     plotted_gridlines: List[pg.PlotDataItem] = field(default_factory=list)
+    gridlines_key: Tuple | None = None
 
 
 class SideViewPlotter(Plotter):
@@ -191,6 +201,7 @@ class SideViewPlotter(Plotter):
 
         # Misc. internal variables
         self._updating_viewbox = False
+        self._strands_refresh_pending = False
 
         # Plot data if requested
         if initial_plot:
@@ -265,6 +276,27 @@ class SideViewPlotter(Plotter):
         QTimer.singleShot(0, runner)
         logger.info("Refreshed side view.")
 
+    def refresh_strands(self):
+        """
+        Replot the strands, points, nicks, and unstable joints.
+
+        This is how the plot reacts to strand edits, which leave the rest of the plot
+        as it was. Many calls in the same event loop turn replot once.
+        """
+        if self._strands_refresh_pending:
+            return
+        self._strands_refresh_pending = True
+        QTimer.singleShot(0, self._replot_strands)
+
+    def _replot_strands(self):
+        self._strands_refresh_pending = False
+        self._plot_strands()
+        self._plot_points()
+        self._plot_nicks()
+        # Junctions change the stability of joints. The gridlines are only rebuilt if
+        # they did.
+        self._plot_gridlines()
+
     def _reset(self, plot_data=None):
         """Clear plot_data from plot. Plot_data defaults to self.plot_data."""
         if plot_data is None:
@@ -281,6 +313,7 @@ class SideViewPlotter(Plotter):
             self.removeItem(linkage)
         for gridline in plot_data.plotted_gridlines:
             self.removeItem(gridline)
+        plot_data.gridlines_key = None
         self.clear()
 
     def _points_clicked(self, event, points):
@@ -288,6 +321,15 @@ class SideViewPlotter(Plotter):
         position = tuple(points[0].pos())
         self.points_clicked.emit(self.plot_data.points[position])
 
+    def _nicks_clicked(self, event, points):
+        """Called when a nick is clicked."""
+        coords = self.plot_data.nick_coords
+        if not len(coords):
+            return
+        position = np.array(tuple(points[0].pos()))
+        index = np.argmin(np.abs(coords - position).sum(axis=1))
+        self.points_clicked.emit(self.plot_data.nicks[index])
+
     def auto_range(self):
         """Configure the range for the plot automatically."""
         self.getViewBox().setXRange(self.x_min, self.x_max, self.padding)
@@ -330,67 +372,91 @@ class SideViewPlotter(Plotter):
                 width=self.modifiers.gridline_mod,
             )
 
-    def _plot_vertical_gridline(self, x: float, unstable: bool = False):
+    def _plot_gridline_segments(
+        self, x_coords: np.ndarray, z_coords: np.ndarray, unstable: bool = False
+    ) -> None:
         """
-        Plot a vertical gridline at a given x coord.
+        Plot many gridlines as a single item.
 
         Args:
-            x: The x coord to plot the gridline at.
-            unstable: Whether the gridline is for an unstable joint. Defaults to False.
-                If True, the pen will be styled slightly differently (red, thicker).
+            x_coords: The x coords of the ends of the gridlines, in pairs.
+            z_coords: The z coords of the ends of the gridlines, in pairs.
+            unstable: Whether the gridlines are for unstable joints. Defaults to
+                False. If True, the pen will be styled slightly differently (red,
+                thicker).
         """
-        self.plot_data.plotted_gridlines.append(
-            self.addLine(
-                x=x,
-                pen=self._fetch_gridline_pen(unstable=unstable),
-            )
+        if not len(x_coords):
+            return
+        gridlines = pg.PlotDataItem(
+            x_coords,
+            z_coords,
+            connect="pairs",
+            pen=self._fetch_gridline_pen(unstable=unstable),
+            skipFiniteCheck=True,
         )
-        self.plot_data.plotted_gridlines[-1].setZValue(-10)
+        gridlines.setZValue(-10)
+        self.plot_data.plotted_gridlines.append(gridlines)
+        self.addItem(gridlines)
 
-    def _plot_horizontal_gridline(self, x: float):
+    def _plot_gridlines(self):
         """
-        Plot a horizontal gridline at a given y coord.
+        Plot the gridlines.
 
-        Args:
-            y: The y coord to plot the gridline at.
+        Gridlines are plotted at each helical joint, and at each helical twist. They
+        are only rebuilt when the number of domains, the height of the plot, or the
+        stability of a joint changes.
         """
-        self.plot_data.plotted_gridlines.append(
-            self.addLine(
-                y=x,
-                pen=self._fetch_gridline_pen(),
-            )
+        # Joint x is on the right of domain x - 1. The joint on the very left side of
+        # the screen is checked by looking at the first domain's left joint.
+        unstable = [not self.double_helices[0].left_joint_is_stable()]
+        unstable.extend(
+            not double_helix.right_joint_is_stable()
+            for double_helix in self.double_helices
         )
-        self.plot_data.plotted_gridlines[-1].setZValue(-10)
+        unstable = np.array(unstable) & self.show_unstable_joints
+
+        # For i in <number of helical twists of the tallest domain> add grid lines.
+        try:
+            twists = ceil(self.height / self.nucleic_acid_profile.H)
+        except ZeroDivisionError:
+            twists = 0
+
+        key = (
+            tuple(unstable),
+            twists,
+            self.nucleic_acid_profile.H,
+            self.modifiers.gridline_mod,
+        )
+        if key == self.plot_data.gridlines_key:
+            return
 
-    def _plot_gridlines(self):
-        """Plot the gridlines."""
-        # Remove the preexisting gridlines
         for gridline in self.plot_data.plotted_gridlines:
             self.removeItem(gridline)
-
-        # Clear preexisting plotted_gridlines
         self.plot_data.plotted_gridlines.clear()
+        self.plot_data.gridlines_key = key
+
+        # The gridlines are segments that reach far beyond the strands, so that they
+        # appear infinite.
+        reach = 1000 * max(self.width, self.height, 1)
+        joints = np.arange(len(unstable), dtype=float)
+        twist_heights = np.arange(twists) * self.nucleic_acid_profile.H
+
+        def vertical(x_coords):
+            return (
+                np.repeat(x_coords, 2),
+                np.tile((self.y_min - reach, self.y_max + reach), len(x_coords)),
+            )
 
-        for index, double_helix in enumerate(self.double_helices):
-            if double_helix.right_joint_is_stable():
-                self._plot_vertical_gridline(index + 1)
-            else:
-                self._plot_vertical_gridline(
-                    index + 1, unstable=self.show_unstable_joints
-                )
-
-        # Check if the joint on the very right side of the screen is unstable by
-        # looking at the first domain's left joint.
-        if self.double_helices[0].left_joint_is_stable():
-            self._plot_vertical_gridline(0)
-        else:
-            self._plot_vertical_gridline(0, unstable=self.show_unstable_joints)
-
-        # Plot the horizontal gridlines for each helical twist
-        with suppress(ZeroDivisionError):
-            # For i in <number of helical twists of the tallest domain> add grid lines.
-            for i in range(0, ceil(self.height / self.nucleic_acid_profile.H)):
-                self._plot_horizontal_gridline(i * self.nucleic_acid_profile.H)
+        horizontal = (
+            np.tile((self.x_min - reach, self.x_max + reach), len(twist_heights)),
+            np.repeat(twist_heights, 2),
+        )
+        stable_x_coords, stable_z_coords = vertical(joints[~unstable])
+        self._plot_gridline_segments(
+            np.concatenate((stable_x_coords, horizontal[0])),
+            np.concatenate((stable_z_coords, horizontal[1])),
+        )
+        self._plot_gridline_segments(*vertical(joints[unstable]), unstable=True)
 
     def _plot_points(self):
         """
@@ -412,8 +478,8 @@ class SideViewPlotter(Plotter):
             symbol_sizes = np.empty(len(to_plot), dtype=int)
             symbol_brushes = np.empty(len(to_plot), dtype=QBrush)
             symbol_pens = np.empty(len(to_plot), dtype=QPen)
-            x_coords = np.empty(len(to_plot), dtype=float)
-            z_coords = np.empty(len(to_plot), dtype=float)
+            x_coords = np.empty(len(to_plot), dtype=settings.geometry_dtype)
+            z_coords = np.empty(len(to_plot), dtype=settings.geometry_dtype)
 
             # Now create the proper plot data for each point one by one
             for point_index, point in enumerate(to_plot):
@@ -445,8 +511,11 @@ class SideViewPlotter(Plotter):
                 z_coords[point_index] = z_coord
 
                 # Update the point mappings. This is a dict that allows us to map the
-                # location of a given point to the point object itself.
-                self.plot_data.points[(x_coord, z_coord)] = point
+                # location of a given point to the point object itself. The location
+                # is read back from the buffers, since clicked points report the
+                # location that was plotted, which is in the geometry dtype.
+                position = (float(x_coords[point_index]), float(z_coords[point_index]))
+                self.plot_data.points[position] = point
 
                 # If the point type is NOT the same as the active point type, use the
                 # current styles of the point. Otherwise, plot a smaller "o" shaped
@@ -578,8 +647,8 @@ class SideViewPlotter(Plotter):
                     stroke_length = len(stroke_segment) + 1
                 else:
                     stroke_length = len(stroke_segment)
-                x_coords = np.zeros(stroke_length, dtype=float)
-                z_coords = np.zeros(stroke_length, dtype=float)
+                x_coords = np.zeros(stroke_length, dtype=settings.geometry_dtype)
+                z_coords = np.zeros(stroke_length, dtype=settings.geometry_dtype)
 
                 for point_index, point in enumerate(stroke_segment):
                     x_coords[point_index] = point.x_coord
@@ -764,44 +833,59 @@ class SideViewPlotter(Plotter):
         Note that nicks exist outside of strands, but represent the old location of where
         a point used to be. Because of this, all the nicks are accessed via Strands.nicks,
         which dynamically keeps track of all the nicks.
+
+        All the nicks share the same style, so they are plotted as a single scatter
+        item, and the nick that was clicked is found from its position.
         """
         for nick in self.plot_data.plotted_nicks:
             self.removeItem(nick)
         self.plot_data.plotted_nicks.clear()
 
-        nick_brush = pg.mkBrush(color=settings.colors["nicks"])
-        for nick_index, nick in enumerate(self.strands.nicks):
-            if nick.x_coord % 1 == 0:
-                x_coord = (
-                    nick.previous_item().domain.index + settings.domain_line_point_shift
-                )
-            else:
-                x_coord = nick.x_coord
-
-            # Create the plot data item for the nick.
-            plotted_nick = pg.PlotDataItem(
-                (x_coord,),  # Just one point: the nick's x coordinate
-                (nick.z_coord,),  # Just one point: the nick's z coordinate
-                # The same styles for all nicks...
-                symbol="o",
-                symbolSize=8 * self.modifiers.nick_mod,
-                pxMode=True,  # means that symbol size doesn't change with zoom
-                symbolBrush=nick_brush,
-                symbolPen=None,  # No outline for the symbol
-                pen=None,  # No line connecting the points
-                name=f"Nick#{nick_index}",
-            )
-            # Store the nick plotter object, which will be used for actually
-            # plotting the nick later.
-            self.plot_data.plotted_nicks.append(plotted_nick)
-            # Create a mapping from the nick's coordinates to the nick itself,
-            # so that when it is clicked, we can find the nick object.
-            self.plot_data.points[(x_coord, nick.z_coord)] = nick
-            # Hook up the nick's onClick method to the _points_clicked method.
-            plotted_nick.sigPointsClicked.connect(self._points_clicked)
+        nicks = list(self.strands.nicks)
+        originals = [nick.original_item for nick in nicks]
+        x_coords = np.fromiter(
+            (point.x_coord for point in originals),
+            dtype=settings.geometry_dtype,
+            count=len(nicks),
+        )
+        z_coords = np.fromiter(
+            (point.z_coord for point in originals),
+            dtype=settings.geometry_dtype,
+            count=len(nicks),
+        )
+        domain_indices = np.fromiter(
+            (point.domain.index for point in originals), dtype=int, count=len(nicks)
+        )
 
-        for nick in self.plot_data.plotted_nicks:
-            self.addItem(nick)
+        # Nicks on a domain line are shifted to the right of the line, into the domain
+        # of the point before them along their helix (which is the nick's domain).
+        x_coords = np.where(
+            x_coords % 1 == 0,
+            domain_indices + settings.domain_line_point_shift,
+            x_coords,
+        )
+
+        self.plot_data.nicks = nicks
+        self.plot_data.nick_coords = np.column_stack((x_coords, z_coords))
+
+        if not nicks:
+            return
+
+        plotted_nicks = pg.PlotDataItem(
+            x_coords,
+            z_coords,
+            symbol="o",
+            symbolSize=8 * self.modifiers.nick_mod,
+            pxMode=True,  # means that symbol size doesn't change with zoom
+            symbolBrush=pg.mkBrush(color=settings.colors["nicks"]),
+            symbolPen=None,  # No outline for the symbol
+            pen=None,  # No line connecting the points
+            skipFiniteCheck=True,
+            name="Nicks",
+        )
+        plotted_nicks.sigPointsClicked.connect(self._nicks_clicked)
+        self.plot_data.plotted_nicks.append(plotted_nicks)
+        self.addItem(plotted_nicks)
 
     def plot(self):
         """
@@ -1,8 +1,9 @@
 import logging
 from dataclasses import dataclass, field
 from math import cos, radians, sin
-from typing import List
+from typing import Dict, List, Tuple
 
+import numpy as np
 import pyqtgraph as pg
 from PyQt6.QtCore import QTimer, pyqtSignal, pyqtSlot
 
@@ -13,6 +14,66 @@ from natug.ui.plotters.plotter import Plotter
 logger = logging.getLogger(__name__)
 
 
+class SpatialIndex:
+    """
+    A uniform grid over some 2D coords, for finding the coord nearest to a position.
+
+    Attributes:
+        coords: An (N, 2) array of the indexed coords.
+        cell_size: The width and height of each grid cell.
+
+    Methods:
+        nearest: Find the index of the coord nearest to a position.
+    """
+
+    __slots__ = "coords", "cell_size", "_cells"
+
+    def __init__(self, coords: np.ndarray, cell_size: float):
+        """
+        Index some coords.
+
+        Args:
+            coords: An (N, 2) array of the coords to index.
+            cell_size: The width and height of each grid cell. Positions further than
+                this from every coord are never matched.
+        """
+        self.coords = np.asarray(coords, dtype=float).reshape(-1, 2)
+        self.cell_size = cell_size
+        self._cells: Dict[Tuple[int, int], List[int]] = {}
+        cells = np.floor(self.coords / cell_size).astype(int)
+        for index, (u_cell, v_cell) in enumerate(cells.tolist()):
+            self._cells.setdefault((u_cell, v_cell), []).append(index)
+
+    def nearest(self, position: Tuple[float, float]) -> int | None:
+        """
+        Find the index of the coord nearest to a position.
+
+        Only the grid cells around the position are searched.
+
+        Args:
+            position: The (u, v) position.
+
+        Returns:
+            The index of the nearest coord, or None if there is no coord within
+            cell_size of the position.
+        """
+        u_cell, v_cell = np.floor(np.asarray(position) / self.cell_size).astype(int)
+        candidates = [
+            index
+            for u_offset in (-1, 0, 1)
+            for v_offset in (-1, 0, 1)
+            for index in self._cells.get((u_cell + u_offset, v_cell + v_offset), ())
+        ]
+        if not candidates:
+            return None
+        candidates = np.array(candidates)
+        distances = np.hypot(*(self.coords[candidates] - position).T)
+        nearest = distances.argmin()
+        if distances[nearest] > self.cell_size:
+            return None
+        return int(candidates[nearest])
+
+
 @dataclass(slots=True, kw_only=True)
 class PlotData:
     """
@@ -24,22 +85,32 @@ class PlotData:
         rotation: Rotation of the plot. In degrees.
         plotted_domains: The plotted domains.
         plotted_stroke: The plotted stroke.
-        plotted_numbers: The plotted numbers.
-        plotted_buttons: The plotted buttons.
+        plotted_numbers: The plotted numbers, as one item.
+        plotted_buttons: The plotted buttons, as one item.
+        button_domains: The pair of domains that each button is between.
+        domain_index: A spatial index of the domain centers.
+        button_index: A spatial index of the buttons.
+        rounded_coords: The results of coords(), by round_to. Cleared on each plot.
     """
 
-    u_coords: List[float] = field(default_factory=list)
-    v_coords: List[float] = field(default_factory=list)
-    rotation: pg.PlotDataItem = 0
+    u_coords: np.ndarray = field(default_factory=lambda: np.empty(0))
+    v_coords: np.ndarray = field(default_factory=lambda: np.empty(0))
+    rotation: float = 0
     plotted_domains: pg.PlotDataItem = None
     plotted_stroke: pg.PlotDataItem = None
-    plotted_numbers: List[pg.PlotDataItem] = field(default_factory=list)
-    plotted_buttons: List[pg.PlotDataItem] = field(default_factory=list)
+    plotted_numbers: pg.PlotDataItem = None
+    plotted_buttons: pg.PlotDataItem = None
+    button_domains: List[Tuple["Domain", "Domain"]] = field(default_factory=list)
+    domain_index: SpatialIndex = None
+    button_index: SpatialIndex = None
+    rounded_coords: Dict[int | None, list] = field(default_factory=dict)
 
     def coords(self, round_to=None):
         """
         Obtain a list of all the currently plotted coords as a zip of x and y coords.
 
+        The coords are cached until the next plot.
+
         Args:
             round_to: The number of decimal places to round the coords to. If None, no
             rounding is performed.
@@ -47,15 +118,14 @@ class PlotData:
         Returns:
             List of plotted coordinates. Each coordinate is a tuple of the form (x, y).
         """
-        if round_to is None:
-            return list(zip(self.u_coords, self.v_coords))
-        else:
-            return list(
-                zip(
-                    [round(coord, round_to) for coord in self.u_coords],
-                    [round(coord, round_to) for coord in self.v_coords],
-                )
-            )
+        if round_to not in self.rounded_coords:
+            u_coords, v_coords = self.u_coords, self.v_coords
+            if round_to is not None:
+                u_coords = np.round(u_coords, round_to)
+                v_coords = np.round(v_coords, round_to)
+            coords = list(zip(u_coords.tolist(), v_coords.tolist()))
+            self.rounded_coords[round_to] = coords
+        return self.rounded_coords[round_to]
 
 
 class TopViewPlotter(Plotter):
@@ -146,9 +216,30 @@ class TopViewPlotter(Plotter):
             point = points[0].pos()
             self.point_clicked.emit(tuple(point))
 
+    def _numbers_clicked(self, event=None, points: List[pg.ScatterPlotItem] = None):
+        """Slot for when the domain numbers are clicked."""
+        if not points or self.plot_data.domain_index is None:
+            return
+        index = self.plot_data.domain_index.nearest(tuple(points[0].pos()))
+        if index is not None:
+            # Emit a domain_clicked signal when the user clicks a number, since the
+            # numbers are the centers of domains and if they click the number it
+            # means they also clicked the domain. Domains are numbered from 1.
+            self.domain_clicked.emit(index + 1)
+        # Emit a point_clicked signal when the user clicks a number too. This emits
+        # the coordinates of the plotted number graphic that was clicked.
+        self._point_clicked(event, points)
+
+    def _buttons_clicked(self, event=None, points: List[pg.ScatterPlotItem] = None):
+        """Slot for when the buttons between domains are clicked."""
+        if not points or self.plot_data.button_index is None:
+            return
+        index = self.plot_data.button_index.nearest(tuple(points[0].pos()))
+        if index is not None:
+            self.button_clicked.emit(list(self.plot_data.button_domains[index]))
+
     def refresh(self):
         """Refresh the plot."""
-        QTimer.singleShot(0, self._reset)
         QTimer.singleShot(0, self._plot)
         logger.info("Refreshed top view.")
 
@@ -156,12 +247,16 @@ class TopViewPlotter(Plotter):
         """Clear all plotted artifacts."""
         if plot_data is None:
             plot_data = self.plot_data
-        self.removeItem(plot_data.plotted_domains)
-        self.removeItem(plot_data.plotted_stroke)
-        for number in plot_data.plotted_numbers:
-            self.removeItem(number)
-        for button in plot_data.plotted_buttons:
-            self.removeItem(button)
+        for item in (
+            plot_data.plotted_domains,
+            plot_data.plotted_stroke,
+            plot_data.plotted_numbers,
+            plot_data.plotted_buttons,
+        ):
+            if item is not None:
+                self.removeItem(item)
+        plot_data.plotted_domains = plot_data.plotted_stroke = None
+        plot_data.plotted_numbers = plot_data.plotted_buttons = None
 
     def _prettify(self):
         self.setTitle(self.title) if self.title else None
@@ -176,42 +271,68 @@ class TopViewPlotter(Plotter):
         # prevent user from interacting with the graph in certain ways
         self.getViewBox().setAspectLocked(lock=True, ratio=1)
 
-    def _plot_buttons(self, u_coords: List[float], v_coords: List[float]) -> None:
+    def _update(self, name: str, enabled: bool, x_coords, y_coords, **kwargs) -> None:
+        """
+        Update a plotted item in place, creating or removing it as needed.
+
+        Args:
+            name: The name of the item's attribute in self.plot_data.
+            enabled: Whether the item should be plotted.
+            x_coords: The new x coords of the item.
+            y_coords: The new y coords of the item.
+            **kwargs: The styles of the item.
+        """
+        item = getattr(self.plot_data, name)
+        if not enabled:
+            if item is not None:
+                self.removeItem(item)
+                setattr(self.plot_data, name, None)
+        elif item is None:
+            setattr(self.plot_data, name, self.plot(x_coords, y_coords, **kwargs))
+        else:
+            item.setData(x_coords, y_coords, **kwargs)
+
+    def _plot_buttons(self, u_coords: np.ndarray, v_coords: np.ndarray) -> None:
         """
         Plot the buttons.
 
-        This plots the buttons and stores them in self.plot_data.
+        The buttons are halfway between each pair of adjacent domains, and are
+        plotted as one item.
 
         Args:
-            u_coords: X coords of the buttons.
-            v_coords: Y coords of the buttons.
+            u_coords: X coords of the domains.
+            v_coords: Y coords of the domains.
         """
-        self.plot_data.plotted_buttons.clear()
         domains = self.domains.domains()
-        domains_closed = self.domains.closed()
-
-        for index, (u_coord, v_coord) in enumerate(zip(u_coords, v_coords)):
-            if (not domains_closed) and (index == len(u_coords) - 1):
-                break
-
-            next_coord_index = (index + 1) % len(u_coords)
-            button_u_coord = (u_coord + u_coords[next_coord_index]) / 2
-            button_v_coord = (v_coord + v_coords[next_coord_index]) / 2
-            current_domains = [domains[index], domains[next_coord_index]]
-            button = self.plot(
-                (button_u_coord,),
-                (button_v_coord,),
-                symbol="s",
-                symbolSize=0.15 * self.circle_radius,
-                symbolBrush=pg.mkBrush(settings.colors["domains"]["buttons"]),
-                pxMode=False,
-            )
-            button.sigClicked.connect(
-                lambda *args, domains=current_domains: self.button_clicked.emit(domains)
+        coords = np.column_stack((u_coords, v_coords))
+        buttons = (coords + np.roll(coords, -1, axis=0)) / 2
+        if not self.domains.closed():
+            buttons = buttons[:-1]
+
+        self.plot_data.button_domains = [
+            (domains[index], domains[(index + 1) % len(domains)])
+            for index in range(len(buttons))
+        ]
+        self.plot_data.button_index = SpatialIndex(buttons, 0.15 * self.circle_radius)
+
+        new = self.plot_data.plotted_buttons is None
+        self._update(
+            "plotted_buttons",
+            True,
+            buttons[:, 0],
+            buttons[:, 1],
+            symbol="s",
+            symbolSize=0.15 * self.circle_radius,
+            symbolBrush=pg.mkBrush(settings.colors["domains"]["buttons"]),
+            pxMode=False,
+            pen=None,
+        )
+        if new:
+            self.plot_data.plotted_buttons.sigPointsClicked.connect(
+                self._buttons_clicked
             )
-            self.plot_data.plotted_buttons.append(button)
 
-    def _plot_domains(self, u_coords: List[float], v_coords: List[float]) -> None:
+    def _plot_domains(self, u_coords: np.ndarray, v_coords: np.ndarray) -> None:
         """
         Plot the domains.
 
@@ -221,7 +342,9 @@ class TopViewPlotter(Plotter):
             u_coords: X coords of the domains.
             v_coords: Y coords of the domains.
         """
-        self.plot_data.plotted_domains = self.plot(
+        self._update(
+            "plotted_domains",
+            True,
             u_coords,
             v_coords,
             symbol="o",
@@ -230,7 +353,7 @@ class TopViewPlotter(Plotter):
             pxMode=False,
         )
 
-    def _plot_stroke(self, u_coords: List[float], v_coords: List[float]) -> None:
+    def _plot_stroke(self, u_coords: np.ndarray, v_coords: np.ndarray) -> None:
         """
         Plot the stroke connecting the domain circles.
 
@@ -240,7 +363,9 @@ class TopViewPlotter(Plotter):
             u_coords: X coords of the plotted_stroke.
             v_coords: Y coords of the plotted_stroke.
         """
-        self.plot_data.plotted_stroke = self.plot(
+        self._update(
+            "plotted_stroke",
+            True,
             u_coords,
             v_coords,
             pen=pg.mkPen(color=settings.colors["domains"]["pen"], width=self.stroke),
@@ -248,82 +373,77 @@ class TopViewPlotter(Plotter):
             pxMode=False,
         )
 
-    def _plot_numbers(self, u_coords: List[float], v_coords: List[float]) -> None:
+    def _plot_numbers(self, u_coords: np.ndarray, v_coords: np.ndarray) -> None:
         """
         Plot the number labels for the plot.
 
-        This plots the labels, sets up signals for when the user clicks them,
-        and updates the plot data.
+        All the labels are plotted as one item, and clicks on them are resolved to
+        domains with a spatial index of the domain centers.
         """
-        self.plot_data.plotted_numbers.clear()
         # We label domain#0 with the domain-count even though it's domain#0 in memory to
         # make it more human-friendly (so it doesn't start at #0)
-        for counter, position in enumerate(tuple(zip(u_coords, v_coords)), start=1):
-            symbol_size = self.circle_radius / 3
-            symbol_size *= 1 + (0.255 * (len(str(counter)) - 1))
-
-            # Plot the number
-            text = self.plot(
-                [position[0]],  # x coord
-                [position[1]],  # y coord
-                symbol=plotters.utils.custom_symbol(f"#{counter}"),  # symbol
-                symbolBrush=pg.mkBrush(  # symbol color
-                    color=settings.colors["domains"]["plotted_numbers"]
-                ),
-                symbolSize=symbol_size,  # symbol size
-                pxMode=False,  # whether to dynamically scale the symbol
-                pen=None,  # pen for interpoint lines. We are plotting just one
-                # point at a time, so this can be set to None.
-            )
-
-            # Emit a domain_clicked signal when the user clicks a number, since the
-            # numbers are the centers of domains and if they click the number it
-            # means they also clicked the domain.
-            text.sigPointsClicked.connect(
-                lambda *args, index=counter: self.domain_clicked.emit(index)
+        counters = range(1, len(u_coords) + 1)
+        symbols = [plotters.utils.custom_symbol(f"#{counter}") for counter in counters]
+        symbol_sizes = [
+            self.circle_radius / 3 * (1 + (0.255 * (len(str(counter)) - 1)))
+            for counter in counters
+        ]
+        color = settings.colors["domains"]["plotted_numbers"]
+
+        new = self.plot_data.plotted_numbers is None
+        self._update(
+            "plotted_numbers",
+            True,
+            u_coords,
+            v_coords,
+            symbol=symbols,
+            symbolBrush=pg.mkBrush(color=color),
+            symbolSize=symbol_sizes,
+            pxMode=False,  # whether to dynamically scale the symbol
+            pen=None,  # no lines between the numbers
+        )
+        if new:
+            self.plot_data.plotted_numbers.sigPointsClicked.connect(
+                self._numbers_clicked
             )
-            # Emit a point_clicked signal when the user clicks a number too. This
-            # emits the coordinates of the plotted number graphic that was clicked.
-            text.sigPointsClicked.connect(self._point_clicked)
-
-            # Add the text to the plot data.
-            self.plot_data.plotted_numbers.append(text)
 
     def _plot(self):
         """
         Plot all the data.
 
-        All the plotted data is stored in self.plot_data.
+        Items that are already plotted are updated in place. All the plotted data is
+        stored in self.plot_data.
         """
         coords = self.domains.top_view()
-        coords[0] = (
-            (coords[0][0] + coords[1][0]) / 2,
-            (coords[0][1] + coords[1][1]) / 2,
-        )
-        coords[-1] = (
-            (coords[-2][0] + coords[-1][0]) / 2,
-            (coords[-2][1] + coords[-1][1]) / 2,
-        )
-        u_coords, v_coords = coords[:, 0], coords[:, 1]
+        coords[0] = (coords[0] + coords[1]) / 2
+        coords[-1] = (coords[-2] + coords[-1]) / 2
 
         # perform rotation if needed
         if self.rotation != 0:
             rotation = radians(self.rotation)
-            for index, (u_coord, v_coord) in enumerate(zip(u_coords, v_coords)):
-                u_coords[index] = u_coord * cos(rotation) - v_coord * sin(rotation)
-                v_coords[index] = v_coord * cos(rotation) + u_coord * sin(rotation)
+            matrix = np.array(
+                ((cos(rotation), -sin(rotation)), (sin(rotation), cos(rotation)))
+            )
+            coords = coords @ matrix.T
+        u_coords, v_coords = coords[:, 0], coords[:, 1]
 
         # Plot the data
         self._plot_domains(u_coords[1:-1], v_coords[1:-1])
         if self.numbers:
             self._plot_numbers(u_coords[1:-1], v_coords[1:-1])
+        else:
+            self._update("plotted_numbers", False, None, None)
         self._plot_stroke(u_coords, v_coords)
         if self.plot_buttons:
             self._plot_buttons(u_coords[1:-1], v_coords[1:-1])
+        else:
+            self._update("plotted_buttons", False, None, None)
 
         # Store current plot data
         self.plot_data.u_coords = u_coords
         self.plot_data.v_coords = v_coords
         self.plot_data.rotation = self.rotation
+        self.plot_data.domain_index = SpatialIndex(coords[1:-1], self.circle_radius / 2)
+        self.plot_data.rounded_coords.clear()
 
         self._prettify()
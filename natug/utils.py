@@ -18,12 +18,23 @@ def remove_duplicates(iterable):
         iterable: The iterable to remove duplicates from.
 
     Returns:
-        list: The iterable with duplicates removed.
+        list: The iterable with duplicates removed, in their original order.
+
+    Notes:
+        Hashable items are deduplicated by equality. Unhashable items (such as points)
+        are deduplicated by identity.
     """
-    output = []
+    output, seen, seen_ids = [], set(), set()
     for item in iterable:
-        if item not in output:
-            output.append(item)
+        try:
+            if item in seen:
+                continue
+            seen.add(item)
+        except TypeError:
+            if id(item) in seen_ids:
+                continue
+            seen_ids.add(id(item))
+        output.append(item)
     return output
 
 